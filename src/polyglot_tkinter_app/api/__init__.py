@@ -1,4 +1,25 @@
-from polyglot_tkinter_app.api.client import TranslationClient
+from importlib import import_module
+from typing import Any
+
 from polyglot_tkinter_app.api.models import HealthStatus, TranslationRequest, TranslationResponse
 
-__all__ = ["HealthStatus", "TranslationClient", "TranslationRequest", "TranslationResponse"]
+__all__ = [
+    "AsyncTranslationClient",
+    "ClientEventLoop",
+    "HealthStatus",
+    "TranslationClient",
+    "TranslationRequest",
+    "TranslationResponse",
+]
+
+_LAZY_EXPORTS = {
+    "AsyncTranslationClient": "polyglot_tkinter_app.api.async_client",
+    "ClientEventLoop": "polyglot_tkinter_app.api.event_loop",
+    "TranslationClient": "polyglot_tkinter_app.api.client",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(_LAZY_EXPORTS[name]), name)
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+from polyglot_tkinter_app.api.cache import TranslationCache
+from polyglot_tkinter_app.api.client import (
+    CONNECTION_PINGS,
+    DOWNLOAD_BYTES,
+    HTTP_RESPONSES,
+    PING_TIMEOUT_SECONDS,
+    REQUEST_SECONDS,
+    REQUESTS_IN_FLIGHT,
+    UPLOAD_BYTES,
+    TranslationClient,
+    TranslationClientError,
+    health_from_payload,
+    observe_translation,
+    translation_form_fields,
+    translation_response_from,
+)
+from polyglot_tkinter_app.api.models import HealthStatus, TranslationRequest, TranslationResponse
+from polyglot_tkinter_app.api.multipart import iter_multipart, multipart_content_type, new_boundary
+from polyglot_tkinter_app.api.transport import AsyncConnectionPool
+from polyglot_tkinter_app.audio.wav_io import upload_format
+from polyglot_tkinter_app.settings.models import RuntimeState
+from polyglot_tkinter_app.tracing import get_tracer
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncTranslationClient:
+    def __init__(
+        self,
+        runtime: RuntimeState,
+        pool: AsyncConnectionPool | None = None,
+        cache: TranslationCache | None = None,
+    ):
+        self.runtime = runtime
+        self.pool = pool or AsyncConnectionPool(
+            max_connections=runtime.settings.api.max_connections,
+            keepalive_seconds=runtime.settings.api.keepalive_seconds,
+        )
+        self.cache = cache
+
+    @classmethod
+    def from_client(cls, client: TranslationClient) -> "AsyncTranslationClient":
+        return cls(client.runtime, cache=client.cache)
+
+    async def health(self) -> HealthStatus:
+        url = self._url(self.runtime.settings.api.health_endpoint)
+        try:
+            response = await self.pool.request(
+                "GET",
+                url,
+                verify=self.runtime.verify_ssl,
+                timeout=self.runtime.timeout_seconds,
+            )
+            if response.status_code != 200:
+                return HealthStatus(online=False, message=f"HTTP {response.status_code}")
+            return health_from_payload(response.json())
+        except Exception as exc:
+            logger.warning("server_health_checked online=false error=%s", exc)
+            return HealthStatus(online=False, message=str(exc))
+
+    async def prewarm(self, connections: int) -> int:
+        if connections <= 0:
+            return 0
+        results = await asyncio.gather(*(self._ping() for _ in range(connections)))
+        return sum(results)
+
+    async def translate(self, request: TranslationRequest) -> TranslationResponse:
+        tracer = get_tracer()
+        cache_key = self.cache.key_for(request) if self.cache is not None else None
+        if cache_key is not None:
+            with tracer.span(request.trace_id, "client.cache_lookup"):
+                cached = self.cache.get(request, key=cache_key)
+            if cached is not None:
+                observe_translation(cached)
+                return cached
+        url = self._url(self.runtime.settings.api.process_endpoint)
+        boundary = new_boundary()
+        filename, content_type = upload_format(request.audio_codec)
+        body = b"".join(
+            iter_multipart(
+                translation_form_fields(request),
+                boundary=boundary,
+                file_field="file",
+                filename=filename,
+                content_type=content_type,
+                file_chunks=[request.audio_bytes],
+            )
+        )
+        started = time.perf_counter()
+        UPLOAD_BYTES.inc(len(body))
+        REQUESTS_IN_FLIGHT.inc()
+        try:
+            response = await self.pool.request(
+                "POST",
+                url,
+                headers={"Content-Type": multipart_content_type(boundary)},
+                body=body,
+                verify=self.runtime.verify_ssl,
+                timeout=self.runtime.timeout_seconds,
+            )
+        except Exception:
+            HTTP_RESPONSES.inc(status="error")
+            raise
+        finally:
+            REQUESTS_IN_FLIGHT.dec()
+        total_time = time.perf_counter() - started
+        HTTP_RESPONSES.inc(status=response.status_code)
+        REQUEST_SECONDS.observe(total_time)
+        tracer.record(request.trace_id, "client.http", started, status=response.status_code)
+        DOWNLOAD_BYTES.inc(len(response.content))
+
+        if response.status_code != 200:
+            raise TranslationClientError(f"translation failed: HTTP {response.status_code}: {response.text}")
+        translation = translation_response_from(request, response.headers, response.content, total_time=total_time)
+        if cache_key is not None:
+            self.cache.put(request, translation, key=cache_key)
+        observe_translation(translation)
+        return translation
+
+    async def aclose(self) -> None:
+        await self.pool.aclose()
+
+    async def _ping(self) -> bool:
+        ok = False
+        try:
+            response = await self.pool.request(
+                "GET",
+                self._url(self.runtime.settings.api.health_endpoint),
+                verify=self.runtime.verify_ssl,
+                timeout=min(self.runtime.timeout_seconds, PING_TIMEOUT_SECONDS),
+            )
+            ok = response.status_code == 200
+        except Exception as exc:
+            logger.debug("connection_ping_failed error=%s", exc)
+        CONNECTION_PINGS.inc(outcome="ok" if ok else "error")
+        return ok
+
+    def _url(self, endpoint: str) -> str:
+        return self.runtime.base_url + endpoint.lstrip("/")
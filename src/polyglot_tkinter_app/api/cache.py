@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Callable
+
+from polyglot_tkinter_app.api.disk_cache import DiskTranslationStore
+from polyglot_tkinter_app.api.models import TranslationRequest, TranslationResponse
+from polyglot_tkinter_app.paths import CACHE_DIR
+from polyglot_tkinter_app.settings.models import AppSettings
+
+logger = logging.getLogger(__name__)
+
+CLIENT_CACHE_LAYER = "client"
+
+
+@dataclass(frozen=True)
+class _CacheEntry:
+    response: TranslationResponse
+    size: int
+    expires_at: float
+
+
+class TranslationCache:
+    def __init__(
+        self,
+        *,
+        max_bytes: int = 32 * 1024 * 1024,
+        privacy_ttl_seconds: dict[str, float] | None = None,
+        store: DiskTranslationStore | None = None,
+        store_ttl_seconds: float = 7 * 24 * 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_bytes = max_bytes
+        self.privacy_ttl_seconds = dict(privacy_ttl_seconds if privacy_ttl_seconds is not None else {"transient": 600.0})
+        self.store = store
+        self.store_ttl_seconds = store_ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: AppSettings) -> "TranslationCache":
+        store = None
+        if settings.client_cache.disk_enabled:
+            store = DiskTranslationStore(CACHE_DIR, max_bytes=settings.client_cache.disk_max_bytes)
+        return cls(
+            max_bytes=settings.client_cache.max_bytes,
+            privacy_ttl_seconds=settings.client_cache.privacy_ttl_seconds,
+            store=store,
+            store_ttl_seconds=settings.client_cache.disk_ttl_seconds,
+        )
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key_for(self, request: TranslationRequest) -> str | None:
+        if not request.use_semantic_cache or not request.audio_bytes:
+            return None
+        if self.privacy_ttl_seconds.get(request.privacy_level, 0) <= 0:
+            return None
+        digest = hashlib.sha256(request.audio_bytes)
+        for part in (request.target_language, request.speaker_id, request.cache_strategy, request.domain):
+            digest.update(b"\0" + str(part).encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, request: TranslationRequest, *, key: str | None = None) -> TranslationResponse | None:
+        key = key or self.key_for(request)
+        if key is None:
+            return None
+        started = time.perf_counter()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= self._clock():
+                self._remove(key)
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if entry is None:
+            stored = self.store.get(key) if self.store is not None else None
+            if stored is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            entry = self._insert(key, stored, self.privacy_ttl_seconds[request.privacy_level])
+        elapsed = time.perf_counter() - started
+        return replace(
+            entry.response,
+            cache_status="hit",
+            cache_layer=CLIENT_CACHE_LAYER,
+            lookup_time=elapsed,
+            transcript_time=0.0,
+            inference_time=0.0,
+            total_time=elapsed,
+            decision="client exact audio match",
+            raw_headers={
+                **entry.response.raw_headers,
+                "X-Polyglot-Cache": "hit",
+                "X-Polyglot-Cache-Layer": CLIENT_CACHE_LAYER,
+            },
+        )
+
+    def put(self, request: TranslationRequest, response: TranslationResponse, *, key: str | None = None) -> None:
+        key = key or self.key_for(request)
+        if key is None or not response.audio_bytes:
+            return
+        size = len(response.audio_bytes)
+        if size > self.max_bytes:
+            logger.debug("client_cache_skipped reason=too_large bytes=%s", size)
+            return
+        ttl = self.privacy_ttl_seconds[request.privacy_level]
+        self._insert(key, response, ttl)
+        if self.store is not None:
+            self.store.put(key, replace(response, audio_stream=None), min(ttl, self.store_ttl_seconds))
+
+    def _insert(self, key: str, response: TranslationResponse, ttl: float) -> _CacheEntry:
+        entry = _CacheEntry(
+            response=replace(response, audio_stream=None),
+            size=len(response.audio_bytes),
+            expires_at=self._clock() + ttl,
+        )
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._size += entry.size
+            while self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._size -= entry.size
@@ -1,28 +1,56 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
-from io import BytesIO
-from typing import Any
+from dataclasses import replace
+from typing import Any, Iterable, Mapping
 from urllib.parse import unquote
 
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
 
+from polyglot_tkinter_app.api.cache import TranslationCache
 from polyglot_tkinter_app.api.models import HealthStatus, TranslationRequest, TranslationResponse
+from polyglot_tkinter_app.api.multipart import MultipartBody, iter_multipart, multipart_content_type, new_boundary
+from polyglot_tkinter_app.api.streaming import StreamedAudio
+from polyglot_tkinter_app.audio.wav_io import upload_format
+from polyglot_tkinter_app.metrics import get_registry
 from polyglot_tkinter_app.settings.models import RuntimeState
+from polyglot_tkinter_app.tracing import get_tracer
 
 logger = logging.getLogger(__name__)
 
+STREAM_CHUNK_SIZE = 4096
+PING_TIMEOUT_SECONDS = 5.0
+
+REQUESTS_IN_FLIGHT = get_registry().gauge("polyglot_requests_in_flight", "Translation requests awaiting a response")
+HTTP_RESPONSES = get_registry().counter("polyglot_http_responses_total", "Translation HTTP responses by status")
+TRANSLATIONS = get_registry().counter("polyglot_translations_total", "Translations by cache status and layer")
+UPLOAD_BYTES = get_registry().counter("polyglot_upload_bytes_total", "Request body bytes sent to the backend")
+DOWNLOAD_BYTES = get_registry().counter("polyglot_download_bytes_total", "Audio bytes received from the backend")
+REQUEST_SECONDS = get_registry().histogram("polyglot_request_seconds", "Client-measured translation request latency")
+CONNECTION_PINGS = get_registry().counter("polyglot_connection_pings_total", "Pre-warm and heartbeat pings by outcome")
+SERVER_STAGE_SECONDS = get_registry().histogram(
+    "polyglot_server_stage_seconds", "Backend stage timings reported in X-Polyglot headers"
+)
+
 
 class TranslationClientError(RuntimeError):
     pass
 
 
 class TranslationClient:
-    def __init__(self, runtime: RuntimeState, session: Any | None = None):
+    def __init__(
+        self,
+        runtime: RuntimeState,
+        session: Any | None = None,
+        cache: TranslationCache | None = None,
+    ):
         self.runtime = runtime
-        self.session = session or requests.Session()
+        self.session = session or _new_session(runtime.settings.api.max_connections)
+        self.cache = cache
 
     def health(self) -> HealthStatus:
         url = self._url(self.runtime.settings.api.health_endpoint)
@@ -35,69 +63,162 @@ class TranslationClient:
             )
             if response.status_code != 200:
                 return HealthStatus(online=False, message=f"HTTP {response.status_code}")
-
-            payload = response.json()
-            details = payload.get("details", {}) or {}
-            semantic = payload.get("semantic_memory", {}) or details.get("semantic_memory", {}) or {}
-            return HealthStatus(
-                online=bool(payload.get("status", True)),
-                model_loaded=bool(payload.get("model_loaded", details.get("model_loaded", False))),
-                processor_loaded=bool(payload.get("processor_loaded", details.get("processor_loaded", False))),
-                semantic_memory_enabled=bool(semantic.get("enabled", False)),
-                semantic_memory_mode=str(semantic.get("mode", "unknown")),
-                device=str(payload.get("device", details.get("device", "unknown"))),
-                message=str(payload.get("message", "")),
-            )
+            return health_from_payload(response.json())
         except Exception as exc:
             logger.warning("server_health_checked online=false error=%s", exc)
             return HealthStatus(online=False, message=str(exc))
 
-    def translate(self, request: TranslationRequest) -> TranslationResponse:
-        url = self._url(self.runtime.settings.api.process_endpoint)
-        files = {"file": ("audio.wav", BytesIO(request.audio_bytes), "audio/wav")}
-        data = {
-            "language": request.target_language,
-            "speaker_id": str(request.speaker_id),
-            "session_id": request.session_id,
-            "source_language": request.source_language,
-            "domain": request.domain,
-            "privacy_level": request.privacy_level,
-            "use_semantic_cache": str(request.use_semantic_cache).lower(),
-            "cache_strategy": request.cache_strategy,
-            "use_transcript_memory": str(request.use_transcript_memory).lower(),
-        }
+    def prewarm(self, connections: int) -> int:
+        if connections <= 0:
+            return 0
+        self._disable_warnings_if_needed()
+        barrier = threading.Barrier(connections, timeout=PING_TIMEOUT_SECONDS)
+        results: list[bool] = []
+        pings = [threading.Thread(target=self._ping, args=(barrier, results), daemon=True) for _ in range(connections)]
+        for ping in pings:
+            ping.start()
+        for ping in pings:
+            ping.join()
+        return sum(results)
 
+    def _ping(self, barrier: threading.Barrier, results: list[bool]) -> None:
+        ok = False
+        try:
+            response = self.session.get(
+                self._url(self.runtime.settings.api.health_endpoint),
+                stream=True,
+                verify=self.runtime.verify_ssl,
+                timeout=min(self.runtime.timeout_seconds, PING_TIMEOUT_SECONDS),
+            )
+            try:
+                barrier.wait()
+            except threading.BrokenBarrierError:
+                pass
+            # Reading the body hands the connection back to the pool instead of closing it.
+            response.content
+            ok = response.status_code == 200
+        except Exception as exc:
+            barrier.abort()
+            logger.debug("connection_ping_failed error=%s", exc)
+        CONNECTION_PINGS.inc(outcome="ok" if ok else "error")
+        results.append(ok)
+
+    def translate(self, request: TranslationRequest, *, stream_audio: bool = False) -> TranslationResponse:
+        cache_key = self.cache.key_for(request) if self.cache is not None else None
+        if cache_key is not None:
+            with get_tracer().span(request.trace_id, "client.cache_lookup"):
+                cached = self.cache.get(request, key=cache_key)
+            if cached is not None:
+                observe_translation(cached)
+                return cached
+        filename, content_type = upload_format(request.audio_codec)
+        body = MultipartBody(
+            translation_form_fields(request),
+            boundary=new_boundary(),
+            file_field="file",
+            filename=filename,
+            content_type=content_type,
+            file_parts=[request.audio_bytes],
+        )
+        UPLOAD_BYTES.inc(len(body))
+        response = self._post_translation(
+            request,
+            stream_audio=stream_audio,
+            data=body,
+            headers={"Content-Type": body.content_type},
+        )
+        self._remember(cache_key, request, response)
+        observe_translation(response)
+        return response
+
+    def translate_stream(
+        self,
+        request: TranslationRequest,
+        wav_chunks: Iterable[bytes],
+        *,
+        stream_audio: bool = False,
+    ) -> TranslationResponse:
+        boundary = new_boundary()
+        body = iter_multipart(
+            translation_form_fields(request),
+            boundary=boundary,
+            file_field="file",
+            filename="audio.wav",
+            content_type="audio/wav",
+            file_chunks=wav_chunks,
+        )
+        response = self._post_translation(
+            request,
+            stream_audio=stream_audio,
+            data=_count_upload(body),
+            headers={"Content-Type": multipart_content_type(boundary)},
+        )
+        observe_translation(response)
+        return response
+
+    def _post_translation(
+        self,
+        request: TranslationRequest,
+        *,
+        stream_audio: bool = False,
+        **kwargs: Any,
+    ) -> TranslationResponse:
+        url = self._url(self.runtime.settings.api.process_endpoint)
         self._disable_warnings_if_needed()
+        if stream_audio:
+            kwargs["stream"] = True
         started = time.perf_counter()
-        response = self.session.post(
-            url,
-            files=files,
-            data=data,
-            verify=self.runtime.verify_ssl,
-            timeout=self.runtime.timeout_seconds,
-        )
+        REQUESTS_IN_FLIGHT.inc()
+        try:
+            response = self.session.post(
+                url,
+                verify=self.runtime.verify_ssl,
+                timeout=self.runtime.timeout_seconds,
+                **kwargs,
+            )
+        except Exception:
+            HTTP_RESPONSES.inc(status="error")
+            raise
+        finally:
+            REQUESTS_IN_FLIGHT.dec()
         total_time = time.perf_counter() - started
+        HTTP_RESPONSES.inc(status=response.status_code)
+        REQUEST_SECONDS.observe(total_time)
+        tracer = get_tracer()
+        tracer.record(request.trace_id, "client.http", started, status=response.status_code)
 
         if response.status_code != 200:
             raise TranslationClientError(f"translation failed: HTTP {response.status_code}: {response.text}")
 
-        headers = {key: value for key, value in response.headers.items() if key.lower().startswith("x-polyglot-")}
-        return TranslationResponse(
-            audio_bytes=response.content,
-            cache_status=_header(headers, "X-Polyglot-Cache", "unknown"),
-            cache_strategy=_header(headers, "X-Polyglot-Cache-Strategy", request.cache_strategy),
-            similarity=_float_or_none(_header(headers, "X-Polyglot-Similarity")),
-            text_similarity=_float_or_none(_header(headers, "X-Polyglot-Text-Similarity")),
-            lookup_time=_float_or_none(_header(headers, "X-Polyglot-Lookup-Time")),
-            transcript_time=_float_or_none(_header(headers, "X-Polyglot-Transcript-Time")),
-            inference_time=_float_or_none(_header(headers, "X-Polyglot-Inference-Time")),
+        audio_stream = None
+        if stream_audio:
+            audio_stream = StreamedAudio(
+                response.iter_content(chunk_size=STREAM_CHUNK_SIZE),
+                on_close=response.close,
+            )
+            headers_at = time.perf_counter()
+            audio_stream.add_done_callback(
+                lambda audio_bytes: tracer.record(request.trace_id, "client.download", headers_at, bytes=len(audio_bytes))
+            )
+            audio_stream.add_done_callback(lambda audio_bytes: DOWNLOAD_BYTES.inc(len(audio_bytes)))
+        else:
+            DOWNLOAD_BYTES.inc(len(response.content))
+        return translation_response_from(
+            request,
+            response.headers,
+            b"" if stream_audio else response.content,
             total_time=total_time,
-            cache_layer=_header(headers, "X-Polyglot-Cache-Layer", "unknown"),
-            source_transcript=unquote(_header(headers, "X-Polyglot-Source-Transcript", "") or ""),
-            normalized_source_text=unquote(_header(headers, "X-Polyglot-Normalized-Text", "") or ""),
-            decision=_header(headers, "X-Polyglot-Decision", ""),
-            translation_id=_header(headers, "X-Polyglot-Translation-Id", ""),
-            raw_headers=headers,
+            audio_stream=audio_stream,
+        )
+
+    def _remember(self, key: str | None, request: TranslationRequest, response: TranslationResponse) -> None:
+        if key is None:
+            return
+        if response.audio_stream is None:
+            self.cache.put(request, response, key=key)
+            return
+        response.audio_stream.add_done_callback(
+            lambda audio_bytes: self.cache.put(request, replace(response, audio_bytes=audio_bytes), key=key)
         )
 
     def _url(self, endpoint: str) -> str:
@@ -108,6 +229,88 @@ class TranslationClient:
             urllib3.disable_warnings(category=urllib3.exceptions.InsecureRequestWarning)
 
 
+def translation_form_fields(request: TranslationRequest) -> dict[str, str]:
+    return {
+        "language": request.target_language,
+        "speaker_id": str(request.speaker_id),
+        "session_id": request.session_id,
+        "source_language": request.source_language,
+        "domain": request.domain,
+        "privacy_level": request.privacy_level,
+        "use_semantic_cache": str(request.use_semantic_cache).lower(),
+        "cache_strategy": request.cache_strategy,
+        "use_transcript_memory": str(request.use_transcript_memory).lower(),
+    }
+
+
+def health_from_payload(payload: dict[str, Any]) -> HealthStatus:
+    details = payload.get("details", {}) or {}
+    semantic = payload.get("semantic_memory", {}) or details.get("semantic_memory", {}) or {}
+    return HealthStatus(
+        online=bool(payload.get("status", True)),
+        model_loaded=bool(payload.get("model_loaded", details.get("model_loaded", False))),
+        processor_loaded=bool(payload.get("processor_loaded", details.get("processor_loaded", False))),
+        semantic_memory_enabled=bool(semantic.get("enabled", False)),
+        semantic_memory_mode=str(semantic.get("mode", "unknown")),
+        device=str(payload.get("device", details.get("device", "unknown"))),
+        message=str(payload.get("message", "")),
+    )
+
+
+def translation_response_from(
+    request: TranslationRequest,
+    response_headers: Mapping[str, str],
+    audio_bytes: bytes,
+    *,
+    total_time: float,
+    audio_stream: Any | None = None,
+) -> TranslationResponse:
+    headers = {key: value for key, value in response_headers.items() if key.lower().startswith("x-polyglot-")}
+    return TranslationResponse(
+        audio_bytes=audio_bytes,
+        cache_status=_header(headers, "X-Polyglot-Cache", "unknown"),
+        cache_strategy=_header(headers, "X-Polyglot-Cache-Strategy", request.cache_strategy),
+        similarity=_float_or_none(_header(headers, "X-Polyglot-Similarity")),
+        text_similarity=_float_or_none(_header(headers, "X-Polyglot-Text-Similarity")),
+        lookup_time=_float_or_none(_header(headers, "X-Polyglot-Lookup-Time")),
+        transcript_time=_float_or_none(_header(headers, "X-Polyglot-Transcript-Time")),
+        inference_time=_float_or_none(_header(headers, "X-Polyglot-Inference-Time")),
+        total_time=total_time,
+        cache_layer=_header(headers, "X-Polyglot-Cache-Layer", "unknown"),
+        source_transcript=unquote(_header(headers, "X-Polyglot-Source-Transcript", "") or ""),
+        normalized_source_text=unquote(_header(headers, "X-Polyglot-Normalized-Text", "") or ""),
+        decision=_header(headers, "X-Polyglot-Decision", ""),
+        translation_id=_header(headers, "X-Polyglot-Translation-Id", ""),
+        raw_headers=headers,
+        audio_stream=audio_stream,
+    )
+
+
+def observe_translation(response: TranslationResponse) -> None:
+    TRANSLATIONS.inc(cache_status=response.cache_status, cache_layer=response.cache_layer)
+    for stage, value in (
+        ("lookup", response.lookup_time),
+        ("transcript", response.transcript_time),
+        ("inference", response.inference_time),
+    ):
+        if value is not None:
+            SERVER_STAGE_SECONDS.observe(value, stage=stage)
+
+
+def _count_upload(chunks: Iterable[bytes]) -> Iterable[bytes]:
+    for chunk in chunks:
+        UPLOAD_BYTES.inc(len(chunk))
+        yield chunk
+
+
+def _new_session(max_connections: int) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, max_connections))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 def _float_or_none(value: str | None) -> float | None:
     if value in (None, "", "None"):
         return None
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any, Callable
+
+from polyglot_tkinter_app.api.models import TranslationResponse
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_FILENAME = "translations.seg"
+RECORD_MAGIC = b"PGC1"
+FLAG_TOMBSTONE = 1
+_RECORD_HEADER = struct.Struct("<4sB32sdII")
+_METADATA_FIELDS = tuple(item.name for item in fields(TranslationResponse) if item.name not in {"audio_bytes", "audio_stream"})
+
+
+@dataclass(frozen=True)
+class _IndexEntry:
+    offset: int
+    length: int
+    metadata: dict[str, Any]
+    expires_at: float
+    record_size: int
+
+
+class DiskTranslationStore:
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        max_bytes: int = 256 * 1024 * 1024,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.directory = Path(directory)
+        self.path = self.directory / SEGMENT_FILENAME
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._index: OrderedDict[str, _IndexEntry] = OrderedDict()
+        self._live_bytes = 0
+        self._file_size = 0
+        self._map: mmap.mmap | None = None
+        self._lock = threading.Lock()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.path.touch(exist_ok=True)
+        with self._lock:
+            self._rebuild_index()
+
+    @property
+    def live_bytes(self) -> int:
+        return self._live_bytes
+
+    @property
+    def file_size(self) -> int:
+        return self._file_size
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def get(self, key: str) -> TranslationResponse | None:
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= self._clock():
+                self._delete(key)
+                return None
+            self._index.move_to_end(key)
+            audio_bytes = self._read(entry.offset, entry.length)
+        return TranslationResponse(audio_bytes=audio_bytes, **entry.metadata)
+
+    def put(self, key: str, response: TranslationResponse, ttl_seconds: float) -> None:
+        if ttl_seconds <= 0 or not response.audio_bytes or len(response.audio_bytes) > self.max_bytes:
+            return
+        metadata = {name: getattr(response, name) for name in _METADATA_FIELDS}
+        with self._lock:
+            if key in self._index:
+                self._delete(key)
+            entry = self._append(key, response.audio_bytes, metadata, self._clock() + ttl_seconds)
+            self._index[key] = entry
+            self._live_bytes += entry.length
+            while self._live_bytes > self.max_bytes and self._index:
+                self._delete(next(iter(self._index)))
+            live_records = sum(item.record_size for item in self._index.values())
+            if self._file_size > max(self.max_bytes, 2 * live_records):
+                self._compact()
+
+    def compact(self) -> None:
+        with self._lock:
+            self._compact()
+
+    def close(self) -> None:
+        with self._lock:
+            self._unmap()
+
+    def _rebuild_index(self) -> None:
+        self._index.clear()
+        self._live_bytes = 0
+        now = self._clock()
+        offset = 0
+        size = self.path.stat().st_size
+        with self.path.open("rb") as handle:
+            while offset + _RECORD_HEADER.size <= size:
+                handle.seek(offset)
+                magic, flags, digest, expires_at, metadata_len, audio_len = _RECORD_HEADER.unpack(
+                    handle.read(_RECORD_HEADER.size)
+                )
+                record_size = _RECORD_HEADER.size + metadata_len + audio_len
+                if magic != RECORD_MAGIC or offset + record_size > size:
+                    break
+                key = digest.hex()
+                if key in self._index:
+                    self._live_bytes -= self._index.pop(key).length
+                if not flags & FLAG_TOMBSTONE and expires_at > now:
+                    try:
+                        metadata = json.loads(handle.read(metadata_len).decode("utf-8"))
+                    except ValueError:
+                        break
+                    self._index[key] = _IndexEntry(
+                        offset=offset + _RECORD_HEADER.size + metadata_len,
+                        length=audio_len,
+                        metadata=metadata,
+                        expires_at=expires_at,
+                        record_size=record_size,
+                    )
+                    self._live_bytes += audio_len
+                offset += record_size
+        if offset < size:
+            logger.warning("disk_cache_truncated path=%s valid_bytes=%s file_bytes=%s", self.path, offset, size)
+            with self.path.open("r+b") as handle:
+                handle.truncate(offset)
+        self._file_size = offset
+        logger.info("disk_cache_loaded entries=%s bytes=%s", len(self._index), self._live_bytes)
+
+    def _append(self, key: str, audio_bytes: bytes, metadata: dict[str, Any], expires_at: float) -> _IndexEntry:
+        encoded = json.dumps(metadata, separators=(",", ":")).encode("utf-8")
+        header = _RECORD_HEADER.pack(RECORD_MAGIC, 0, bytes.fromhex(key), expires_at, len(encoded), len(audio_bytes))
+        offset = self._file_size
+        with self.path.open("ab") as handle:
+            handle.write(header)
+            handle.write(encoded)
+            handle.write(audio_bytes)
+        record_size = len(header) + len(encoded) + len(audio_bytes)
+        self._file_size += record_size
+        return _IndexEntry(
+            offset=offset + len(header) + len(encoded),
+            length=len(audio_bytes),
+            metadata=metadata,
+            expires_at=expires_at,
+            record_size=record_size,
+        )
+
+    def _delete(self, key: str) -> None:
+        entry = self._index.pop(key)
+        self._live_bytes -= entry.length
+        header = _RECORD_HEADER.pack(RECORD_MAGIC, FLAG_TOMBSTONE, bytes.fromhex(key), 0.0, 0, 0)
+        with self.path.open("ab") as handle:
+            handle.write(header)
+        self._file_size += len(header)
+
+    def _read(self, offset: int, length: int) -> bytes:
+        if self._map is None or offset + length > len(self._map):
+            self._unmap()
+            with self.path.open("rb") as handle:
+                self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map[offset : offset + length]
+
+    def _compact(self) -> None:
+        started = time.perf_counter()
+        now = self._clock()
+        temporary = self.path.with_suffix(".compact")
+        live = [(key, entry) for key, entry in self._index.items() if entry.expires_at > now]
+        self._unmap()
+        compacted: OrderedDict[str, _IndexEntry] = OrderedDict()
+        offset = 0
+        with self.path.open("rb") as source, temporary.open("wb") as target:
+            for key, entry in live:
+                source.seek(entry.offset)
+                audio_bytes = source.read(entry.length)
+                encoded = json.dumps(entry.metadata, separators=(",", ":")).encode("utf-8")
+                header = _RECORD_HEADER.pack(
+                    RECORD_MAGIC, 0, bytes.fromhex(key), entry.expires_at, len(encoded), len(audio_bytes)
+                )
+                target.write(header)
+                target.write(encoded)
+                target.write(audio_bytes)
+                compacted[key] = _IndexEntry(
+                    offset=offset + len(header) + len(encoded),
+                    length=entry.length,
+                    metadata=entry.metadata,
+                    expires_at=entry.expires_at,
+                    record_size=len(header) + len(encoded) + len(audio_bytes),
+                )
+                offset += compacted[key].record_size
+        os.replace(temporary, self.path)
+        previous_size = self._file_size
+        self._index = compacted
+        self._live_bytes = sum(entry.length for entry in compacted.values())
+        self._file_size = offset
+        logger.info(
+            "disk_cache_compacted entries=%s bytes_before=%s bytes_after=%s elapsed=%.4fs",
+            len(compacted),
+            previous_size,
+            offset,
+            time.perf_counter() - started,
+        )
+
+    def _unmap(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import inspect
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from polyglot_tkinter_app.api.event_loop import get_client_loop
+from polyglot_tkinter_app.settings.models import AppSettings
+
+if TYPE_CHECKING:
+    from polyglot_tkinter_app.api.async_client import AsyncTranslationClient
+    from polyglot_tkinter_app.api.client import TranslationClient
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionWarmer:
+    def __init__(
+        self,
+        client: TranslationClient | AsyncTranslationClient,
+        *,
+        connections: int = 2,
+        heartbeat_seconds: float = 20.0,
+        fresh_seconds: float = 15.0,
+    ):
+        self.client = client
+        self.connections = max(0, connections)
+        self.heartbeat_seconds = heartbeat_seconds
+        self.fresh_seconds = fresh_seconds
+        self.last_warmed = 0.0
+        self._lock = threading.Lock()
+        self._active_sessions = 0
+        self._warming = False
+        self._heartbeat: threading.Thread | None = None
+        self._heartbeat_stop = threading.Event()
+
+    @classmethod
+    def from_settings(
+        cls,
+        client: TranslationClient,
+        settings: AppSettings,
+        *,
+        async_client: AsyncTranslationClient | None = None,
+    ) -> "ConnectionWarmer":
+        api = settings.api
+        streams = api.streaming_upload or api.streaming_download
+        return cls(
+            client if async_client is None or streams else async_client,
+            connections=min(api.prewarm_connections, api.max_connections),
+            heartbeat_seconds=api.heartbeat_seconds,
+            fresh_seconds=api.keepalive_seconds / 2,
+        )
+
+    def warm(self) -> int:
+        if not self.connections:
+            return 0
+        started = time.perf_counter()
+        opened = self.client.prewarm(self.connections)
+        if inspect.isawaitable(opened):
+            opened = get_client_loop().submit(opened).result()
+        self.last_warmed = time.monotonic()
+        logger.info(
+            "connections_warmed requested=%s ok=%s seconds=%.3f",
+            self.connections,
+            opened,
+            time.perf_counter() - started,
+        )
+        return opened
+
+    def warm_async(self, *, force: bool = False) -> bool:
+        with self._lock:
+            if not self.connections or self._warming:
+                return False
+            if not force and time.monotonic() - self.last_warmed < self.fresh_seconds:
+                return False
+            self._warming = True
+        threading.Thread(target=self._warm_in_background, name="connection-warmer", daemon=True).start()
+        return True
+
+    def session_started(self) -> None:
+        with self._lock:
+            self._active_sessions += 1
+            if self._active_sessions > 1:
+                return
+            self._start_heartbeat()
+        self.warm_async(force=True)
+
+    def session_stopped(self) -> None:
+        with self._lock:
+            self._active_sessions = max(0, self._active_sessions - 1)
+            if not self._active_sessions:
+                self._stop_heartbeat()
+
+    def close(self) -> None:
+        with self._lock:
+            self._active_sessions = 0
+            self._stop_heartbeat()
+
+    def _warm_in_background(self) -> None:
+        try:
+            self.warm()
+        except Exception as exc:
+            logger.warning("connection_warm_failed error=%s", exc)
+        finally:
+            with self._lock:
+                self._warming = False
+
+    def _start_heartbeat(self) -> None:
+        if not self.connections or self.heartbeat_seconds <= 0 or self._heartbeat is not None:
+            return
+        self._heartbeat_stop = threading.Event()
+        self._heartbeat = threading.Thread(
+            target=self._run_heartbeat,
+            args=(self._heartbeat_stop,),
+            name="connection-heartbeat",
+            daemon=True,
+        )
+        self._heartbeat.start()
+
+    def _stop_heartbeat(self) -> None:
+        self._heartbeat_stop.set()
+        self._heartbeat = None
+
+    def _run_heartbeat(self, stop_event: threading.Event) -> None:
+        while not stop_event.wait(self.heartbeat_seconds):
+            self.warm_async(force=True)
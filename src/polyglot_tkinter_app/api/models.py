@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import Any
 
 
 @dataclass(frozen=True)
@@ -16,7 +17,7 @@ class HealthStatus:
 
 @dataclass(frozen=True)
 class TranslationRequest:
-    audio_bytes: bytes
+    audio_bytes: bytes | memoryview
     target_language: str
     speaker_id: str
     session_id: str
@@ -26,6 +27,8 @@ class TranslationRequest:
     use_semantic_cache: bool = True
     cache_strategy: str = "context"
     use_transcript_memory: bool = True
+    audio_codec: str = "wav"
+    trace_id: str = field(default="", compare=False)
 
 
 @dataclass(frozen=True)
@@ -45,3 +48,4 @@ class TranslationResponse:
     decision: str = ""
     translation_id: str = ""
     raw_headers: dict[str, str] = field(default_factory=dict)
+    audio_stream: Any | None = field(default=None, compare=False, repr=False)
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from typing import Iterable, Iterator, Sequence
+from uuid import uuid4
+
+
+def new_boundary() -> str:
+    return uuid4().hex
+
+
+def multipart_content_type(boundary: str) -> str:
+    return f"multipart/form-data; boundary={boundary}"
+
+
+def iter_multipart(
+    fields: dict[str, str],
+    *,
+    boundary: str,
+    file_field: str,
+    filename: str,
+    content_type: str,
+    file_chunks: Iterable[bytes],
+) -> Iterator[bytes]:
+    yield _fields_preamble(fields, boundary) + _file_preamble(boundary, file_field, filename, content_type)
+    for chunk in file_chunks:
+        if chunk:
+            yield chunk
+    yield _epilogue(boundary)
+
+
+class MultipartBody:
+    def __init__(
+        self,
+        fields: dict[str, str],
+        *,
+        boundary: str,
+        file_field: str,
+        filename: str,
+        content_type: str,
+        file_parts: Sequence[bytes | bytearray | memoryview],
+    ):
+        self.fields = dict(fields)
+        self.boundary = boundary
+        self._head = _fields_preamble(self.fields, boundary) + _file_preamble(
+            boundary, file_field, filename, content_type
+        )
+        self._parts = [memoryview(part).cast("B") for part in file_parts if len(part)]
+        self._tail = _epilogue(boundary)
+
+    @property
+    def content_type(self) -> str:
+        return multipart_content_type(self.boundary)
+
+    def __len__(self) -> int:
+        return len(self._head) + sum(part.nbytes for part in self._parts) + len(self._tail)
+
+    def __iter__(self) -> Iterator[bytes | memoryview]:
+        yield self._head
+        yield from self._parts
+        yield self._tail
+
+
+def _fields_preamble(fields: dict[str, str], boundary: str) -> bytes:
+    parts = []
+    for name, value in fields.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode("utf-8")
+        )
+    return b"".join(parts)
+
+
+def _file_preamble(boundary: str, file_field: str, filename: str, content_type: str) -> bytes:
+    return (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="{file_field}"; filename="{filename}"\r\n'
+        f"Content-Type: {content_type}\r\n\r\n"
+    ).encode("utf-8")
+
+
+def _epilogue(boundary: str) -> bytes:
+    return f"\r\n--{boundary}--\r\n".encode("utf-8")
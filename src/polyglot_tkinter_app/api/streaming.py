@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Callable, Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+
+class StreamedAudioError(RuntimeError):
+    pass
+
+
+class StreamedAudio:
+    def __init__(self, chunks: Iterable[bytes], *, on_close: Callable[[], None] | None = None):
+        self._chunks = chunks
+        self._on_close = on_close
+        self._received: list[bytes] = []
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: list[Callable[[bytes], None]] = []
+        self._finish_callbacks: list[Callable[[], None]] = []
+        self._audio_bytes: bytes | None = None
+        self._error: BaseException | None = None
+        self._consumed = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        with self._lock:
+            if self._consumed:
+                raise RuntimeError("streamed audio can only be consumed once")
+            self._consumed = True
+        error: BaseException | None = StreamedAudioError("streamed audio closed before the end of the body")
+        try:
+            for chunk in self._chunks:
+                if chunk:
+                    self._received.append(chunk)
+                    yield chunk
+            error = None
+        except Exception as exc:
+            error = exc
+            raise
+        finally:
+            self._finish(error)
+
+    def read_all(self) -> bytes:
+        if not self._consumed:
+            for _ in self:
+                pass
+        self._done.wait()
+        return self._result()
+
+    def wait(self, timeout: float | None = None) -> bytes | None:
+        if not self._done.wait(timeout):
+            return None
+        return self._result()
+
+    def add_done_callback(self, callback: Callable[[bytes], None]) -> None:
+        with self._lock:
+            if not self._done.is_set():
+                self._callbacks.append(callback)
+                return
+            if self._error is not None:
+                return
+        callback(self._audio_bytes)
+
+    def add_finish_callback(self, callback: Callable[[], None]) -> None:
+        with self._lock:
+            if not self._done.is_set():
+                self._finish_callbacks.append(callback)
+                return
+        callback()
+
+    def _result(self) -> bytes:
+        if self._error is not None:
+            raise StreamedAudioError(f"streamed audio download failed: {self._error}") from self._error
+        return self._audio_bytes or b""
+
+    def _finish(self, error: BaseException | None) -> None:
+        on_close, self._on_close, self._chunks = self._on_close, None, ()
+        if on_close is not None:
+            try:
+                on_close()
+            except Exception as exc:
+                logger.debug("streamed_audio_close_failed error=%s", exc)
+        with self._lock:
+            self._audio_bytes = b"".join(self._received)
+            self._received.clear()
+            self._error = error
+            callbacks, self._callbacks = self._callbacks, []
+            finish_callbacks, self._finish_callbacks = self._finish_callbacks, []
+            self._done.set()
+        for callback in finish_callbacks:
+            try:
+                callback()
+            except Exception as exc:
+                logger.error("streamed_audio_callback_failed error=%s", exc)
+        if error is not None:
+            logger.warning("streamed_audio_failed bytes=%s error=%s", len(self._audio_bytes), error)
+            return
+        for callback in callbacks:
+            try:
+                callback(self._audio_bytes)
+            except Exception as exc:
+                logger.error("streamed_audio_callback_failed error=%s", exc)
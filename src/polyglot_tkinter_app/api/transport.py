@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import ssl
+import time
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+MAX_HEADER_LINE = 65536
+
+
+class HttpTransportError(ConnectionError):
+    pass
+
+
+@dataclass(frozen=True)
+class HttpResponse:
+    status_code: int
+    headers: dict[str, str] = field(default_factory=dict)
+    content: bytes = b""
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class AsyncConnectionPool:
+    def __init__(self, *, max_connections: int = 4, keepalive_seconds: float = 30.0):
+        self.max_connections = max(1, max_connections)
+        self.keepalive_seconds = keepalive_seconds
+        self.connections_opened = 0
+        self._semaphore = asyncio.Semaphore(self.max_connections)
+        self._idle: dict[tuple[str, int, bool, bool], list[_Connection]] = {}
+        self._ssl_contexts: dict[bool, ssl.SSLContext] = {}
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        body: bytes = b"",
+        verify: bool = True,
+        timeout: float | None = None,
+    ) -> HttpResponse:
+        async with self._semaphore:
+            return await asyncio.wait_for(self._request(method, url, headers or {}, body, verify), timeout)
+
+    async def aclose(self) -> None:
+        idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+    @property
+    def idle_connections(self) -> int:
+        return sum(len(connections) for connections in self._idle.values())
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        body: bytes,
+        verify: bool,
+    ) -> HttpResponse:
+        parts = urlsplit(url)
+        secure = parts.scheme == "https"
+        host = parts.hostname or "localhost"
+        port = parts.port or (443 if secure else 80)
+        target = parts.path or "/"
+        if parts.query:
+            target += f"?{parts.query}"
+        key = (host, port, secure, verify)
+
+        for attempt in range(2):
+            connection, reused = await self._acquire(key)
+            try:
+                response, keep_alive = await connection.send(method, target, parts.netloc, headers, body)
+            except (ConnectionError, asyncio.IncompleteReadError) as exc:
+                connection.close()
+                if reused and attempt == 0:
+                    logger.debug("pooled_connection_stale host=%s error=%s", host, exc)
+                    continue
+                raise HttpTransportError(str(exc) or exc.__class__.__name__) from exc
+            except BaseException:
+                connection.close()
+                raise
+            if keep_alive:
+                self._release(key, connection)
+            else:
+                connection.close()
+            return response
+        raise HttpTransportError("connection pool exhausted retries")
+
+    async def _acquire(self, key: tuple[str, int, bool, bool]) -> tuple[_Connection, bool]:
+        idle = self._idle.get(key, [])
+        now = time.monotonic()
+        while idle:
+            connection = idle.pop()
+            if connection.usable(now, self.keepalive_seconds):
+                return connection, True
+            connection.close()
+        host, port, secure, verify = key
+        reader, writer = await asyncio.open_connection(
+            host,
+            port,
+            ssl=self._ssl_context(verify) if secure else None,
+            limit=MAX_HEADER_LINE,
+        )
+        self.connections_opened += 1
+        logger.debug("pooled_connection_opened host=%s port=%s", host, port)
+        return _Connection(reader, writer), False
+
+    def _release(self, key: tuple[str, int, bool, bool], connection: _Connection) -> None:
+        connection.last_used = time.monotonic()
+        self._idle.setdefault(key, []).append(connection)
+        if self.idle_connections <= self.max_connections:
+            return
+        oldest = min(
+            (connections[0] for connections in self._idle.values() if connections),
+            key=lambda item: item.last_used,
+        )
+        for connections in self._idle.values():
+            if oldest in connections:
+                connections.remove(oldest)
+        oldest.close()
+
+    def _ssl_context(self, verify: bool) -> ssl.SSLContext:
+        if verify not in self._ssl_contexts:
+            context = ssl.create_default_context()
+            if not verify:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+            self._ssl_contexts[verify] = context
+        return self._ssl_contexts[verify]
+
+
+class _Connection:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.last_used = time.monotonic()
+
+    def usable(self, now: float, keepalive_seconds: float) -> bool:
+        if self.reader.at_eof() or self.writer.is_closing():
+            return False
+        return now - self.last_used < keepalive_seconds
+
+    def close(self) -> None:
+        try:
+            self.writer.close()
+        except Exception:
+            pass
+
+    async def send(
+        self,
+        method: str,
+        target: str,
+        host: str,
+        headers: dict[str, str],
+        body: bytes,
+    ) -> tuple[HttpResponse, bool]:
+        lines = [f"{method} {target} HTTP/1.1", f"Host: {host}", "Connection: keep-alive"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        if body or method in {"POST", "PUT", "PATCH"}:
+            lines.append(f"Content-Length: {len(body)}")
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        if body:
+            self.writer.write(body)
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionResetError("connection closed before response")
+        version, status_code = _parse_status_line(status_line)
+        response_headers = await self._read_headers()
+        lowered = {name.lower(): value for name, value in response_headers.items()}
+        keep_alive = version == "HTTP/1.1" and lowered.get("connection", "").lower() != "close"
+
+        if method == "HEAD" or status_code in {204, 304} or 100 <= status_code < 200:
+            content = b""
+        elif "chunked" in lowered.get("transfer-encoding", "").lower():
+            content = await self._read_chunked()
+        elif "content-length" in lowered:
+            content = await self.reader.readexactly(int(lowered["content-length"]))
+        else:
+            content = await self.reader.read()
+            keep_alive = False
+        return HttpResponse(status_code=status_code, headers=response_headers, content=content), keep_alive
+
+    async def _read_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        while True:
+            line = await self.reader.readline()
+            if not line:
+                raise ConnectionResetError("connection closed while reading headers")
+            if line in (b"\r\n", b"\n"):
+                return headers
+            name, _, value = line.decode("latin-1").partition(":")
+            name = name.strip()
+            value = value.strip()
+            headers[name] = f"{headers[name]}, {value}" if name in headers else value
+
+    async def _read_chunked(self) -> bytes:
+        chunks = []
+        while True:
+            size_line = await self.reader.readline()
+            size = int(size_line.split(b";", 1)[0].strip() or b"0", 16)
+            if size == 0:
+                while (await self.reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                return b"".join(chunks)
+            chunks.append(await self.reader.readexactly(size))
+            await self.reader.readexactly(2)
+
+
+def _parse_status_line(line: bytes) -> tuple[str, int]:
+    parts = line.decode("latin-1").strip().split(" ", 2)
+    if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+        raise HttpTransportError(f"malformed status line: {line!r}")
+    return parts[0], int(parts[1])
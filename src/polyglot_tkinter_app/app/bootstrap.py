@@ -1,10 +1,18 @@
+from __future__ import annotations
+
 import logging
+from typing import TYPE_CHECKING
 
-from polyglot_tkinter_app.api.client import TranslationClient
+from polyglot_tkinter_app.api.event_loop import get_client_loop
 from polyglot_tkinter_app.gui.splash_screen import SplashScreen
-from polyglot_tkinter_app.logging_config import setup_logger
+from polyglot_tkinter_app.logging_config import setup_logger, shutdown_logger
+from polyglot_tkinter_app.metrics import start_metrics_exporters
 from polyglot_tkinter_app.paths import ensure_runtime_dirs
-from polyglot_tkinter_app.settings import RuntimeState, load_settings
+from polyglot_tkinter_app.settings import AppSettings, RuntimeState, load_settings
+from polyglot_tkinter_app.tracing import configure_tracing
+
+if TYPE_CHECKING:
+    from polyglot_tkinter_app.api.client import TranslationClient
 
 logger = logging.getLogger(__name__)
 
@@ -13,9 +21,24 @@ def run() -> None:
     settings = load_settings("config.json")
     ensure_runtime_dirs()
     setup_logger(settings)
+    tracer = configure_tracing(settings.tracing)
+    exporters = start_metrics_exporters(settings.metrics)
     logger.info("app_started")
 
     runtime = RuntimeState.from_settings(settings)
-    client = TranslationClient(runtime)
-    app = SplashScreen(settings=settings, runtime=runtime, client=client)
-    app.mainloop()
+    app = SplashScreen(settings=settings, runtime=runtime, client_factory=lambda: build_client(settings, runtime))
+    try:
+        app.mainloop()
+    finally:
+        get_client_loop().stop()
+        tracer.export()
+        exporters.stop()
+        shutdown_logger()
+
+
+def build_client(settings: AppSettings, runtime: RuntimeState) -> TranslationClient:
+    from polyglot_tkinter_app.api.cache import TranslationCache
+    from polyglot_tkinter_app.api.client import TranslationClient
+
+    cache = TranslationCache.from_settings(settings) if settings.client_cache.enabled else None
+    return TranslationClient(runtime, cache=cache)
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import argparse
+import logging
+import signal
+import threading
+from dataclasses import dataclass, replace
+from typing import Callable
+
+from polyglot_tkinter_app.api.async_client import AsyncTranslationClient
+from polyglot_tkinter_app.api.cache import TranslationCache
+from polyglot_tkinter_app.api.client import TranslationClient
+from polyglot_tkinter_app.api.event_loop import get_client_loop
+from polyglot_tkinter_app.api.keepalive import ConnectionWarmer
+from polyglot_tkinter_app.api.models import TranslationResponse
+from polyglot_tkinter_app.audio.devices import AudioDevice, AudioDeviceRegistry
+from polyglot_tkinter_app.audio.playback import AudioPlayer
+from polyglot_tkinter_app.logging_config import setup_logger, shutdown_logger
+from polyglot_tkinter_app.metrics import get_registry, start_metrics_exporters
+from polyglot_tkinter_app.orchestration.translation_flow import TranslationFlow
+from polyglot_tkinter_app.paths import ensure_runtime_dirs
+from polyglot_tkinter_app.settings import AppSettings, RuntimeState, load_settings
+from polyglot_tkinter_app.settings.models import DaemonSession
+from polyglot_tkinter_app.tracing import configure_tracing
+
+logger = logging.getLogger(__name__)
+
+STOP_TIMEOUT_SECONDS = 10.0
+
+DAEMON_SESSIONS = get_registry().gauge("polyglot_daemon_sessions", "Headless translation sessions running")
+SESSION_TRANSLATIONS = get_registry().counter(
+    "polyglot_daemon_translations_total", "Headless session translations by session and outcome"
+)
+
+
+@dataclass
+class HeadlessSession:
+    name: str
+    runtime: RuntimeState
+    flow: TranslationFlow
+
+
+class TranslationDaemon:
+    def __init__(
+        self,
+        settings: AppSettings,
+        *,
+        client: TranslationClient,
+        async_client: AsyncTranslationClient | None = None,
+        registry: AudioDeviceRegistry | None = None,
+        player_factory: Callable[[str], AudioPlayer] | None = None,
+    ):
+        self.settings = settings
+        self.client = client
+        self.async_client = async_client
+        self.registry = registry or AudioDeviceRegistry()
+        self.player_factory = player_factory or self._create_player
+        self.connection_warmer = ConnectionWarmer.from_settings(client, settings, async_client=async_client)
+        self.sessions: list[HeadlessSession] = []
+        self._stop_event = threading.Event()
+
+    def build_sessions(self) -> list[HeadlessSession]:
+        inputs = self.registry.list_input_devices()
+        outputs = self.registry.list_output_devices()
+        sessions = []
+        for config in self.settings.daemon.sessions:
+            input_device = _find_device(inputs, config.input_device)
+            if input_device is None:
+                logger.warning(
+                    "daemon_session_skipped session=%s reason=input_missing device=%s", config.name, config.input_device
+                )
+                continue
+            runtime = self._session_runtime(config, input_device, self._output_device(config, outputs))
+            flow = self._create_flow(config.name, runtime)
+            sessions.append(HeadlessSession(name=config.name, runtime=runtime, flow=flow))
+            logger.info(
+                "daemon_session_ready session=%s input=%s output=%s target=%s",
+                config.name,
+                input_device.display_name(),
+                runtime.output_device.display_name() if runtime.output_device else "default",
+                runtime.target_language,
+            )
+        self.sessions = sessions
+        return sessions
+
+    def start(self) -> None:
+        if not self.sessions:
+            self.build_sessions()
+        for session in self.sessions:
+            session.flow.start()
+        DAEMON_SESSIONS.set(len(self.sessions))
+        logger.info("daemon_started sessions=%s", len(self.sessions))
+
+    def serve_forever(self) -> None:
+        self.start()
+        try:
+            self._stop_event.wait()
+        finally:
+            self.shutdown()
+
+    def request_stop(self) -> None:
+        self._stop_event.set()
+
+    def shutdown(self) -> None:
+        stoppers = [threading.Thread(target=session.flow.stop, daemon=True) for session in self.sessions]
+        for stopper in stoppers:
+            stopper.start()
+        for stopper in stoppers:
+            stopper.join(timeout=STOP_TIMEOUT_SECONDS)
+        for session in self.sessions:
+            session.flow.shutdown()
+        self.connection_warmer.close()
+        if self.async_client is not None:
+            get_client_loop().submit(self.async_client.aclose()).result(timeout=STOP_TIMEOUT_SECONDS)
+        DAEMON_SESSIONS.set(0)
+        logger.info("daemon_stopped sessions=%s", len(self.sessions))
+
+    def _session_runtime(
+        self,
+        config: DaemonSession,
+        input_device: AudioDevice,
+        output_device: AudioDevice | None,
+    ) -> RuntimeState:
+        runtime = RuntimeState.from_settings(self.settings)
+        runtime.extra_targets = []
+        runtime.input_device = input_device
+        runtime.output_device = output_device
+        runtime.target_language = config.target_language
+        runtime.speaker_id = config.speaker_id
+        return runtime
+
+    def _output_device(self, config: DaemonSession, outputs: list[AudioDevice]) -> AudioDevice | None:
+        device = _find_device(outputs, config.output_device)
+        if device is None:
+            if config.output_device:
+                logger.warning(
+                    "daemon_output_missing session=%s device=%s fallback=default_output",
+                    config.name,
+                    config.output_device,
+                )
+            device = self.registry.get_default_output_device()
+        return device
+
+    def _create_flow(self, name: str, runtime: RuntimeState) -> TranslationFlow:
+        return TranslationFlow(
+            runtime=runtime,
+            client=self.client,
+            player=self.player_factory(name),
+            on_translation_completed=lambda response: self._translation_completed(name, response),
+            on_translation_failed=lambda exc: self._translation_failed(name, exc),
+            on_status_changed=lambda status: logger.info("daemon_status session=%s status=%s", name, status),
+            connection_warmer=self.connection_warmer,
+            async_client=self.async_client,
+            name=name,
+        )
+
+    def _create_player(self, name: str) -> AudioPlayer:
+        audio = self.settings.audio
+        pipeline = self.settings.pipeline
+        return AudioPlayer(
+            jitter_ms=audio.playback_jitter_ms,
+            max_queue=pipeline.playback_queue_size,
+            overflow_policy=pipeline.overflow_policy,
+            max_staleness_ms=pipeline.max_staleness_ms,
+            idle_close_seconds=audio.output_idle_close_seconds,
+            engine=audio.playback_engine,
+            on_status_changed=lambda status: logger.info("daemon_status session=%s status=%s", name, status),
+            name=name,
+        )
+
+    def _translation_completed(self, name: str, response: TranslationResponse) -> None:
+        SESSION_TRANSLATIONS.inc(session=name, outcome="ok")
+        logger.info("daemon_translation session=%s cache=%s total=%s", name, response.cache_status, response.total_time)
+
+    def _translation_failed(self, name: str, exc: Exception) -> None:
+        SESSION_TRANSLATIONS.inc(session=name, outcome="error")
+        logger.warning("daemon_translation_failed session=%s error=%s", name, exc)
+
+
+def shared_client(settings: AppSettings) -> TranslationClient:
+    connections = max(
+        settings.api.max_connections,
+        len(settings.daemon.sessions) * settings.pipeline.translation_workers,
+    )
+    settings = replace(settings, api=replace(settings.api, max_connections=connections))
+    cache = TranslationCache.from_settings(settings) if settings.client_cache.enabled else None
+    return TranslationClient(RuntimeState.from_settings(settings), cache=cache)
+
+
+def _find_device(devices: list[AudioDevice], name: str) -> AudioDevice | None:
+    if not name:
+        return None
+    for device in devices:
+        if name.lower() in device.name.lower():
+            return device
+    return None
+
+
+def run(config_path: str = "config.json") -> None:
+    settings = load_settings(config_path)
+    ensure_runtime_dirs()
+    setup_logger(settings)
+    tracer = configure_tracing(settings.tracing)
+    exporters = start_metrics_exporters(settings.metrics)
+    logger.info("daemon_starting configured_sessions=%s", len(settings.daemon.sessions))
+
+    client = shared_client(settings)
+    daemon = TranslationDaemon(settings, client=client, async_client=AsyncTranslationClient.from_client(client))
+    signal.signal(signal.SIGINT, lambda *_: daemon.request_stop())
+    signal.signal(signal.SIGTERM, lambda *_: daemon.request_stop())
+    try:
+        daemon.serve_forever()
+    finally:
+        get_client_loop().stop()
+        tracer.export()
+        exporters.stop()
+        shutdown_logger()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Run Polyglot translation sessions without a GUI.")
+    parser.add_argument("--config", default="config.json")
+    args = parser.parse_args(argv)
+    run(args.config)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import importlib
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+HEAVY_MODULES = (
+    "numpy",
+    "requests",
+    "urllib3",
+    "polyglot_tkinter_app.api.client",
+    "polyglot_tkinter_app.api.cache",
+    "polyglot_tkinter_app.gui.main_menu",
+    "pyaudio",
+    "sounddevice",
+    "webrtcvad",
+    "soundfile",
+    "PIL.Image",
+    "pystray",
+)
+
+
+class ModulePreloader:
+    def __init__(self, modules: tuple[str, ...] = HEAVY_MODULES):
+        self.modules = modules
+        self.loaded: dict[str, float] = {}
+        self.failed: dict[str, str] = {}
+        self._thread: threading.Thread | None = None
+        self._done = threading.Event()
+
+    def start(self) -> "ModulePreloader":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.run, name="module-preload", daemon=True)
+            self._thread.start()
+        return self
+
+    def wait(self, timeout: float | None = None) -> bool:
+        return self._done.wait(timeout)
+
+    def run(self) -> None:
+        started = time.perf_counter()
+        for name in self.modules:
+            module_started = time.perf_counter()
+            try:
+                importlib.import_module(name)
+            except Exception as exc:
+                self.failed[name] = str(exc)
+                logger.debug("module_preload_failed module=%s error=%s", name, exc)
+            else:
+                self.loaded[name] = time.perf_counter() - module_started
+        logger.info(
+            "modules_preloaded loaded=%s failed=%s seconds=%.3f",
+            len(self.loaded),
+            len(self.failed),
+            time.perf_counter() - started,
+        )
+        self._done.set()
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import inspect
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
+
+from polyglot_tkinter_app.api.event_loop import get_client_loop
+from polyglot_tkinter_app.api.models import HealthStatus
+from polyglot_tkinter_app.app.preload import HEAVY_MODULES, ModulePreloader
+from polyglot_tkinter_app.audio.devices import AudioDeviceRegistry
+from polyglot_tkinter_app.metrics import get_registry
+from polyglot_tkinter_app.paths import asset_path
+from polyglot_tkinter_app.settings.models import AppSettings
+
+if TYPE_CHECKING:
+    from polyglot_tkinter_app.api.async_client import AsyncTranslationClient
+    from polyglot_tkinter_app.api.client import TranslationClient
+
+logger = logging.getLogger(__name__)
+
+IMAGE_ASSETS = ("polyglot-logo.png", "record-icon.png")
+TRAY_ICON_ASSET = "polyglot-icon.ico"
+
+STARTUP_TASK_SECONDS = get_registry().histogram("polyglot_startup_task_seconds", "Splash startup task duration by task")
+
+
+@dataclass
+class StartupResult:
+    client: TranslationClient | None = None
+    async_client: AsyncTranslationClient | None = None
+    health: HealthStatus = field(default_factory=lambda: HealthStatus(online=False))
+    registry: AudioDeviceRegistry | None = None
+    images: dict[str, bytes] = field(default_factory=dict)
+    tray_image: Any | None = None
+    timings: dict[str, float] = field(default_factory=dict)
+
+
+class StartupOrchestrator:
+    def __init__(
+        self,
+        settings: AppSettings,
+        *,
+        client_factory: Callable[[], TranslationClient],
+        on_finished: Callable[[StartupResult], None],
+        async_client_factory: Callable[[TranslationClient], AsyncTranslationClient] | None = None,
+        registry_factory: Callable[[], AudioDeviceRegistry] = AudioDeviceRegistry,
+        warmup_modules: tuple[str, ...] = HEAVY_MODULES,
+    ):
+        self.settings = settings
+        self.client_factory = client_factory
+        self.async_client_factory = async_client_factory or _async_client
+        self.on_finished = on_finished
+        self.registry_factory = registry_factory
+        self.warmup_modules = warmup_modules
+        self.result = StartupResult()
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._started_at = 0.0
+
+    def start(self) -> None:
+        self._run_tasks(
+            {
+                "health": self._check_health,
+                "devices": self._discover_devices,
+                "assets": self._load_assets,
+                "warmup": self._warm_up,
+            }
+        )
+
+    def retry_health(self) -> None:
+        self._run_tasks({"health": self._check_health})
+
+    def _run_tasks(self, tasks: dict[str, Callable[[], None]]) -> None:
+        with self._lock:
+            self._pending = len(tasks)
+            self._started_at = time.perf_counter()
+        for name, task in tasks.items():
+            if inspect.iscoroutinefunction(task):
+                get_client_loop().submit(self._run_async_task(name, task))
+            else:
+                threading.Thread(target=self._run_task, args=(name, task), name=f"startup-{name}", daemon=True).start()
+
+    def _run_task(self, name: str, task: Callable[[], None]) -> None:
+        started = time.perf_counter()
+        try:
+            task()
+        except Exception as exc:
+            logger.warning("startup_task_failed task=%s error=%s", name, exc)
+        self._task_finished(name, started)
+
+    async def _run_async_task(self, name: str, task: Callable[[], Any]) -> None:
+        started = time.perf_counter()
+        try:
+            await task()
+        except Exception as exc:
+            logger.warning("startup_task_failed task=%s error=%s", name, exc)
+        self._task_finished(name, started)
+
+    def _task_finished(self, name: str, started: float) -> None:
+        elapsed = time.perf_counter() - started
+        STARTUP_TASK_SECONDS.observe(elapsed, task=name)
+        logger.info("startup_task_finished task=%s seconds=%.3f", name, elapsed)
+        with self._lock:
+            self.result.timings[name] = elapsed
+            self._pending -= 1
+            if self._pending:
+                return
+            total = time.perf_counter() - self._started_at
+        slowest = max(self.result.timings, key=self.result.timings.get)
+        logger.info("startup_finished seconds=%.3f slowest=%s", total, slowest)
+        self.on_finished(self.result)
+
+    async def _check_health(self) -> None:
+        if self.result.client is None:
+            self.result.client = self.client_factory()
+        if self.result.async_client is None:
+            self.result.async_client = self.async_client_factory(self.result.client)
+        self.result.health = await self.result.async_client.health()
+        logger.info(
+            "server_health_checked online=%s memory=%s mode=%s",
+            self.result.health.online,
+            self.result.health.semantic_memory_enabled,
+            self.result.health.semantic_memory_mode,
+        )
+
+    def _discover_devices(self) -> None:
+        self.result.registry = self.registry_factory()
+        snapshot = self.result.registry.snapshot()
+        logger.info("audio_devices_discovered count=%s", len(snapshot.devices))
+
+    def _load_assets(self) -> None:
+        self.result.images = {name: Path(asset_path(name)).read_bytes() for name in IMAGE_ASSETS}
+        self.result.tray_image = _decode_tray_icon()
+
+    def _warm_up(self) -> None:
+        ModulePreloader(self.warmup_modules).run()
+        from polyglot_tkinter_app.audio.vad import SpeechSegmenter
+
+        audio = self.settings.audio
+        SpeechSegmenter(
+            sample_rate=audio.sample_rate,
+            frame_duration_ms=audio.frame_duration_ms,
+            aggressiveness=audio.vad_aggressiveness,
+        )
+
+
+def _async_client(client: TranslationClient) -> AsyncTranslationClient:
+    from polyglot_tkinter_app.api.async_client import AsyncTranslationClient
+
+    return AsyncTranslationClient.from_client(client)
+
+
+def _decode_tray_icon() -> Any | None:
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    image = Image.open(asset_path(TRAY_ICON_ASSET))
+    image.load()
+    return image
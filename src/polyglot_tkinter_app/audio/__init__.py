@@ -1,4 +1,14 @@
-from polyglot_tkinter_app.audio.devices import AudioDevice, AudioDeviceRegistry
-from polyglot_tkinter_app.audio.playback import AudioPlayer
+from importlib import import_module
+from typing import Any
 
-__all__ = ["AudioDevice", "AudioDeviceRegistry", "AudioPlayer"]
+from polyglot_tkinter_app.audio.devices import AudioDevice, AudioDeviceRegistry, DeviceSnapshot
+
+__all__ = ["AudioDevice", "AudioDeviceRegistry", "AudioPlayer", "DeviceSnapshot"]
+
+_LAZY_EXPORTS = {"AudioPlayer": "polyglot_tkinter_app.audio.playback"}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(_LAZY_EXPORTS[name]), name)
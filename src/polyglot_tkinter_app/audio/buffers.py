@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import threading
+from typing import Callable
+
+import numpy as np
+
+from polyglot_tkinter_app.audio.wav_io import WAV_HEADER_SIZE, wav_header
+
+SPARE_SEGMENT_BUFFERS = 1
+
+
+class FrameRing:
+    def __init__(self, *, capacity_frames: int, frame_samples: int):
+        self.capacity_frames = max(1, capacity_frames)
+        self.frame_samples = frame_samples
+        self.dropped_frames = 0
+        self._frames = np.zeros((self.capacity_frames, frame_samples), dtype=np.int16)
+        self._write_count = 0
+        self._read_count = 0
+        self._ready = threading.Event()
+
+    def __len__(self) -> int:
+        return self._write_count - self._read_count
+
+    def push(self, frame_bytes: bytes) -> None:
+        samples = np.frombuffer(frame_bytes, dtype=np.int16)
+        if samples.size != self.frame_samples:
+            return
+        if self._write_count - self._read_count >= self.capacity_frames:
+            self.dropped_frames += 1
+            return
+        self._frames[self._write_count % self.capacity_frames] = samples
+        self._write_count += 1
+        self._ready.set()
+
+    def drain(self, timeout: float | None = None) -> np.ndarray:
+        if self._write_count == self._read_count:
+            self._ready.wait(timeout)
+        self._ready.clear()
+        start, end = self._read_count, self._write_count
+        if start == end:
+            return self._frames[:0].copy()
+        indices = np.arange(start, end) % self.capacity_frames
+        batch = self._frames[indices]
+        self._read_count = end
+        return batch
+
+
+class SampleRing:
+    def __init__(self, *, capacity_frames: int, channels: int = 1):
+        self.capacity_frames = max(1, capacity_frames)
+        self.channels = channels
+        self._samples = np.zeros((self.capacity_frames, channels), dtype=np.int16)
+        self._write_count = 0
+        self._read_count = 0
+
+    def __len__(self) -> int:
+        return self._write_count - self._read_count
+
+    @property
+    def free_frames(self) -> int:
+        return self.capacity_frames - len(self)
+
+    def write(self, samples: np.ndarray) -> int:
+        count = min(len(samples), self.free_frames)
+        if count:
+            indices = np.arange(self._write_count, self._write_count + count) % self.capacity_frames
+            self._samples[indices] = samples[:count]
+            self._write_count += count
+        return count
+
+    def read(self, frames: int) -> np.ndarray:
+        count = min(frames, len(self))
+        indices = np.arange(self._read_count, self._read_count + count) % self.capacity_frames
+        batch = self._samples[indices]
+        self._read_count += count
+        return batch
+
+    def clear(self) -> None:
+        self._read_count = self._write_count
+
+
+class PcmSegment:
+    def __init__(
+        self,
+        storage: bytearray,
+        length: int,
+        *,
+        sample_width: int = 2,
+        on_release: Callable[[bytearray], None] | None = None,
+    ):
+        self._storage = storage
+        self._length = length
+        self.sample_width = sample_width
+        self._on_release = on_release
+        self._holders = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __bytes__(self) -> bytes:
+        return bytes(self.pcm)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PcmSegment):
+            return self.pcm == other.pcm
+        if isinstance(other, (bytes, bytearray, memoryview)):
+            return self.pcm == other
+        return NotImplemented
+
+    @property
+    def pcm(self) -> memoryview:
+        return memoryview(self._storage)[WAV_HEADER_SIZE : WAV_HEADER_SIZE + self._length]
+
+    def to_wav(self, *, sample_rate: int = 16000, channels: int = 1) -> memoryview:
+        self._storage[:WAV_HEADER_SIZE] = wav_header(
+            sample_rate=sample_rate,
+            channels=channels,
+            sample_width=self.sample_width,
+            data_size=self._length,
+        )
+        return memoryview(self._storage)[: WAV_HEADER_SIZE + self._length]
+
+    def retain(self) -> None:
+        with self._lock:
+            self._holders += 1
+
+    def release(self) -> None:
+        with self._lock:
+            self._holders -= 1
+            if self._holders or self._on_release is None:
+                return
+            on_release, self._on_release = self._on_release, None
+        on_release(self._storage)
+
+
+class PcmSegmentBuffer:
+    def __init__(self, *, capacity_bytes: int, sample_width: int = 2):
+        self.sample_width = sample_width
+        self._storage = bytearray(WAV_HEADER_SIZE + max(0, capacity_bytes))
+        self._length = 0
+        self._spares: list[bytearray] = []
+        self._spares_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def capacity_bytes(self) -> int:
+        return len(self._storage) - WAV_HEADER_SIZE
+
+    def append(self, frame_bytes: bytes) -> None:
+        start = WAV_HEADER_SIZE + self._length
+        end = start + len(frame_bytes)
+        if end > len(self._storage):
+            self._storage.extend(bytes(max(end, 2 * len(self._storage)) - len(self._storage)))
+        self._storage[start:end] = frame_bytes
+        self._length += len(frame_bytes)
+
+    def detach(self, length: int | None = None, *, carry_from: int | None = None) -> PcmSegment:
+        length = self._length if length is None else min(length, self._length)
+        carry_from = length if carry_from is None else carry_from
+        segment = PcmSegment(self._storage, length, sample_width=self.sample_width, on_release=self._recycle)
+        carried = self._storage[WAV_HEADER_SIZE + carry_from : WAV_HEADER_SIZE + self._length]
+        self._storage = self._spare(len(self._storage))
+        self._storage[WAV_HEADER_SIZE : WAV_HEADER_SIZE + len(carried)] = carried
+        self._length = len(carried)
+        return segment
+
+    def clear(self) -> None:
+        self._length = 0
+
+    def _spare(self, size: int) -> bytearray:
+        with self._spares_lock:
+            storage = self._spares.pop() if self._spares else None
+        if storage is None:
+            return bytearray(size)
+        if len(storage) < size:
+            storage.extend(bytes(size - len(storage)))
+        return storage
+
+    def _recycle(self, storage: bytearray) -> None:
+        with self._spares_lock:
+            if len(self._spares) < SPARE_SEGMENT_BUFFERS:
+                self._spares.append(storage)
@@ -8,6 +8,8 @@ from polyglot_tkinter_app.audio.devices import AudioDevice
 
 logger = logging.getLogger(__name__)
 
+SAMPLE_WIDTH = 2
+
 
 class AudioCapture:
     def __init__(self, *, input_device: AudioDevice, sample_rate: int, frame_duration_ms: int):
@@ -35,7 +37,7 @@ class AudioCapture:
                 channels=1,
                 samplerate=self.sample_rate,
                 blocksize=self.blocksize,
-                dtype="int16",
+                dtype=f"int{SAMPLE_WIDTH * 8}",
             ):
                 while not stop_event.is_set():
                     sd.sleep(100)
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import logging
+import threading
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass(frozen=True)
@@ -27,34 +31,69 @@ class AudioDevice:
         return self.name
 
 
+@dataclass(frozen=True)
+class DeviceSnapshot:
+    devices: tuple[AudioDevice, ...] = ()
+    default_input: AudioDevice | None = None
+    default_output: AudioDevice | None = None
+
+
 class AudioDeviceRegistry:
+    def __init__(self, *, on_change: Callable[[DeviceSnapshot], None] | None = None):
+        self.on_change = on_change
+        self._snapshot: DeviceSnapshot | None = None
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._monitor: threading.Thread | None = None
+
+    def snapshot(self) -> DeviceSnapshot:
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = _enumerate_devices()
+            return self._snapshot
+
+    def refresh(self) -> DeviceSnapshot:
+        snapshot = _enumerate_devices()
+        with self._lock:
+            previous, self._snapshot = self._snapshot, snapshot
+        if previous is not None and previous != snapshot:
+            logger.info("audio_devices_changed before=%s after=%s", len(previous.devices), len(snapshot.devices))
+            if self.on_change:
+                self.on_change(snapshot)
+        return snapshot
+
+    def start_monitor(self, interval_seconds: float) -> None:
+        if self._monitor is not None or interval_seconds <= 0:
+            return
+        self._stop_event.clear()
+        self._monitor = threading.Thread(target=self._run_monitor, args=(interval_seconds,), daemon=True)
+        self._monitor.start()
+
+    def stop_monitor(self) -> None:
+        self._stop_event.set()
+        if self._monitor is not None:
+            self._monitor.join(timeout=5)
+            self._monitor = None
+
     def list_input_devices(self) -> list[AudioDevice]:
-        return [device for device in self._list_devices() if device.input_channels > 0]
+        return [device for device in self.snapshot().devices if device.input_channels > 0]
 
     def list_output_devices(self) -> list[AudioDevice]:
-        return [device for device in self._list_devices() if device.output_channels > 0]
+        return [device for device in self.snapshot().devices if device.output_channels > 0]
 
     def get_default_input_device(self) -> AudioDevice | None:
-        pyaudio = _load_pyaudio()
-        p = pyaudio.PyAudio()
-        try:
-            return AudioDevice.from_info(p.get_default_input_device_info())
-        except Exception:
-            devices = self.list_input_devices()
-            return devices[0] if devices else None
-        finally:
-            p.terminate()
+        default = self.snapshot().default_input
+        if default is not None:
+            return default
+        devices = self.list_input_devices()
+        return devices[0] if devices else None
 
     def get_default_output_device(self) -> AudioDevice | None:
-        pyaudio = _load_pyaudio()
-        p = pyaudio.PyAudio()
-        try:
-            return AudioDevice.from_info(p.get_default_output_device_info())
-        except Exception:
-            devices = self.list_output_devices()
-            return devices[0] if devices else None
-        finally:
-            p.terminate()
+        default = self.snapshot().default_output
+        if default is not None:
+            return default
+        devices = self.list_output_devices()
+        return devices[0] if devices else None
 
     def find_virtual_cable_output(self) -> AudioDevice | None:
         for device in self.list_output_devices():
@@ -63,13 +102,33 @@ class AudioDeviceRegistry:
                 return device
         return None
 
-    def _list_devices(self) -> list[AudioDevice]:
-        pyaudio = _load_pyaudio()
-        p = pyaudio.PyAudio()
-        try:
-            return [AudioDevice.from_info(p.get_device_info_by_index(index)) for index in range(p.get_device_count())]
-        finally:
-            p.terminate()
+    def _run_monitor(self, interval_seconds: float) -> None:
+        while not self._stop_event.wait(interval_seconds):
+            try:
+                self.refresh()
+            except Exception as exc:
+                logger.warning("audio_device_refresh_failed error=%s", exc)
+
+
+def _enumerate_devices() -> DeviceSnapshot:
+    pyaudio = _load_pyaudio()
+    p = pyaudio.PyAudio()
+    try:
+        devices = tuple(AudioDevice.from_info(p.get_device_info_by_index(index)) for index in range(p.get_device_count()))
+        return DeviceSnapshot(
+            devices=devices,
+            default_input=_default_device(p.get_default_input_device_info),
+            default_output=_default_device(p.get_default_output_device_info),
+        )
+    finally:
+        p.terminate()
+
+
+def _default_device(provider: Callable[[], dict[str, Any]]) -> AudioDevice | None:
+    try:
+        return AudioDevice.from_info(provider())
+    except Exception:
+        return None
 
 
 def _load_pyaudio() -> Any:
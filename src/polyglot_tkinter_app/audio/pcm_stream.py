@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import threading
+from typing import Iterator
+
+from polyglot_tkinter_app.audio.wav_io import wav_header
+
+
+class PcmStream:
+    def __init__(self, *, sample_rate: int, channels: int = 1, sample_width: int = 2):
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.sample_width = sample_width
+        self._frames: list[bytes] = []
+        self._closed = False
+        self._changed = threading.Condition()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def push(self, frame_bytes: bytes) -> None:
+        with self._changed:
+            if self._closed:
+                return
+            self._frames.append(frame_bytes)
+            self._changed.notify_all()
+
+    def close(self) -> None:
+        with self._changed:
+            self._closed = True
+            self._changed.notify_all()
+
+    def __iter__(self) -> Iterator[bytes]:
+        position = 0
+        while True:
+            with self._changed:
+                while position == len(self._frames) and not self._closed:
+                    self._changed.wait()
+                frames = self._frames[position:]
+                if not frames and self._closed:
+                    return
+            position += len(frames)
+            yield from frames
+
+    def wav_chunks(self) -> Iterator[bytes]:
+        yield wav_header(sample_rate=self.sample_rate, channels=self.channels, sample_width=self.sample_width)
+        yield from self
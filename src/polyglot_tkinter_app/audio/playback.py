@@ -1,22 +1,139 @@
 from __future__ import annotations
 
 import logging
-import queue
 import threading
+import time
 import wave
 from io import BytesIO
-from typing import Any
+from itertools import chain
+from queue import Empty
+from typing import Any, Callable, Iterable
 
 from polyglot_tkinter_app.audio.devices import AudioDevice
+from polyglot_tkinter_app.audio.playback_engine import CallbackOutputStream
+from polyglot_tkinter_app.audio.wav_io import WavStreamParser, decode_to_wav, is_compressed_audio
+from polyglot_tkinter_app.metrics import get_registry
+from polyglot_tkinter_app.tracing import get_tracer
+from polyglot_tkinter_app.work_queue import BoundedWorkQueue
 
 logger = logging.getLogger(__name__)
 
+PLAYBACK_QUEUE_DEPTH = get_registry().gauge(
+    "polyglot_playback_queue_depth", "Clips waiting for the audio player by session"
+)
+PLAYBACK_QUEUE_SECONDS = get_registry().histogram("polyglot_playback_queue_seconds", "Time clips wait for playback")
+PLAYBACKS = get_registry().counter("polyglot_playbacks_total", "Played clips by delivery mode and outcome")
+PLAYBACK_DROPPED = get_registry().counter("polyglot_playback_dropped_total", "Queued clips discarded by reason")
+OUTPUT_STREAM_OPENS = get_registry().counter("polyglot_output_stream_opens_total", "PortAudio output streams opened")
+
+PlaybackItem = tuple[bytes | Iterable[bytes], AudioDevice | None, str, float]
+
+
+class OutputStreamCache:
+    def __init__(self, *, idle_seconds: float = 5.0, callback: bool = False):
+        self.idle_seconds = idle_seconds
+        self.callback = callback
+        self._streams: dict[int | None, tuple[tuple[int, int, int], Any]] = {}
+        self._last_used: dict[int | None, float] = {}
+
+    def open(
+        self,
+        pyaudio_instance: Any,
+        output_device: AudioDevice | None,
+        *,
+        rate: int,
+        channels: int,
+        sample_width: int,
+    ) -> Any:
+        device_index = output_device.index if output_device else None
+        audio_format = (rate, channels, sample_width)
+        cached = self._streams.get(device_index)
+        if cached is not None and self.callback:
+            cached[1].set_source(rate, channels, sample_width)
+            return cached[1]
+        if cached is not None and cached[0] == audio_format:
+            return cached[1]
+        if cached is not None:
+            self._close(device_index)
+        if self.callback:
+            stream = CallbackOutputStream(pyaudio_instance, device_index=device_index, rate=rate, channels=channels)
+            stream.set_source(rate, channels, sample_width)
+        else:
+            stream = pyaudio_instance.open(
+                format=pyaudio_instance.get_format_from_width(sample_width),
+                channels=channels,
+                rate=rate,
+                output=True,
+                output_device_index=device_index,
+            )
+        self._streams[device_index] = (audio_format, stream)
+        OUTPUT_STREAM_OPENS.inc()
+        logger.info(
+            "output_stream_opened device=%s rate=%s channels=%s",
+            output_device.name if output_device else "default",
+            rate,
+            channels,
+        )
+        return stream
+
+    def release(self, stream: Any) -> None:
+        for device_index, (_, cached) in list(self._streams.items()):
+            if cached is stream:
+                if self.callback:
+                    stream.end_clip()
+                self._last_used[device_index] = time.monotonic()
+                if self.idle_seconds <= 0:
+                    self._close(device_index)
+
+    def discard(self, stream: Any) -> None:
+        for device_index, (_, cached) in list(self._streams.items()):
+            if cached is stream:
+                self._close(device_index)
+
+    def close_idle(self) -> None:
+        now = time.monotonic()
+        for device_index, last_used in list(self._last_used.items()):
+            if now - last_used >= self.idle_seconds:
+                self._close(device_index)
+
+    def close_all(self) -> None:
+        for device_index in list(self._streams):
+            self._close(device_index)
+
+    def _close(self, device_index: int | None) -> None:
+        _, stream = self._streams.pop(device_index)
+        self._last_used.pop(device_index, None)
+        try:
+            stream.stop_stream()
+            stream.close()
+        except Exception as exc:
+            logger.debug("output_stream_close_failed error=%s", exc)
+        logger.info("output_stream_closed device=%s", device_index if device_index is not None else "default")
+
+    def __len__(self) -> int:
+        return len(self._streams)
+
 
 class AudioPlayer:
-    def __init__(self) -> None:
-        self._queue: queue.PriorityQueue[tuple[int, tuple[bytes | None, AudioDevice | None]]] = queue.PriorityQueue()
-        self._sequence = 0
-        self._sequence_lock = threading.Lock()
+    def __init__(
+        self,
+        *,
+        jitter_ms: int = 120,
+        max_queue: int = 0,
+        overflow_policy: str = "drop_oldest",
+        max_staleness_ms: int = 0,
+        idle_close_seconds: float = 5.0,
+        engine: str = "blocking",
+        on_status_changed: Callable[[str], None] | None = None,
+        name: str = "main",
+    ) -> None:
+        self.name = name
+        self.jitter_ms = jitter_ms
+        self._streams = OutputStreamCache(idle_seconds=idle_close_seconds, callback=engine == "callback")
+        self.max_staleness_ms = max_staleness_ms
+        self.on_status_changed = on_status_changed
+        self._queue: BoundedWorkQueue[PlaybackItem | None] = BoundedWorkQueue(max_queue, policy=overflow_policy)
+        self._stopping = threading.Event()
         self._thread: threading.Thread | None = None
         self._is_running = False
         self._pyaudio_instance: Any | None = None
@@ -26,48 +143,82 @@ class AudioPlayer:
             return
         pyaudio = _load_pyaudio()
         self._pyaudio_instance = pyaudio.PyAudio()
+        self._stopping.clear()
         self._is_running = True
         self._thread = threading.Thread(target=self._worker, daemon=True)
         self._thread.start()
         logger.info("playback_started")
 
-    def enqueue(self, audio_bytes: bytes, output_device: AudioDevice | None = None) -> None:
-        if not self._is_running:
-            self.start()
-        self._queue.put((self._next_sequence(), (audio_bytes, output_device)))
+    def enqueue(self, audio_bytes: bytes, output_device: AudioDevice | None = None, trace_id: str = "") -> None:
+        self._offer((audio_bytes, output_device, trace_id, time.perf_counter()))
+
+    def enqueue_stream(
+        self,
+        chunks: Iterable[bytes],
+        output_device: AudioDevice | None = None,
+        trace_id: str = "",
+    ) -> None:
+        self._offer((chunks, output_device, trace_id, time.perf_counter()))
 
     def stop(self) -> None:
         if not self._is_running:
             return
         self._is_running = False
-        self._queue.put((self._next_sequence(), (None, None)))
+        self._stopping.set()
+        self._queue.put(None)
         if self._thread:
             self._thread.join(timeout=5)
         self._cleanup()
         logger.info("playback_stopped")
 
+    def _offer(self, item: PlaybackItem) -> None:
+        if not self._is_running:
+            self.start()
+        _, dropped = self._queue.offer(item, abort=self._stopping)
+        PLAYBACK_QUEUE_DEPTH.set(self._queue.pending(), session=self.name)
+        self._drop(dropped, reason="overflow")
+
     def _worker(self) -> None:
         while True:
-            _, (audio_bytes, output_device) = self._queue.get()
             try:
-                if audio_bytes is None:
+                item = self._queue.get(timeout=self._streams.idle_seconds if self._streams else None)
+            except Empty:
+                self._streams.close_idle()
+                continue
+            PLAYBACK_QUEUE_DEPTH.set(self._queue.pending(), session=self.name)
+            try:
+                if item is None:
                     return
-                self._play_audio_bytes(audio_bytes, output_device)
+                audio_bytes, output_device, trace_id, enqueued_at = item
+                waited = time.perf_counter() - enqueued_at
+                if self.max_staleness_ms and waited * 1000 > self.max_staleness_ms:
+                    self._drop([item], reason="stale")
+                    continue
+                PLAYBACK_QUEUE_SECONDS.observe(waited)
+                tracer = get_tracer()
+                tracer.record(trace_id, "playback_queue_wait", enqueued_at)
+                started = time.perf_counter()
+                if isinstance(audio_bytes, (bytes, bytearray, memoryview)):
+                    self._play_audio_bytes(audio_bytes, output_device, trace_id)
+                else:
+                    self._play_audio_stream(audio_bytes, output_device, trace_id)
+                tracer.record(trace_id, "playback", started)
             finally:
                 self._queue.task_done()
 
-    def _play_audio_bytes(self, audio_bytes: bytes, output_device: AudioDevice | None) -> None:
+    def _play_audio_bytes(self, audio_bytes: bytes, output_device: AudioDevice | None, trace_id: str = "") -> None:
         if self._pyaudio_instance is None:
             return
 
+        stream = None
         try:
-            with wave.open(BytesIO(audio_bytes), "rb") as wav_file:
-                stream = self._pyaudio_instance.open(
-                    format=self._pyaudio_instance.get_format_from_width(wav_file.getsampwidth()),
-                    channels=wav_file.getnchannels(),
+            with wave.open(BytesIO(decode_to_wav(audio_bytes)), "rb") as wav_file:
+                stream = self._streams.open(
+                    self._pyaudio_instance,
+                    output_device,
                     rate=wav_file.getframerate(),
-                    output=True,
-                    output_device_index=output_device.index if output_device else None,
+                    channels=wav_file.getnchannels(),
+                    sample_width=wav_file.getsampwidth(),
                 )
                 logger.info(
                     "playback_started device=%s rate=%s channels=%s",
@@ -76,26 +227,110 @@ class AudioPlayer:
                     wav_file.getnchannels(),
                 )
                 data = wav_file.readframes(1024)
+                if data:
+                    stream.write(data)
+                    get_tracer().finish_trace(trace_id)
+                    data = wav_file.readframes(1024)
                 while data:
                     stream.write(data)
                     data = wav_file.readframes(1024)
-                stream.stop_stream()
-                stream.close()
+                self._streams.release(stream)
+                PLAYBACKS.inc(streamed="false", outcome="completed")
                 logger.info("playback_completed")
         except Exception as exc:
+            if stream is not None:
+                self._streams.discard(stream)
+            PLAYBACKS.inc(streamed="false", outcome="failed")
             logger.error("playback_failed error=%s", exc)
 
-    def _next_sequence(self) -> int:
-        with self._sequence_lock:
-            self._sequence += 1
-            return self._sequence
+    def _play_audio_stream(self, chunks: Iterable[bytes], output_device: AudioDevice | None, trace_id: str = "") -> None:
+        if self._pyaudio_instance is None:
+            return
+
+        parser = WavStreamParser()
+        pending = bytearray()
+        stream = None
+        prebuffer = 0
+        frame_size = 1
+        try:
+            chunks = iter(chunks)
+            first = next(chunks, b"")
+            if is_compressed_audio(first):
+                self._play_audio_bytes(b"".join(chain([first], chunks)), output_device, trace_id)
+                return
+            for chunk in chain([first], chunks):
+                pending += parser.feed(chunk)
+                if parser.format is None:
+                    continue
+                if stream is None:
+                    prebuffer = parser.format.bytes_for_ms(self.jitter_ms)
+                    frame_size = parser.format.frame_size
+                    if len(pending) < prebuffer:
+                        continue
+                    stream = self._open_stream_for(parser, output_device)
+                writable = len(pending) - len(pending) % frame_size
+                if writable:
+                    stream.write(bytes(pending[:writable]))
+                    del pending[:writable]
+                    get_tracer().finish_trace(trace_id)
+            if parser.format is None:
+                raise ValueError("streamed payload ended before the WAV header")
+            if stream is None:
+                stream = self._open_stream_for(parser, output_device)
+            if pending:
+                stream.write(bytes(pending[: len(pending) - len(pending) % frame_size]))
+            self._streams.release(stream)
+            PLAYBACKS.inc(streamed="true", outcome="completed")
+            logger.info("playback_completed streamed=true")
+        except Exception as exc:
+            if stream is not None:
+                self._streams.discard(stream)
+            PLAYBACKS.inc(streamed="true", outcome="failed")
+            logger.error("playback_failed streamed=true error=%s", exc)
+
+    def _open_stream_for(self, parser: WavStreamParser, output_device: AudioDevice | None) -> Any:
+        wav_format = parser.format
+        stream = self._streams.open(
+            self._pyaudio_instance,
+            output_device,
+            rate=wav_format.sample_rate,
+            channels=wav_format.channels,
+            sample_width=wav_format.sample_width,
+        )
+        logger.info(
+            "playback_started device=%s rate=%s channels=%s streamed=true",
+            output_device.name if output_device else "default",
+            wav_format.sample_rate,
+            wav_format.channels,
+        )
+        return stream
+
+    def _drop(self, dropped: list[PlaybackItem], *, reason: str) -> None:
+        if not dropped:
+            return
+        for audio, _, _, _ in dropped:
+            if not isinstance(audio, (bytes, bytearray, memoryview)) and hasattr(audio, "read_all"):
+                threading.Thread(target=_drain_stream, args=(audio,), daemon=True).start()
+        depth = self._queue.pending()
+        PLAYBACK_DROPPED.inc(len(dropped), reason=reason)
+        logger.warning("playback_dropped reason=%s count=%s depth=%s", reason, len(dropped), depth)
+        if self.on_status_changed:
+            self.on_status_changed(f"Playback backlog: dropped {len(dropped)} {reason} clip(s), {depth} queued.")
 
     def _cleanup(self) -> None:
+        self._streams.close_all()
         if self._pyaudio_instance is not None:
             self._pyaudio_instance.terminate()
             self._pyaudio_instance = None
 
 
+def _drain_stream(audio: Any) -> None:
+    try:
+        audio.read_all()
+    except Exception as exc:
+        logger.debug("playback_drain_failed error=%s", exc)
+
+
 def _load_pyaudio() -> Any:
     try:
         import pyaudio
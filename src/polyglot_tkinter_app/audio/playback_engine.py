@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any
+
+import numpy as np
+
+from polyglot_tkinter_app.audio.buffers import SampleRing
+from polyglot_tkinter_app.metrics import get_registry
+
+logger = logging.getLogger(__name__)
+
+PA_CONTINUE = 0
+RING_SECONDS = 2.0
+WRITE_POLL_SECONDS = 0.005
+
+PLAYBACK_UNDERRUNS = get_registry().counter("polyglot_playback_underruns_total", "Output callbacks short of audio mid-clip")
+
+
+class LinearResampler:
+    def __init__(self, source_rate: int, target_rate: int, channels: int):
+        self.step = source_rate / target_rate
+        self._position = 0.0
+        self._tail = np.zeros((0, channels), dtype=np.float32)
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        if self.step == 1.0:
+            return samples
+        data = np.concatenate([self._tail, samples.astype(np.float32)])
+        if len(data) < 2:
+            self._tail = data
+            return data[:0]
+        positions = np.arange(self._position, len(data) - 1, self.step)
+        index = positions.astype(np.int64)
+        fraction = (positions - index)[:, None]
+        resampled = data[index] * (1.0 - fraction) + data[index + 1] * fraction
+        next_position = self._position + len(positions) * self.step
+        keep_from = min(int(next_position), len(data) - 1)
+        self._tail = data[keep_from:]
+        self._position = next_position - keep_from
+        return resampled
+
+
+def to_int16(pcm: bytes, sample_width: int) -> np.ndarray:
+    if sample_width == 2:
+        return np.frombuffer(pcm, dtype=np.int16)
+    if sample_width == 1:
+        return ((np.frombuffer(pcm, dtype=np.uint8).astype(np.int16) - 128) << 8).astype(np.int16)
+    if sample_width == 3:
+        return np.ascontiguousarray(np.frombuffer(pcm, dtype=np.uint8).reshape(-1, 3)[:, 1:]).view("<i2").reshape(-1)
+    if sample_width == 4:
+        return (np.frombuffer(pcm, dtype=np.int32) >> 16).astype(np.int16)
+    raise ValueError(f"unsupported sample width {sample_width}")
+
+
+def remix(samples: np.ndarray, channels: int) -> np.ndarray:
+    if samples.shape[1] == channels:
+        return samples
+    mono = samples.mean(axis=1, keepdims=True) if samples.shape[1] > 1 else samples
+    return np.repeat(mono, channels, axis=1)
+
+
+class CallbackOutputStream:
+    def __init__(
+        self,
+        pyaudio_instance: Any,
+        *,
+        device_index: int | None,
+        rate: int,
+        channels: int,
+        ring_seconds: float = RING_SECONDS,
+    ):
+        self.rate = rate
+        self.channels = channels
+        self.underruns = 0
+        self._ring = SampleRing(capacity_frames=int(rate * ring_seconds), channels=channels)
+        self._source: tuple[int, int, int] | None = None
+        self._resampler: LinearResampler | None = None
+        self._playing = False
+        self._closed = threading.Event()
+        self._stream = pyaudio_instance.open(
+            format=pyaudio_instance.get_format_from_width(2),
+            channels=channels,
+            rate=rate,
+            output=True,
+            output_device_index=device_index,
+            stream_callback=self._callback,
+        )
+
+    def set_source(self, rate: int, channels: int, sample_width: int) -> None:
+        source = (rate, channels, sample_width)
+        if source != self._source:
+            self._source = source
+            self._resampler = LinearResampler(rate, self.rate, self.channels)
+
+    def write(self, pcm: bytes) -> None:
+        source_rate, source_channels, sample_width = self._source or (self.rate, self.channels, 2)
+        if self._resampler is None:
+            self.set_source(source_rate, source_channels, sample_width)
+        samples = remix(to_int16(pcm, sample_width).reshape(-1, source_channels), self.channels)
+        samples = self._resampler.process(samples)
+        if samples.dtype != np.int16:
+            samples = np.clip(np.rint(samples), -32768, 32767).astype(np.int16)
+        self._playing = True
+        while len(samples) and not self._closed.is_set():
+            written = self._ring.write(samples)
+            samples = samples[written:]
+            if len(samples):
+                time.sleep(WRITE_POLL_SECONDS)
+
+    def end_clip(self) -> None:
+        self._playing = False
+
+    def stop_stream(self) -> None:
+        while len(self._ring) and not self._closed.is_set() and self._stream.is_active():
+            time.sleep(WRITE_POLL_SECONDS)
+        self._stream.stop_stream()
+
+    def close(self) -> None:
+        self._closed.set()
+        self._stream.close()
+        self._ring.clear()
+
+    def _callback(self, in_data: Any, frame_count: int, time_info: Any, status: Any) -> tuple[bytes, int]:
+        block = self._ring.read(frame_count)
+        if len(block) < frame_count:
+            if self._playing:
+                self.underruns += 1
+                PLAYBACK_UNDERRUNS.inc()
+            block = np.concatenate([block, np.zeros((frame_count - len(block), self.channels), dtype=np.int16)])
+        return block.tobytes(), PA_CONTINUE
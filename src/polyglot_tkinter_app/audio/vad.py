@@ -3,22 +3,113 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+import numpy as np
+
+from polyglot_tkinter_app.audio.buffers import PcmSegment, PcmSegmentBuffer
+from polyglot_tkinter_app.audio.capture import SAMPLE_WIDTH
+
 logger = logging.getLogger(__name__)
 
+SEGMENT_PREALLOCATE_SECONDS = 10
+
+
+class EnergyPreGate:
+    def __init__(
+        self,
+        *,
+        ratio: float = 2.5,
+        min_rms: float = 100.0,
+        max_zero_crossing_rate: float = 0.35,
+        adaptation: float = 0.05,
+    ):
+        self.ratio = ratio
+        self.min_rms = min_rms
+        self.max_zero_crossing_rate = max_zero_crossing_rate
+        self.adaptation = adaptation
+        self.noise_floor = min_rms / ratio
+        self.skipped_frames = 0
+        self._last_rms = np.zeros(0, dtype=np.float32)
+
+    @property
+    def threshold(self) -> float:
+        return max(self.min_rms, self.noise_floor * self.ratio)
+
+    def candidates(self, frames: np.ndarray) -> np.ndarray:
+        samples = frames.astype(np.float32)
+        rms = np.sqrt(np.mean(samples * samples, axis=1))
+        signs = np.signbit(frames)
+        zero_crossing_rate = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / max(1, frames.shape[1] - 1)
+        threshold = self.threshold
+        silent = (rms < threshold) | ((zero_crossing_rate > self.max_zero_crossing_rate) & (rms < 2 * threshold))
+        self.skipped_frames += int(np.count_nonzero(silent))
+        self._last_rms = rms
+        return ~silent
+
+    def adapt(self, speech: np.ndarray) -> None:
+        background = self._last_rms[~speech]
+        if background.size:
+            self.noise_floor += self.adaptation * (float(background.mean()) - self.noise_floor)
+
 
 class SpeechSegmenter:
-    def __init__(self, *, sample_rate: int, frame_duration_ms: int, aggressiveness: int):
+    def __init__(
+        self,
+        *,
+        sample_rate: int,
+        frame_duration_ms: int,
+        aggressiveness: int,
+        energy_gate: EnergyPreGate | None = None,
+        max_segment_ms: int = 0,
+        min_segment_ms: int = 0,
+        overlap_ms: int = 0,
+        early_cut: bool = True,
+    ):
         self.sample_rate = sample_rate
         self.frame_duration_ms = frame_duration_ms
+        self.energy_gate = energy_gate
         self._vad = _load_webrtcvad().Vad(aggressiveness)
-        self._buffer: list[bytes] = []
+        self._buffer = PcmSegmentBuffer(
+            capacity_bytes=sample_rate * SAMPLE_WIDTH * SEGMENT_PREALLOCATE_SECONDS,
+            sample_width=SAMPLE_WIDTH,
+        )
         self._silence_frames = 0
         self._flush_after_silence = max(1, int(1000 / frame_duration_ms))
+        self._max_frames = max(0, max_segment_ms // frame_duration_ms)
+        self._min_frames = min(max(1, min_segment_ms // frame_duration_ms), self._max_frames)
+        self._overlap_frames = max(0, min(overlap_ms // frame_duration_ms, self._min_frames - 1))
+        self._early_cut = early_cut
+        self._frame_energy: list[float] = []
+        self.last_frame_buffered = False
+        self.carried_pcm = b""
 
-    def accept_frame(self, frame_bytes: bytes) -> bytes | None:
-        if self._vad.is_speech(frame_bytes, self.sample_rate):
+    def accept_frame(self, frame_bytes: bytes) -> PcmSegment | None:
+        if self.energy_gate is not None:
+            frames = np.frombuffer(frame_bytes, dtype=np.int16).reshape(1, -1)
+            is_speech = self.classify_frames(frames)[0]
+        else:
+            is_speech = self._vad.is_speech(frame_bytes, self.sample_rate)
+        return self.accept_classified(frame_bytes, is_speech)
+
+    def classify_frames(self, frames: np.ndarray) -> list[bool]:
+        if self.energy_gate is None:
+            return [self._vad.is_speech(frame.tobytes(), self.sample_rate) for frame in frames]
+        candidates = self.energy_gate.candidates(frames)
+        speech = np.zeros(len(frames), dtype=bool)
+        for index in np.flatnonzero(candidates):
+            speech[index] = self._vad.is_speech(frames[index].tobytes(), self.sample_rate)
+        self.energy_gate.adapt(speech)
+        return speech.tolist()
+
+    def accept_classified(self, frame_bytes: bytes, is_speech: bool) -> PcmSegment | None:
+        self.last_frame_buffered = False
+        if is_speech:
             self._buffer.append(frame_bytes)
             self._silence_frames = 0
+            self.last_frame_buffered = True
+            if self._max_frames:
+                self._frame_energy.append(_rms(frame_bytes))
+                if len(self._frame_energy) >= self._max_frames:
+                    return self._cut(len(frame_bytes))
             return None
 
         if not self._buffer:
@@ -28,20 +119,44 @@ class SpeechSegmenter:
         if self._silence_frames < self._flush_after_silence:
             return None
 
-        segment = b"".join(self._buffer)
-        self._buffer.clear()
-        self._silence_frames = 0
-        logger.info("speech_segment_detected bytes=%s", len(segment))
+        segment = self._detach()
+        if segment is not None:
+            logger.info("speech_segment_detected bytes=%s", len(segment))
         return segment
 
-    def flush(self) -> bytes | None:
+    def flush(self) -> PcmSegment | None:
         if not self._buffer:
             return None
-        segment = b"".join(self._buffer)
-        self._buffer.clear()
+        return self._detach()
+
+    def _detach(self) -> PcmSegment | None:
+        segment = None
+        if len(self._buffer) > len(self.carried_pcm):
+            segment = self._buffer.detach()
+        else:
+            self._buffer.clear()
+        self._frame_energy.clear()
         self._silence_frames = 0
+        self.carried_pcm = b""
         return segment
 
+    def _cut(self, frame_size: int) -> PcmSegment:
+        cut = self._max_frames
+        if self._early_cut:
+            window = self._frame_energy[self._min_frames - 1 : self._max_frames]
+            cut = self._min_frames + int(np.argmin(window))
+        keep_from = cut - self._overlap_frames
+        segment = self._buffer.detach(cut * frame_size, carry_from=keep_from * frame_size)
+        self._frame_energy = self._frame_energy[keep_from:]
+        self.carried_pcm = bytes(segment.pcm[keep_from * frame_size :])
+        logger.info("speech_segment_cut bytes=%s carried_frames=%s", len(segment), len(self._frame_energy))
+        return segment
+
+
+def _rms(frame_bytes: bytes) -> float:
+    samples = np.frombuffer(frame_bytes, dtype=np.int16).astype(np.float32)
+    return float(np.sqrt(np.mean(samples * samples))) if samples.size else 0.0
+
 
 def _load_webrtcvad() -> Any:
     try:
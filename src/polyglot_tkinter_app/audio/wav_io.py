@@ -1,7 +1,23 @@
 from __future__ import annotations
 
+import struct
 import wave
+from dataclasses import dataclass
 from io import BytesIO
+from typing import Any
+
+import numpy as np
+
+WAV_HEADER_SIZE = 44
+STREAMING_DATA_SIZE = 0xFFFFFFFF
+
+UPLOAD_FORMATS = {
+    "wav": ("audio.wav", "audio/wav"),
+    "flac": ("audio.flac", "audio/flac"),
+    "opus": ("audio.opus", "audio/ogg; codecs=opus"),
+}
+_SOUNDFILE_FORMATS = {"flac": ("FLAC", "PCM_16"), "opus": ("OGG", "OPUS")}
+_COMPRESSED_MAGIC = (b"fLaC", b"OggS")
 
 
 def pcm_to_wav_bytes(
@@ -18,3 +34,165 @@ def pcm_to_wav_bytes(
         wav_file.setframerate(sample_rate)
         wav_file.writeframes(pcm_bytes)
     return buffer.getvalue()
+
+
+def concat_wavs(first: bytes | memoryview, second: bytes | memoryview, *, gap_ms: int = 0) -> bytes | None:
+    try:
+        with wave.open(BytesIO(first), "rb") as head, wave.open(BytesIO(second), "rb") as tail:
+            channels, sample_width, sample_rate = head.getnchannels(), head.getsampwidth(), head.getframerate()
+            if (channels, sample_width, sample_rate) != (tail.getnchannels(), tail.getsampwidth(), tail.getframerate()):
+                return None
+            gap = bytes(int(sample_rate * gap_ms / 1000) * channels * sample_width)
+            pcm = head.readframes(head.getnframes()) + gap + tail.readframes(tail.getnframes())
+    except (wave.Error, EOFError):
+        return None
+    return pcm_to_wav_bytes(pcm, sample_rate=sample_rate, channels=channels, sample_width=sample_width)
+
+
+def wav_duration_ms(wav_bytes: bytes | memoryview) -> float | None:
+    try:
+        with wave.open(BytesIO(wav_bytes), "rb") as wav_file:
+            return wav_file.getnframes() * 1000 / wav_file.getframerate()
+    except (wave.Error, EOFError):
+        return None
+
+
+def wav_header(
+    *,
+    sample_rate: int = 16000,
+    channels: int = 1,
+    sample_width: int = 2,
+    data_size: int | None = None,
+) -> bytes:
+    if data_size is None:
+        riff_size = data_size = STREAMING_DATA_SIZE
+    else:
+        riff_size = min(WAV_HEADER_SIZE - 8 + data_size, STREAMING_DATA_SIZE)
+    block_align = channels * sample_width
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        riff_size,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,
+        channels,
+        sample_rate,
+        sample_rate * block_align,
+        block_align,
+        sample_width * 8,
+        b"data",
+        data_size,
+    )
+
+
+@dataclass(frozen=True)
+class WavFormat:
+    channels: int
+    sample_width: int
+    sample_rate: int
+
+    @property
+    def frame_size(self) -> int:
+        return self.channels * self.sample_width
+
+    def bytes_for_ms(self, milliseconds: int) -> int:
+        frames = int(self.sample_rate * milliseconds / 1000)
+        return frames * self.frame_size
+
+
+class WavStreamParser:
+    def __init__(self) -> None:
+        self.format: WavFormat | None = None
+        self._pending = bytearray()
+        self._in_data = False
+        self._remaining: int | None = None
+
+    def feed(self, chunk: bytes) -> bytes:
+        if self._in_data:
+            return self._take(chunk)
+        self._pending += chunk
+        if not self._parse_header():
+            return b""
+        data = bytes(self._pending)
+        self._pending.clear()
+        return self._take(data)
+
+    def _take(self, data: bytes) -> bytes:
+        if self._remaining is None:
+            return data
+        data = data[: self._remaining]
+        self._remaining -= len(data)
+        return data
+
+    def _parse_header(self) -> bool:
+        if len(self._pending) < 12:
+            return False
+        if self._pending[:4] != b"RIFF" or self._pending[8:12] != b"WAVE":
+            raise ValueError("stream is not a RIFF/WAVE payload")
+        offset = 12
+        while len(self._pending) >= offset + 8:
+            chunk_id = bytes(self._pending[offset : offset + 4])
+            (chunk_size,) = struct.unpack_from("<I", self._pending, offset + 4)
+            body = offset + 8
+            if chunk_id == b"data":
+                if self.format is None:
+                    raise ValueError("WAV data chunk precedes fmt chunk")
+                self._in_data = True
+                self._remaining = None if chunk_size == STREAMING_DATA_SIZE else chunk_size
+                del self._pending[:body]
+                return True
+            if len(self._pending) < body + chunk_size:
+                return False
+            if chunk_id == b"fmt ":
+                _, channels, sample_rate, _, _, bits = struct.unpack_from("<HHIIHH", self._pending, body)
+                self.format = WavFormat(channels=channels, sample_width=bits // 8, sample_rate=sample_rate)
+            offset = body + chunk_size + (chunk_size & 1)
+        return False
+
+
+def upload_format(codec: str) -> tuple[str, str]:
+    return UPLOAD_FORMATS.get(codec, UPLOAD_FORMATS["wav"])
+
+
+def encode_upload(wav_bytes: bytes | memoryview, codec: str) -> bytes | memoryview:
+    if codec not in _SOUNDFILE_FORMATS:
+        return wav_bytes
+    soundfile = _load_soundfile()
+    with wave.open(BytesIO(wav_bytes), "rb") as wav_file:
+        if wav_file.getsampwidth() != 2:
+            raise ValueError(f"{codec} upload needs 16-bit PCM, got {wav_file.getsampwidth() * 8}-bit")
+        channels = wav_file.getnchannels()
+        sample_rate = wav_file.getframerate()
+        pcm = wav_file.readframes(wav_file.getnframes())
+    container, subtype = _SOUNDFILE_FORMATS[codec]
+    buffer = BytesIO()
+    soundfile.write(
+        buffer,
+        np.frombuffer(pcm, dtype=np.int16).reshape(-1, channels),
+        sample_rate,
+        format=container,
+        subtype=subtype,
+    )
+    return buffer.getvalue()
+
+
+def is_compressed_audio(audio_bytes: bytes | memoryview) -> bool:
+    return bytes(audio_bytes[:4]) in _COMPRESSED_MAGIC
+
+
+def decode_to_wav(audio_bytes: bytes | memoryview) -> bytes | memoryview:
+    if not is_compressed_audio(audio_bytes):
+        return audio_bytes
+    samples, sample_rate = _load_soundfile().read(BytesIO(audio_bytes), dtype="int16", always_2d=True)
+    return pcm_to_wav_bytes(samples.tobytes(), sample_rate=sample_rate, channels=samples.shape[1])
+
+
+def _load_soundfile() -> Any:
+    try:
+        import soundfile
+
+        return soundfile
+    except ImportError as exc:
+        raise RuntimeError("soundfile is required for FLAC/Opus audio") from exc
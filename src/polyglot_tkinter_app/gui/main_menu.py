@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import threading
 import tkinter as tk
@@ -7,15 +8,18 @@ import webbrowser
 from tkinter import PhotoImage, ttk
 from typing import Any
 
+from polyglot_tkinter_app.api.async_client import AsyncTranslationClient
 from polyglot_tkinter_app.api.client import TranslationClient
+from polyglot_tkinter_app.api.event_loop import get_client_loop
+from polyglot_tkinter_app.api.keepalive import ConnectionWarmer
 from polyglot_tkinter_app.api.models import HealthStatus, TranslationResponse
-from polyglot_tkinter_app.audio.devices import AudioDevice, AudioDeviceRegistry
+from polyglot_tkinter_app.audio.devices import AudioDevice, AudioDeviceRegistry, DeviceSnapshot
 from polyglot_tkinter_app.audio.playback import AudioPlayer
 from polyglot_tkinter_app.gui.styles import center_window, color_title_bar, set_theme, setup_styles, toggle_theme
 from polyglot_tkinter_app.languages import TARGET_LANGUAGES
 from polyglot_tkinter_app.orchestration.translation_flow import TranslationFlow
 from polyglot_tkinter_app.paths import asset_path
-from polyglot_tkinter_app.settings.models import AppSettings, RuntimeState
+from polyglot_tkinter_app.settings.models import AppSettings, RuntimeState, TargetLane
 
 logger = logging.getLogger(__name__)
 
@@ -33,13 +37,20 @@ class MainMenu:
         runtime: RuntimeState,
         client: TranslationClient,
         health: HealthStatus,
+        async_client: AsyncTranslationClient | None = None,
+        registry: AudioDeviceRegistry | None = None,
+        images: dict[str, bytes] | None = None,
+        tray_image: Any | None = None,
     ):
         self.root = root
         self.settings = settings
         self.runtime = runtime
         self.client = client
+        self.async_client = async_client
         self.health = health
-        self.registry = AudioDeviceRegistry()
+        self.images = images or {}
+        self.registry = registry or AudioDeviceRegistry()
+        self.registry.on_change = self._threadsafe_devices_changed
         self.input_devices: list[AudioDevice] = self._safe_devices(self.registry.list_input_devices)
         self.output_devices: list[AudioDevice] = self._safe_devices(self.registry.list_output_devices)
         self.event_rows: list[str] = []
@@ -48,10 +59,13 @@ class MainMenu:
         self.flow = TranslationFlow(
             runtime=runtime,
             client=client,
-            player=AudioPlayer(),
+            player=self._create_player(),
             on_translation_completed=self._threadsafe_translation_completed,
             on_translation_failed=self._threadsafe_translation_failed,
             on_status_changed=self._threadsafe_status,
+            lane_player_factory=self._create_player,
+            connection_warmer=ConnectionWarmer.from_settings(client, settings, async_client=async_client),
+            async_client=async_client,
         )
 
         self.recording = tk.BooleanVar(value=False)
@@ -76,19 +90,22 @@ class MainMenu:
         self.status_label = None
         self.server_status = None
         self.record_button = None
+        self.input_menu = None
+        self.output_menu = None
         self.metric_labels: dict[str, ttk.Label] = {}
         self.event_log = None
         self.session_label = None
         self.email_entry = None
         self.subject_entry = None
         self.message_text = None
-        self.tray_icon_image = None
+        self.tray_icon_image = tray_image
         self.tray_icon = None
         self.tray_thread = None
 
         self._setup_window()
         self._setup_ui()
         self._apply_mode()
+        self.registry.start_monitor(settings.audio.device_refresh_seconds)
 
     def _setup_window(self) -> None:
         self.root.title(self.settings.gui.title)
@@ -132,7 +149,7 @@ class MainMenu:
         header.grid(column=0, row=0, columnspan=2, sticky=tk.EW)
         header.columnconfigure(1, weight=1)
 
-        self.logo = PhotoImage(file=asset_path("polyglot-logo.png")).subsample(4)
+        self.logo = self._photo("polyglot-logo.png").subsample(4)
         ttk.Label(header, image=self.logo).grid(column=0, row=0, sticky=tk.W, pady=10)
         ttk.Label(header, text="Dashboard", font=("", 24)).grid(column=1, row=0, sticky=tk.W, padx=(20, 0), pady=10)
 
@@ -166,7 +183,7 @@ class MainMenu:
         ttk.Label(settings_frame, text="Settings", font=("", 16)).grid(column=0, row=0, sticky=tk.W, pady=(28, 10))
 
         ttk.Label(settings_frame, text="Select Input Device:").grid(column=0, row=1, sticky=tk.W, padx=(0, 10), pady=8)
-        input_menu = ttk.Combobox(
+        input_menu = self.input_menu = ttk.Combobox(
             settings_frame,
             textvariable=self.input_var,
             values=[self._device_label(device) for device in self.input_devices],
@@ -225,7 +242,7 @@ class MainMenu:
         backend_menu.bind("<<ComboboxSelected>>", self._on_backend_selected)
 
         ttk.Label(self.demo_panel, text="Output Device").grid(column=1, row=0, sticky=tk.W, padx=8)
-        output_menu = ttk.Combobox(
+        output_menu = self.output_menu = ttk.Combobox(
             self.demo_panel,
             textvariable=self.output_var,
             values=[self._device_label(device) for device in self.output_devices],
@@ -331,7 +348,7 @@ class MainMenu:
         self.event_log.grid(column=0, row=6, columnspan=3, sticky=tk.EW, pady=(12, 0))
 
     def _setup_record_button(self) -> None:
-        self.record_icon = PhotoImage(file=asset_path("record-icon.png")).subsample(2)
+        self.record_icon = self._photo("record-icon.png").subsample(2)
         self.record_button = ttk.Button(
             self.main_frame,
             text="  Start Recording",
@@ -427,11 +444,11 @@ class MainMenu:
             self.recording.set(True)
             self.record_button.config(text="  Stop Recording")
             self._sync_runtime_from_ui()
-            threading.Thread(target=self.flow.start, daemon=True).start()
+            get_client_loop().submit(asyncio.to_thread(self.flow.start))
         else:
             self.recording.set(False)
             self.record_button.config(text="  Start Recording")
-            threading.Thread(target=self.flow.stop, daemon=True).start()
+            get_client_loop().submit(asyncio.to_thread(self.flow.stop))
 
     def _sync_runtime_from_ui(self) -> None:
         self.runtime.target_language = TARGET_LANGUAGES.get(self.language_var.get(), "eng")
@@ -542,6 +559,26 @@ class MainMenu:
     def _threadsafe_status(self, message: str) -> None:
         self.root.after(0, lambda: self.status_label.config(text=message))
 
+    def _threadsafe_devices_changed(self, snapshot: DeviceSnapshot) -> None:
+        self.root.after(0, self._on_devices_changed)
+
+    def _on_devices_changed(self) -> None:
+        self.input_devices = self._safe_devices(self.registry.list_input_devices)
+        self.output_devices = self._safe_devices(self.registry.list_output_devices)
+        if self.input_menu is not None:
+            self.input_menu.config(values=[self._device_label(device) for device in self.input_devices])
+        if self.output_menu is not None:
+            self.output_menu.config(values=[self._device_label(device) for device in self.output_devices])
+        if self.runtime.input_device not in self.input_devices:
+            self.runtime.input_device = self._safe_default(self.registry.get_default_input_device)
+            self.input_var.set(self._device_label(self.runtime.input_device))
+        if self.runtime.output_device not in self.output_devices:
+            self.runtime.output_device = self._safe_default(self.registry.get_default_output_device)
+            self.output_var.set(self._device_label(self.runtime.output_device))
+        self._select_lane_outputs()
+        self.flow.update_runtime(self.runtime)
+        self._add_event("Audio devices changed")
+
     def _on_translation_completed(self, response: TranslationResponse) -> None:
         self.status_label.config(text="Translated audio received.")
         self.metric_labels["Cache"].config(text=response.cache_status.upper())
@@ -575,12 +612,51 @@ class MainMenu:
             for row in self.event_rows:
                 self.event_log.insert(tk.END, row)
 
+    def _photo(self, name: str) -> PhotoImage:
+        if name in self.images:
+            return PhotoImage(data=self.images[name])
+        return PhotoImage(file=asset_path(name))
+
+    def _create_player(self, name: str = "main") -> AudioPlayer:
+        return AudioPlayer(
+            jitter_ms=self.settings.audio.playback_jitter_ms,
+            max_queue=self.settings.pipeline.playback_queue_size,
+            overflow_policy=self.settings.pipeline.overflow_policy,
+            max_staleness_ms=self.settings.pipeline.max_staleness_ms,
+            idle_close_seconds=self.settings.audio.output_idle_close_seconds,
+            engine=self.settings.audio.playback_engine,
+            on_status_changed=self._threadsafe_status,
+            name=name,
+        )
+
     def _select_initial_devices(self) -> None:
         self.runtime.input_device = self._safe_default(self.registry.get_default_input_device)
         if self.runtime.demo_enabled:
             self._select_default_demo_output()
         else:
             self._select_default_user_output()
+        self._select_lane_outputs()
+
+    def _select_lane_outputs(self) -> None:
+        self.runtime.extra_targets = [
+            TargetLane(
+                language=target.language,
+                speaker_id=target.speaker_id,
+                output_device=self._find_output_by_name(target.output_device),
+            )
+            for target in self.settings.pipeline.fanout_targets
+        ]
+        for lane in self.runtime.extra_targets:
+            logger.info("fanout_lane target=%s device=%s", lane.language, self._device_label(lane.output_device))
+
+    def _find_output_by_name(self, name: str) -> AudioDevice | None:
+        if not name:
+            return None
+        for device in self.output_devices:
+            if name.lower() in device.name.lower():
+                return device
+        logger.warning("fanout_device_missing name=%s fallback=default_output", name)
+        return None
 
     def _select_default_user_output(self) -> None:
         self.runtime.output_device = self._safe_default(self.registry.find_virtual_cable_output)
@@ -649,6 +725,7 @@ class MainMenu:
             "text_exact": "Text exact",
             "text_vector": "Text vector",
             "audio_vector": "Audio vector",
+            "client": "Client cache",
             "miss": "AI",
             "unknown": "Unknown",
         }
@@ -676,7 +753,10 @@ class MainMenu:
 
     def _close(self) -> None:
         try:
+            self.registry.stop_monitor()
             self.flow.shutdown()
+            if self.async_client is not None:
+                get_client_loop().submit(self.async_client.aclose())
         finally:
             self._stop_tray_icon()
             self.root.destroy()
@@ -696,7 +776,8 @@ class MainMenu:
             self._close()
             return
 
-        self.tray_icon_image = Image.open(asset_path("polyglot-icon.ico"))
+        if self.tray_icon_image is None:
+            self.tray_icon_image = Image.open(asset_path("polyglot-icon.ico"))
         self.tray_icon = Icon(
             "Polyglot App",
             self.tray_icon_image,
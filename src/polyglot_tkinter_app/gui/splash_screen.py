@@ -1,27 +1,44 @@
 from __future__ import annotations
 
 import logging
-import threading
 import tkinter as tk
 from tkinter import PhotoImage, ttk
+from typing import TYPE_CHECKING, Callable
 
-from polyglot_tkinter_app.api.client import TranslationClient
 from polyglot_tkinter_app.api.models import HealthStatus
-from polyglot_tkinter_app.gui.main_menu import MainMenu
+from polyglot_tkinter_app.app.startup import StartupOrchestrator, StartupResult
 from polyglot_tkinter_app.gui.styles import center_window, set_theme, setup_styles
 from polyglot_tkinter_app.paths import asset_path
 from polyglot_tkinter_app.settings.models import AppSettings, RuntimeState
 
+if TYPE_CHECKING:
+    from polyglot_tkinter_app.api.async_client import AsyncTranslationClient
+    from polyglot_tkinter_app.api.client import TranslationClient
+
 logger = logging.getLogger(__name__)
 
 
 class SplashScreen(tk.Tk):
-    def __init__(self, *, settings: AppSettings, runtime: RuntimeState, client: TranslationClient):
+    def __init__(
+        self,
+        *,
+        settings: AppSettings,
+        runtime: RuntimeState,
+        client_factory: Callable[[], TranslationClient],
+    ):
         super().__init__()
         self.settings = settings
         self.runtime = runtime
-        self.client = client
+        self.client_factory = client_factory
+        self.client: TranslationClient | None = None
+        self.async_client: AsyncTranslationClient | None = None
         self.health = HealthStatus(online=False)
+        self.startup_result = StartupResult()
+        self.startup = StartupOrchestrator(
+            settings,
+            client_factory=client_factory,
+            on_finished=lambda result: self.after(0, self._on_startup_finished, result),
+        )
 
         set_theme(settings)
         setup_styles()
@@ -38,7 +55,7 @@ class SplashScreen(tk.Tk):
         self.continue_button = None
         self._setup_ui()
 
-        threading.Thread(target=self._check_server_connection, daemon=True).start()
+        self.after_idle(self.startup.start)
 
     def _setup_ui(self) -> None:
         frame = ttk.Frame(self, padding=10)
@@ -63,20 +80,17 @@ class SplashScreen(tk.Tk):
         self.continue_button.pack_forget()
         self.progress.pack(pady=10, anchor="n", expand=True)
         self.progress.start(25)
-        threading.Thread(target=self._check_server_connection, daemon=True).start()
-
-    def _check_server_connection(self) -> None:
-        self.health = self.client.health()
-        logger.info(
-            "server_health_checked online=%s memory=%s mode=%s",
-            self.health.online,
-            self.health.semantic_memory_enabled,
-            self.health.semantic_memory_mode,
-        )
+        self.startup.retry_health()
+
+    def _on_startup_finished(self, result: StartupResult) -> None:
+        self.startup_result = result
+        self.client = result.client
+        self.async_client = result.async_client
+        self.health = result.health
         if self.health.online or self.settings.general.debug:
-            self.after(400, self._on_success)
+            self._on_success()
         else:
-            self.after(400, self._on_fail)
+            self._on_fail()
 
     def _on_success(self) -> None:
         self.progress.stop()
@@ -84,7 +98,7 @@ class SplashScreen(tk.Tk):
             self.status_label.config(text="Connection successful.")
         else:
             self.status_label.config(text="Server offline. Launching in debug mode.")
-        self.after(400, self._launch_main_menu)
+        self.after_idle(self._launch_main_menu)
 
     def _on_fail(self) -> None:
         self.progress.stop()
@@ -94,10 +108,27 @@ class SplashScreen(tk.Tk):
         self.continue_button.pack(pady=0, anchor="n", expand=True)
 
     def _launch_main_menu(self) -> None:
+        from polyglot_tkinter_app.api.async_client import AsyncTranslationClient
+        from polyglot_tkinter_app.gui.main_menu import MainMenu
+
+        if self.client is None:
+            self.client = self.client_factory()
+        if self.async_client is None:
+            self.async_client = AsyncTranslationClient.from_client(self.client)
         self.destroy()
         root = tk.Tk()
         root.withdraw()
-        MainMenu(root=root, settings=self.settings, runtime=self.runtime, client=self.client, health=self.health)
+        MainMenu(
+            root=root,
+            settings=self.settings,
+            runtime=self.runtime,
+            client=self.client,
+            async_client=self.async_client,
+            health=self.health,
+            registry=self.startup_result.registry,
+            images=self.startup_result.images,
+            tray_image=self.startup_result.tray_image,
+        )
         root.mainloop()
 
     def _window_size(self) -> tuple[int, int]:
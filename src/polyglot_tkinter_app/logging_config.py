@@ -1,31 +1,120 @@
+import copy
+import json
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import re
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
+from polyglot_tkinter_app.metrics import get_registry
 from polyglot_tkinter_app.paths import ensure_runtime_dirs
 from polyglot_tkinter_app.settings.models import AppSettings
 
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+EVENT_NAME = re.compile(r"[a-z][a-z0-9_]*$")
+EVENT_FIELD = re.compile(r"(\w+)=(.*?)(?= \w+=|$)")
 
-def setup_logger(settings: AppSettings) -> None:
+LOG_RECORDS_DROPPED = get_registry().counter("polyglot_log_records_dropped_total", "Log records dropped on a full queue")
+
+
+class BoundedQueueHandler(QueueHandler):
+    def __init__(self, log_queue: queue.Queue, *, overflow: str = "drop"):
+        super().__init__(log_queue)
+        self.overflow = overflow
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.overflow == "block":
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_RECORDS_DROPPED.inc(level=record.levelname)
+
+
+class LogListener(QueueListener):
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.getMessage()
+        payload = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+        }
+        event, _, rest = message.partition(" ")
+        if EVENT_NAME.match(event):
+            fields = {name: value for name, value in EVENT_FIELD.findall(rest) if name not in payload}
+            payload.update(event=event, **fields)
+        else:
+            payload.update(event="", message=message)
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False)
+
+
+_listener: LogListener | None = None
+_queue_handler: BoundedQueueHandler | None = None
+
+
+def setup_logger(settings: AppSettings) -> LogListener:
+    global _listener, _queue_handler
     ensure_runtime_dirs()
+    shutdown_logger()
 
+    general = settings.general
     root = logging.getLogger()
-    root.setLevel(logging.DEBUG if settings.general.debug else logging.INFO)
+    root.setLevel(logging.DEBUG if general.debug else logging.INFO)
     root.handlers.clear()
 
-    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    formatter = JsonFormatter() if general.log_format == "json" else logging.Formatter(TEXT_FORMAT)
 
     console = logging.StreamHandler()
     console.setLevel(logging.INFO)
     console.setFormatter(formatter)
-    root.addHandler(console)
+    handlers: list[logging.Handler] = [console]
 
-    if settings.general.save_logs:
+    if general.save_logs:
         file_handler = RotatingFileHandler(
-            settings.general.log_file,
+            general.log_file,
             maxBytes=10_485_760,
             backupCount=5,
             encoding="utf-8",
         )
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
-        root.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    log_queue: queue.Queue = queue.Queue(maxsize=general.log_queue_size)
+    _queue_handler = BoundedQueueHandler(log_queue, overflow=general.log_overflow)
+    root.addHandler(_queue_handler)
+    _listener = LogListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def shutdown_logger() -> None:
+    global _listener, _queue_handler
+    if _listener is None:
+        return
+    root = logging.getLogger()
+    root.removeHandler(_queue_handler)
+    for handler in _listener.handlers:
+        if not isinstance(handler, logging.FileHandler):
+            root.addHandler(handler)
+    _listener.stop()
+    for handler in _listener.handlers:
+        if isinstance(handler, logging.FileHandler):
+            handler.close()
+    _listener = None
+    _queue_handler = None
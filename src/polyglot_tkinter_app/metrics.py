@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+from polyglot_tkinter_app.settings.models import MetricsSettings
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelKey = tuple[tuple[str, str], ...]
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help_text = help_text
+        self._values: dict[LabelKey, Any] = {}
+        self._lock = threading.Lock()
+
+    def samples(self) -> list[tuple[str, LabelKey, float]]:
+        with self._lock:
+            return [(self.name, key, float(value)) for key, value in sorted(self._values.items())]
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        with self._lock:
+            return [{"labels": dict(key), "value": value} for key, value in sorted(self._values.items())]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        with self._lock:
+            return self._values.get(_label_key(labels), 0.0)
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, value: float, **labels: Any) -> None:
+        with self._lock:
+            self._values[_label_key(labels)] = value
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        super().__init__(name, help_text)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = _label_key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = {"counts": [0] * (len(self.buckets) + 1), "sum": 0.0, "count": 0}
+            state["counts"][index] += 1
+            state["sum"] += value
+            state["count"] += 1
+
+    def samples(self) -> list[tuple[str, LabelKey, float]]:
+        rows = []
+        with self._lock:
+            for key, state in sorted(self._values.items()):
+                cumulative = 0
+                for bound, count in zip((*self.buckets, float("inf")), state["counts"]):
+                    cumulative += count
+                    rows.append((f"{self.name}_bucket", key + (("le", _format_bound(bound)),), float(cumulative)))
+                rows.append((f"{self.name}_sum", key, state["sum"]))
+                rows.append((f"{self.name}_count", key, float(state["count"])))
+        return rows
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        bounds = [_format_bound(bound) for bound in (*self.buckets, float("inf"))]
+        with self._lock:
+            return [
+                {
+                    "labels": dict(key),
+                    "buckets": dict(zip(bounds, state["counts"])),
+                    "sum": state["sum"],
+                    "count": state["count"],
+                }
+                for key, state in sorted(self._values.items())
+            ]
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help_text: str) -> Counter:
+        return self._register(Counter, name, help_text)
+
+    def gauge(self, name: str, help_text: str) -> Gauge:
+        return self._register(Gauge, name, help_text)
+
+    def histogram(self, name: str, help_text: str, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram, name, help_text, buckets)
+
+    def render_prometheus(self) -> str:
+        lines = []
+        for metric in self._sorted_metrics():
+            lines.append(f"# HELP {metric.name} {metric.help_text}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, key, value in metric.samples():
+                lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "timestamp": time.time(),
+            "metrics": {
+                metric.name: {"type": metric.kind, "help": metric.help_text, "samples": metric.snapshot()}
+                for metric in self._sorted_metrics()
+            },
+        }
+
+    def _register(self, kind: type, name: str, help_text: str, *args: Any) -> Any:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = kind(name, help_text, *args)
+            elif type(metric) is not kind:
+                raise ValueError(f"metric {name} is already registered as a {metric.kind}")
+            return metric
+
+    def _sorted_metrics(self) -> list[_Metric]:
+        with self._lock:
+            return [self._metrics[name] for name in sorted(self._metrics)]
+
+
+class MetricsServer:
+    def __init__(self, registry: MetricsRegistry, *, host: str = "127.0.0.1", port: int = 9464):
+        self.registry = registry
+        self._server = ThreadingHTTPServer((host, port), _metrics_handler(registry))
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def address(self) -> tuple[str, int]:
+        return self._server.server_address[:2]
+
+    def start(self) -> None:
+        self._thread.start()
+        logger.info("metrics_server_started host=%s port=%s", *self.address)
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class SnapshotWriter:
+    def __init__(self, registry: MetricsRegistry, path: Path | str, *, interval_seconds: float = 15.0):
+        self.registry = registry
+        self.path = Path(path)
+        self.interval_seconds = interval_seconds
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self._thread.join(timeout=5)
+        self.write()
+
+    def write(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        temporary.write_text(json.dumps(self.registry.snapshot(), indent=2), encoding="utf-8")
+        os.replace(temporary, self.path)
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval_seconds):
+            try:
+                self.write()
+            except OSError as exc:
+                logger.warning("metrics_snapshot_failed error=%s", exc)
+
+
+class MetricsExporters:
+    def __init__(self, server: MetricsServer | None = None, writer: SnapshotWriter | None = None):
+        self.server = server
+        self.writer = writer
+
+    def stop(self) -> None:
+        if self.server is not None:
+            self.server.stop()
+        if self.writer is not None:
+            self.writer.stop()
+
+
+_registry = MetricsRegistry()
+
+
+def get_registry() -> MetricsRegistry:
+    return _registry
+
+
+def start_metrics_exporters(settings: MetricsSettings) -> MetricsExporters:
+    exporters = MetricsExporters()
+    if settings.http_enabled:
+        try:
+            exporters.server = MetricsServer(_registry, host=settings.host, port=settings.port)
+            exporters.server.start()
+        except OSError as exc:
+            logger.warning("metrics_server_failed host=%s port=%s error=%s", settings.host, settings.port, exc)
+            exporters.server = None
+    if settings.snapshot_enabled:
+        exporters.writer = SnapshotWriter(
+            _registry,
+            settings.snapshot_path,
+            interval_seconds=settings.snapshot_interval_seconds,
+        )
+        exporters.writer.start()
+    return exporters
+
+
+def _metrics_handler(registry: MetricsRegistry) -> type[BaseHTTPRequestHandler]:
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            path = self.path.split("?", 1)[0].rstrip("/")
+            if path in ("", "/metrics"):
+                body = registry.render_prometheus().encode("utf-8")
+                content_type = "text/plain; version=0.0.4; charset=utf-8"
+            elif path == "/metrics.json":
+                body = json.dumps(registry.snapshot()).encode("utf-8")
+                content_type = "application/json"
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.debug("metrics_request " + format, *args)
+
+    return MetricsHandler
+
+
+def _label_key(labels: dict[str, Any]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(key: LabelKey) -> str:
+    if not key:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in key) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(float(bound))
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
@@ -3,27 +3,83 @@ from __future__ import annotations
 import json
 import logging
 import threading
-from dataclasses import dataclass
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, replace
 from pathlib import Path
-from queue import Empty, Queue
-from typing import Callable
+from queue import Empty
+from typing import TYPE_CHECKING, Callable
 
 from polyglot_tkinter_app.api.client import TranslationClient
+from polyglot_tkinter_app.api.event_loop import get_client_loop
+from polyglot_tkinter_app.api.keepalive import ConnectionWarmer
 from polyglot_tkinter_app.api.models import TranslationRequest, TranslationResponse
-from polyglot_tkinter_app.audio.capture import AudioCapture
+from polyglot_tkinter_app.audio.buffers import FrameRing, PcmSegment
+from polyglot_tkinter_app.audio.capture import SAMPLE_WIDTH, AudioCapture
+from polyglot_tkinter_app.audio.pcm_stream import PcmStream
 from polyglot_tkinter_app.audio.playback import AudioPlayer
-from polyglot_tkinter_app.audio.vad import SpeechSegmenter
-from polyglot_tkinter_app.audio.wav_io import pcm_to_wav_bytes
+from polyglot_tkinter_app.audio.vad import EnergyPreGate, SpeechSegmenter
+from polyglot_tkinter_app.audio.wav_io import concat_wavs, encode_upload, pcm_to_wav_bytes, wav_duration_ms
+from polyglot_tkinter_app.metrics import get_registry
 from polyglot_tkinter_app.paths import HEADERS_DIR, OUTPUTS_DIR
-from polyglot_tkinter_app.settings.models import RuntimeState
+from polyglot_tkinter_app.settings.models import RuntimeState, TargetLane
+from polyglot_tkinter_app.tracing import get_tracer
+from polyglot_tkinter_app.work_queue import BoundedWorkQueue
+
+if TYPE_CHECKING:
+    from polyglot_tkinter_app.api.async_client import AsyncTranslationClient
 
 logger = logging.getLogger(__name__)
 
+FRAME_RING_SECONDS = 5
+SEGMENTER_POLL_SECONDS = 0.1
+
+SEGMENTS = get_registry().counter("polyglot_segments_total", "Segments queued for translation by reason")
+WORK_QUEUE_DEPTH = get_registry().gauge(
+    "polyglot_work_queue_depth", "Segments waiting for a translation worker by session"
+)
+REORDER_PENDING = get_registry().gauge(
+    "polyglot_reorder_pending", "Finished translations held for in-order delivery by session"
+)
+TRANSLATION_FAILURES = get_registry().counter("polyglot_translation_failures_total", "Failed translations")
+FRAMES_DROPPED = get_registry().counter("polyglot_frames_dropped_total", "Capture frames dropped by the frame ring")
+WORK_DROPPED = get_registry().counter("polyglot_work_dropped_total", "Queued segments discarded by reason")
+WORK_COALESCED = get_registry().counter("polyglot_work_coalesced_total", "Segments merged into queued work")
+
 
 @dataclass(frozen=True)
 class TranslationWork:
-    wav_bytes: bytes
+    wav_bytes: bytes | memoryview
     reason: str
+    stream: PcmStream | None = None
+    sequence: int = 0
+    trace_id: str = ""
+    enqueued_at: float = 0.0
+    segments: int = 1
+    runtime_key: tuple = ()
+    lane_sequences: tuple[tuple[TargetLane, int], ...] = ()
+    segment: PcmSegment | None = None
+
+
+class ReorderBuffer:
+    def __init__(self):
+        self._next = 1
+        self._ready: dict[int, Callable[[], None] | None] = {}
+        self._lock = threading.Lock()
+
+    def deliver(self, sequence: int, action: Callable[[], None] | None) -> int:
+        with self._lock:
+            self._ready[sequence] = action
+            while self._next in self._ready:
+                ready_action = self._ready.pop(self._next)
+                self._next += 1
+                if ready_action is not None:
+                    ready_action()
+            return len(self._ready)
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._ready)
 
 
 class TranslationFlow:
@@ -36,22 +92,48 @@ class TranslationFlow:
         on_translation_completed: Callable[[TranslationResponse], None] | None = None,
         on_translation_failed: Callable[[Exception], None] | None = None,
         on_status_changed: Callable[[str], None] | None = None,
+        lane_player_factory: Callable[[str], AudioPlayer] | None = None,
+        connection_warmer: ConnectionWarmer | None = None,
+        async_client: AsyncTranslationClient | None = None,
+        name: str = "main",
     ):
+        self.name = name
         self.runtime = runtime
         self.client = client
+        self.async_client = async_client
         self.player = player
+        self.lane_player_factory = lane_player_factory
+        self.connection_warmer = connection_warmer
         self.on_translation_completed = on_translation_completed
         self.on_translation_failed = on_translation_failed
         self.on_status_changed = on_status_changed
         self._stop_event = threading.Event()
         self._shutdown_event = threading.Event()
-        self._work_queue: Queue[TranslationWork | None] = Queue()
+        pipeline = runtime.settings.pipeline
+        self._work_queue: BoundedWorkQueue[TranslationWork | None] = BoundedWorkQueue(
+            pipeline.work_queue_size,
+            policy=pipeline.overflow_policy,
+        )
         self._capture_thread: threading.Thread | None = None
-        self._worker_thread: threading.Thread | None = None
+        self._segmenter_thread: threading.Thread | None = None
+        self._frame_ring: FrameRing | None = None
+        self._worker_threads: list[threading.Thread] = []
         self._worker_lock = threading.Lock()
+        self._sequence = 0
+        self._sequence_lock = threading.Lock()
+        self._reorder = ReorderBuffer()
+        self._lane_sequences: dict[TargetLane, int] = {}
+        self._lane_reorder: dict[TargetLane, ReorderBuffer] = {}
         self._segmenter: SpeechSegmenter | None = None
+        self._pcm_stream: PcmStream | None = None
+        self._segment_trace: str | None = None
+        self._lane_players: dict[TargetLane, AudioPlayer] = {}
+        self._fanout_pools: dict[TargetLane, ThreadPoolExecutor] = {}
+        self._lane_futures: set[Future] = set()
+        self._fanout_lock = threading.Lock()
         self._running = False
-        self.last_input_wav_bytes: bytes | None = None
+        self.last_input_wav_bytes: bytes | memoryview | None = None
+        self._last_input_segment: PcmSegment | None = None
         self.last_output_wav_bytes: bytes | None = None
 
     def start(self) -> None:
@@ -65,13 +147,32 @@ class TranslationFlow:
 
         self._running = True
         self._stop_event.clear()
+        if self.connection_warmer is not None:
+            self.connection_warmer.session_started()
         self.player.start()
+        audio = self.runtime.settings.audio
+        energy_gate = None
+        if audio.energy_gate:
+            energy_gate = EnergyPreGate(ratio=audio.energy_gate_ratio, min_rms=audio.energy_gate_min_rms)
         self._segmenter = SpeechSegmenter(
-            sample_rate=self.runtime.settings.audio.sample_rate,
-            frame_duration_ms=self.runtime.settings.audio.frame_duration_ms,
-            aggressiveness=self.runtime.settings.audio.vad_aggressiveness,
+            sample_rate=audio.sample_rate,
+            frame_duration_ms=audio.frame_duration_ms,
+            aggressiveness=audio.vad_aggressiveness,
+            energy_gate=energy_gate,
+            max_segment_ms=audio.max_segment_ms,
+            min_segment_ms=audio.min_segment_ms,
+            overlap_ms=audio.segment_overlap_ms,
+            early_cut=not self.runtime.settings.api.streaming_upload,
         )
-        self._ensure_worker()
+        self._frame_ring = None
+        if audio.segmenter_mode == "batched":
+            self._frame_ring = FrameRing(
+                capacity_frames=int(FRAME_RING_SECONDS * 1000 / audio.frame_duration_ms),
+                frame_samples=int(audio.sample_rate * audio.frame_duration_ms / 1000),
+            )
+            self._segmenter_thread = threading.Thread(target=self._run_segmenter, daemon=True)
+            self._segmenter_thread.start()
+        self._ensure_workers()
         self._capture_thread = threading.Thread(target=self._run_capture, daemon=True)
         self._capture_thread.start()
         self._status("Recording...")
@@ -80,44 +181,63 @@ class TranslationFlow:
         was_running = self._running
         self._running = False
         self._stop_event.set()
+        if self._capture_thread:
+            self._capture_thread.join(timeout=5)
+        if self._segmenter_thread:
+            self._segmenter_thread.join(timeout=5)
+            self._segmenter_thread = None
         if was_running and self._segmenter:
             final_segment = self._segmenter.flush()
-            if final_segment:
+            if self._pcm_stream is not None:
+                self._finish_stream(final_segment)
+            elif final_segment:
                 self._submit_pcm(final_segment, reason="flush")
-        if self._capture_thread:
-            self._capture_thread.join(timeout=5)
-        if self._worker_thread and self._worker_thread.is_alive():
-            self._work_queue.put(None)
-            self._worker_thread.join()
+        workers = self._live_workers()
+        if workers:
+            for _ in workers:
+                self._work_queue.put(None)
+            for worker in workers:
+                worker.join()
         else:
             self._discard_pending_work()
-        self.player.stop()
+        self._drain_fanout()
+        self._stop_players()
+        if was_running and self.connection_warmer is not None:
+            self.connection_warmer.session_stopped()
         self._status("Recording stopped.")
 
     def shutdown(self) -> None:
+        was_running = self._running
         self._shutdown_event.set()
         self._running = False
         self._stop_event.set()
         self._discard_pending_work()
-        if self._worker_thread and self._worker_thread.is_alive():
+        if self._pcm_stream is not None:
+            self._pcm_stream.close()
+            self._pcm_stream = None
+        workers = self._live_workers()
+        for _ in workers:
             self._work_queue.put(None)
         if self._capture_thread:
             self._capture_thread.join(timeout=5)
-        if self._worker_thread:
-            self._worker_thread.join(timeout=0.25)
-        self.player.stop()
+        for worker in workers:
+            worker.join(timeout=0.25)
+        with self._fanout_lock:
+            pools, self._fanout_pools = self._fanout_pools, {}
+            futures = list(self._lane_futures)
+        for pool in pools.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+        for future in futures:
+            future.cancel()
+        self._stop_players()
+        if was_running and self.connection_warmer is not None:
+            self.connection_warmer.session_stopped()
 
     def update_runtime(self, runtime: RuntimeState) -> None:
         self.runtime = runtime
 
-    def submit_wav(self, wav_bytes: bytes, *, reason: str = "manual") -> None:
-        if self._shutdown_event.is_set():
-            return
-        self.player.start()
-        self._ensure_worker()
-        self.last_input_wav_bytes = wav_bytes
-        self._save_latest_input(wav_bytes)
-        self._work_queue.put(TranslationWork(wav_bytes=wav_bytes, reason=reason))
+    def submit_wav(self, wav_bytes: bytes | memoryview, *, reason: str = "manual", trace_id: str = "") -> None:
+        self._submit(wav_bytes, reason=reason, trace_id=trace_id)
 
     def resend_last_input(self) -> bool:
         if self._shutdown_event.is_set():
@@ -125,7 +245,7 @@ class TranslationFlow:
         if not self.last_input_wav_bytes:
             self._status("No input captured yet.")
             return False
-        self.submit_wav(self.last_input_wav_bytes, reason="resend")
+        self._submit(self.last_input_wav_bytes, reason="resend", segment=self._last_input_segment)
         return True
 
     def replay_last_output(self) -> bool:
@@ -152,57 +272,355 @@ class TranslationFlow:
     def _handle_frame(self, frame_bytes: bytes) -> None:
         if not self._segmenter:
             return
-        segment = self._segmenter.accept_frame(frame_bytes)
-        if segment:
-            self._submit_pcm(segment, reason="live")
+        if self._frame_ring is not None:
+            self._frame_ring.push(frame_bytes)
+            return
+        self._route_frame(frame_bytes, self._segmenter.accept_frame(frame_bytes))
+
+    def _run_segmenter(self) -> None:
+        ring = self._frame_ring
+        segmenter = self._segmenter
+        if ring is None or segmenter is None:
+            return
+        while True:
+            stopping = self._stop_event.is_set()
+            frames = ring.drain(timeout=SEGMENTER_POLL_SECONDS)
+            if len(frames):
+                try:
+                    for frame, is_speech in zip(frames, segmenter.classify_frames(frames)):
+                        frame_bytes = frame.tobytes()
+                        self._route_frame(frame_bytes, segmenter.accept_classified(frame_bytes, is_speech))
+                except Exception as exc:
+                    self._fail(exc)
+            elif stopping:
+                break
+        if ring.dropped_frames:
+            FRAMES_DROPPED.inc(ring.dropped_frames)
+            logger.warning("segmenter_frames_dropped count=%s", ring.dropped_frames)
+
+    def _route_frame(self, frame_bytes: bytes, segment: PcmSegment | bytes | None) -> None:
+        if self._segment_trace is None and self._segmenter.last_frame_buffered:
+            self._segment_trace = get_tracer().start_trace()
+            if self.connection_warmer is not None:
+                self.connection_warmer.warm_async()
+        if self.runtime.settings.api.streaming_upload:
+            self._stream_frame(frame_bytes, segment)
+        elif segment:
+            self._submit_pcm(segment, reason="live", trace_id=self._end_vad_hold())
+
+    def _stream_frame(self, frame_bytes: bytes, segment: PcmSegment | bytes | None) -> None:
+        if self._segmenter.last_frame_buffered:
+            if self._pcm_stream is None:
+                self._open_stream()
+                if self._segmenter.carried_pcm:
+                    self._pcm_stream.push(self._segmenter.carried_pcm)
+            self._pcm_stream.push(frame_bytes)
+        if segment and self._pcm_stream is not None:
+            self._finish_stream(segment)
 
-    def _submit_pcm(self, pcm_bytes: bytes, *, reason: str) -> None:
-        wav_bytes = pcm_to_wav_bytes(
-            pcm_bytes,
+    def _open_stream(self) -> None:
+        self.player.start()
+        self._ensure_workers()
+        self._pcm_stream = PcmStream(
             sample_rate=self.runtime.settings.audio.sample_rate,
             channels=self.runtime.settings.audio.channels,
+            sample_width=SAMPLE_WIDTH,
+        )
+        self._enqueue_work(
+            TranslationWork(wav_bytes=b"", reason="stream", stream=self._pcm_stream, trace_id=self._segment_trace or "")
+        )
+        logger.info("speech_stream_opened")
+
+    def _finish_stream(self, segment: PcmSegment | bytes | None) -> None:
+        stream = self._pcm_stream
+        self._pcm_stream = None
+        if stream is None:
+            return
+        stream.close()
+        trace_id = self._end_vad_hold()
+        if not segment:
+            return
+        with get_tracer().span(trace_id, "wav_encode"):
+            wav_bytes = self._segment_wav(segment)
+        self._remember_input(wav_bytes, segment if isinstance(segment, PcmSegment) else None)
+        self._save_latest_input(wav_bytes)
+        logger.info("speech_stream_closed bytes=%s", len(segment))
+
+    def _submit_pcm(self, segment: PcmSegment | bytes, *, reason: str, trace_id: str = "") -> None:
+        with get_tracer().span(trace_id, "wav_encode"):
+            wav_bytes = self._segment_wav(segment)
+        self._submit(
+            wav_bytes,
+            reason=reason,
+            trace_id=trace_id,
+            segment=segment if isinstance(segment, PcmSegment) else None,
+        )
+
+    def _submit(
+        self,
+        wav_bytes: bytes | memoryview,
+        *,
+        reason: str,
+        trace_id: str = "",
+        segment: PcmSegment | None = None,
+    ) -> None:
+        if self._shutdown_event.is_set():
+            return
+        self.player.start()
+        self._ensure_workers()
+        self._remember_input(wav_bytes, segment)
+        self._save_latest_input(wav_bytes)
+        trace_id = trace_id or get_tracer().start_trace()
+        _retain_segment(segment)
+        self._enqueue_work(TranslationWork(wav_bytes=wav_bytes, reason=reason, trace_id=trace_id, segment=segment))
+
+    def _remember_input(self, wav_bytes: bytes | memoryview, segment: PcmSegment | None) -> None:
+        _retain_segment(segment)
+        previous, self._last_input_segment = self._last_input_segment, segment
+        self.last_input_wav_bytes = wav_bytes
+        _release_segment(previous)
+
+    def _end_vad_hold(self) -> str:
+        trace_id = self._segment_trace or ""
+        self._segment_trace = None
+        tracer = get_tracer()
+        start = tracer.trace_start(trace_id)
+        if start is not None:
+            tracer.record(trace_id, "vad_hold", start)
+        return trace_id
+
+    def _segment_wav(self, segment: PcmSegment | bytes) -> bytes | memoryview:
+        audio = self.runtime.settings.audio
+        if isinstance(segment, PcmSegment):
+            return segment.to_wav(sample_rate=audio.sample_rate, channels=audio.channels)
+        return pcm_to_wav_bytes(
+            segment,
+            sample_rate=audio.sample_rate,
+            channels=audio.channels,
+            sample_width=SAMPLE_WIDTH,
+        )
+
+    def _enqueue_work(self, work: TranslationWork) -> None:
+        with self._sequence_lock:
+            self._sequence += 1
+            work = replace(
+                work,
+                sequence=self._sequence,
+                enqueued_at=time.perf_counter(),
+                runtime_key=self._runtime_key(),
+                lane_sequences=self._next_lane_sequences(),
+            )
+            coalesced, dropped = self._work_queue.offer(
+                work,
+                merge=self._coalesce,
+                batch=self._batch,
+                abort=self._shutdown_event,
+            )
+        SEGMENTS.inc(reason=work.reason)
+        WORK_QUEUE_DEPTH.set(self._work_queue.pending(), session=self.name)
+        if coalesced:
+            WORK_COALESCED.inc()
+            logger.info("translation_work_coalesced seq=%s depth=%s", work.sequence, self._work_queue.pending())
+            self._release(work)
+        self._drop_work(dropped, reason="overflow")
+
+    def _batch(self, queued: TranslationWork, incoming: TranslationWork) -> TranslationWork | None:
+        pipeline = self.runtime.settings.pipeline
+        if not pipeline.coalesce_max_ms:
+            return None
+        queued_ms = wav_duration_ms(queued.wav_bytes) if queued.stream is None else None
+        incoming_ms = wav_duration_ms(incoming.wav_bytes) if incoming.stream is None else None
+        if queued_ms is None or incoming_ms is None:
+            return None
+        if queued_ms + pipeline.coalesce_gap_ms + incoming_ms > pipeline.coalesce_max_ms:
+            return None
+        return self._coalesce(queued, incoming)
+
+    def _coalesce(self, queued: TranslationWork, incoming: TranslationWork) -> TranslationWork | None:
+        if queued.stream is not None or incoming.stream is not None:
+            return None
+        if queued.runtime_key != incoming.runtime_key:
+            return None
+        wav_bytes = concat_wavs(
+            queued.wav_bytes,
+            incoming.wav_bytes,
+            gap_ms=self.runtime.settings.pipeline.coalesce_gap_ms,
+        )
+        if wav_bytes is None:
+            return None
+        return replace(queued, wav_bytes=wav_bytes, segments=queued.segments + incoming.segments)
+
+    def _next_lane_sequences(self) -> tuple[tuple[TargetLane, int], ...]:
+        lanes = []
+        for lane in dict.fromkeys(self.runtime.extra_targets):
+            self._lane_sequences[lane] = self._lane_sequences.get(lane, 0) + 1
+            lanes.append((lane, self._lane_sequences[lane]))
+        return tuple(lanes)
+
+    def _runtime_key(self) -> tuple:
+        runtime = self.runtime
+        return (
+            runtime.target_language,
+            runtime.speaker_id,
+            runtime.session_id,
+            runtime.source_language,
+            runtime.domain,
+            runtime.privacy_level,
+            runtime.semantic_cache_enabled,
+            runtime.cache_strategy,
+            runtime.use_transcript_memory,
+            tuple((lane.language, lane.speaker_id) for lane in runtime.extra_targets),
         )
-        self.submit_wav(wav_bytes, reason=reason)
 
     def _process_work(self) -> None:
         while True:
             work = self._work_queue.get()
+            WORK_QUEUE_DEPTH.set(self._work_queue.pending(), session=self.name)
             try:
                 if work is None:
                     return
+                if self._is_stale(work):
+                    self._drop_work([work], reason="stale")
+                    continue
                 self._translate(work)
+                _release_segment(work.segment)
             finally:
                 self._work_queue.task_done()
 
+    def _is_stale(self, work: TranslationWork) -> bool:
+        max_staleness_ms = self.runtime.settings.pipeline.max_staleness_ms
+        return bool(max_staleness_ms) and (time.perf_counter() - work.enqueued_at) * 1000 > max_staleness_ms
+
+    def _drop_work(self, dropped: list[TranslationWork], *, reason: str) -> None:
+        if not dropped:
+            return
+        for work in dropped:
+            if work.stream is not None:
+                work.stream.close()
+            self._release(work)
+        depth = self._work_queue.pending()
+        WORK_DROPPED.inc(len(dropped), reason=reason)
+        logger.warning("translation_work_dropped reason=%s count=%s depth=%s", reason, len(dropped), depth)
+        self._status(f"Translation backlog: dropped {len(dropped)} {reason} segment(s), {depth} queued.")
+
     def _translate(self, work: TranslationWork) -> None:
+        tracer = get_tracer()
+        tracer.record(work.trace_id, "queue_wait", work.enqueued_at, sequence=work.sequence)
+        lanes = work.lane_sequences
         logger.info(
-            "translation_requested reason=%s cache_enabled=%s strategy=%s session=%s",
+            "translation_requested seq=%s reason=%s segments=%s targets=%s cache_enabled=%s strategy=%s session=%s",
+            work.sequence,
             work.reason,
+            work.segments,
+            1 + len(lanes),
             self.runtime.semantic_cache_enabled,
             self.runtime.cache_strategy,
             self.runtime.session_id,
         )
         try:
-            response = self.client.translate(
-                TranslationRequest(
-                    audio_bytes=work.wav_bytes,
-                    target_language=self.runtime.target_language,
-                    speaker_id=self.runtime.speaker_id,
-                    session_id=self.runtime.session_id,
-                    source_language=self.runtime.source_language,
-                    domain=self.runtime.domain,
-                    privacy_level=self.runtime.privacy_level,
-                    use_semantic_cache=self.runtime.semantic_cache_enabled,
-                    cache_strategy=self.runtime.cache_strategy,
-                    use_transcript_memory=self.runtime.use_transcript_memory,
-                )
+            codec = "wav" if work.stream is not None else self.runtime.settings.audio.upload_codec
+            with tracer.span(work.trace_id, "upload_encode", codec=codec):
+                audio_bytes = encode_upload(work.wav_bytes, codec)
+            request = TranslationRequest(
+                audio_bytes=audio_bytes,
+                target_language=self.runtime.target_language,
+                speaker_id=self.runtime.speaker_id,
+                session_id=self.runtime.session_id,
+                source_language=self.runtime.source_language,
+                domain=self.runtime.domain,
+                privacy_level=self.runtime.privacy_level,
+                use_semantic_cache=self.runtime.semantic_cache_enabled,
+                cache_strategy=self.runtime.cache_strategy,
+                use_transcript_memory=self.runtime.use_transcript_memory,
+                audio_codec=codec,
+                trace_id=work.trace_id,
             )
-            if self._shutdown_event.is_set():
-                logger.info("translation_dropped_after_shutdown reason=%s", work.reason)
-                return
-            self.last_output_wav_bytes = response.audio_bytes
-            self._save_latest_output(response)
-            self.player.enqueue(response.audio_bytes, self.runtime.output_device)
+        except Exception as exc:
+            self._deliver(work.sequence, lambda error=exc: self._fail(error))
+            for lane, lane_sequence in lanes:
+                self._deliver_lane(lane, lane_sequence, None)
+            return
+        for lane, lane_sequence in lanes:
+            self._send_lane(work, request, lane, lane_sequence)
+        try:
+            response = self._send(work, request)
+        except Exception as exc:
+            self._deliver(work.sequence, lambda error=exc: self._fail(error))
+            return
+        ready_at = time.perf_counter()
+        self._deliver(work.sequence, lambda: self._complete(work, response, ready_at))
+
+    def _send(self, work: TranslationWork, request: TranslationRequest) -> TranslationResponse:
+        if self._sends_async(work):
+            return get_client_loop().submit(self.async_client.translate(request)).result()
+        options = {"stream_audio": True} if self.runtime.settings.api.streaming_download else {}
+        if work.stream is not None:
+            return self.client.translate_stream(request, work.stream.wav_chunks(), **options)
+        response = self.client.translate(request, **options)
+        if response.audio_stream is not None and work.segment is not None:
+            _retain_segment(work.segment)
+            response.audio_stream.add_finish_callback(lambda: _release_segment(work.segment))
+        return response
+
+    def _send_lane(self, work: TranslationWork, request: TranslationRequest, lane: TargetLane, sequence: int) -> None:
+        _retain_segment(work.segment)
+        lane_request = self._lane_request(request, lane)
+        try:
+            if self._sends_async(work):
+                future = get_client_loop().submit(self.async_client.translate(lane_request))
+                with self._fanout_lock:
+                    self._lane_futures.add(future)
+            else:
+                future = self._fanout_executor(lane).submit(self._send, work, lane_request)
+        except Exception as exc:
+            _release_segment(work.segment)
+            self._deliver_lane(lane, sequence, lambda: self._fail(exc))
+            return
+        future.add_done_callback(lambda done: self._lane_done(work, lane, sequence, done))
+
+    def _lane_done(self, work: TranslationWork, lane: TargetLane, sequence: int, future: Future) -> None:
+        with self._fanout_lock:
+            self._lane_futures.discard(future)
+        _release_segment(work.segment)
+        if future.cancelled():
+            self._deliver_lane(lane, sequence, None)
+            return
+        outcome = _future_outcome(future)
+        self._deliver_lane(lane, sequence, lambda: self._complete_lane_outcome(work, lane, outcome))
+
+    def _sends_async(self, work: TranslationWork) -> bool:
+        if self.async_client is None or work.stream is not None:
+            return False
+        return not self.runtime.settings.api.streaming_download
+
+    def _lane_request(self, request: TranslationRequest, lane: TargetLane) -> TranslationRequest:
+        return replace(request, target_language=lane.language, speaker_id=lane.speaker_id)
+
+    def _fanout_executor(self, lane: TargetLane) -> ThreadPoolExecutor:
+        with self._fanout_lock:
+            pool = self._fanout_pools.get(lane)
+            if pool is None:
+                pool = ThreadPoolExecutor(
+                    max_workers=max(1, self.runtime.settings.pipeline.translation_workers),
+                    thread_name_prefix=f"fanout-{lane.language}",
+                )
+                self._fanout_pools[lane] = pool
+            return pool
+
+    def _complete(self, work: TranslationWork, response: TranslationResponse, ready_at: float) -> None:
+        get_tracer().record(work.trace_id, "reorder_wait", ready_at)
+        if self._shutdown_event.is_set():
+            logger.info("translation_dropped_after_shutdown reason=%s", work.reason)
+            return
+        try:
+            if response.audio_stream is not None:
+                response.audio_stream.add_done_callback(
+                    lambda audio_bytes: self._store_output(audio_bytes, response.raw_headers)
+                )
+                self.player.enqueue_stream(response.audio_stream, self.runtime.output_device, trace_id=work.trace_id)
+            else:
+                self._store_output(response.audio_bytes, response.raw_headers)
+                self.player.enqueue(response.audio_bytes, self.runtime.output_device, trace_id=work.trace_id)
             logger.info(
                 'translation_completed cache=%s layer=%s strategy=%s similarity=%s text_similarity=%s '
                 'lookup=%ss transcript=%ss inference=%ss total=%ss decision="%s"',
@@ -222,14 +640,82 @@ class TranslationFlow:
         except Exception as exc:
             self._fail(exc)
 
-    def _ensure_worker(self) -> None:
+    def _complete_lane_outcome(
+        self, work: TranslationWork, lane: TargetLane, outcome: TranslationResponse | Exception
+    ) -> None:
+        if isinstance(outcome, Exception):
+            self._fail(outcome)
+        else:
+            self._complete_lane(work, lane, outcome)
+
+    def _complete_lane(self, work: TranslationWork, lane: TargetLane, response: TranslationResponse) -> None:
+        if self._shutdown_event.is_set():
+            return
+        try:
+            player = self._lane_player(lane)
+            if response.audio_stream is not None:
+                player.enqueue_stream(response.audio_stream, lane.output_device, trace_id=work.trace_id)
+            else:
+                player.enqueue(response.audio_bytes, lane.output_device, trace_id=work.trace_id)
+            logger.info(
+                "fanout_translation_completed target=%s cache=%s layer=%s total=%ss",
+                lane.language,
+                response.cache_status,
+                response.cache_layer,
+                _fmt(response.total_time),
+            )
+        except Exception as exc:
+            self._fail(exc)
+
+    def _lane_player(self, lane: TargetLane) -> AudioPlayer:
+        with self._fanout_lock:
+            player = self._lane_players.get(lane)
+            if player is None:
+                player = self.lane_player_factory(f"{self.name}-{lane.language}") if self.lane_player_factory else self.player
+                self._lane_players[lane] = player
+            return player
+
+    def _stop_players(self) -> None:
+        self.player.stop()
+        for player in {id(player): player for player in self._lane_players.values()}.values():
+            if player is not self.player:
+                player.stop()
+
+    def _deliver(self, sequence: int, action: Callable[[], None] | None) -> None:
+        REORDER_PENDING.set(self._reorder.deliver(sequence, action), session=self.name)
+
+    def _deliver_lane(self, lane: TargetLane, sequence: int, action: Callable[[], None] | None) -> None:
+        with self._fanout_lock:
+            reorder = self._lane_reorder.setdefault(lane, ReorderBuffer())
+        reorder.deliver(sequence, action)
+
+    def _release(self, work: TranslationWork) -> None:
+        _release_segment(work.segment)
+        self._deliver(work.sequence, None)
+        for lane, lane_sequence in work.lane_sequences:
+            self._deliver_lane(lane, lane_sequence, None)
+
+    def _drain_fanout(self) -> None:
+        with self._fanout_lock:
+            pools, self._fanout_pools = self._fanout_pools, {}
+            futures = list(self._lane_futures)
+        for pool in pools.values():
+            pool.shutdown(wait=True)
+        wait(futures)
+
+    def _ensure_workers(self) -> None:
         if self._shutdown_event.is_set():
             return
         with self._worker_lock:
-            if self._worker_thread and self._worker_thread.is_alive():
-                return
-            self._worker_thread = threading.Thread(target=self._process_work, daemon=True)
-            self._worker_thread.start()
+            self._worker_threads = [worker for worker in self._worker_threads if worker.is_alive()]
+            while len(self._worker_threads) < max(1, self.runtime.settings.pipeline.translation_workers):
+                worker = threading.Thread(target=self._process_work, daemon=True)
+                worker.start()
+                self._worker_threads.append(worker)
+
+    def _live_workers(self) -> list[threading.Thread]:
+        with self._worker_lock:
+            return [worker for worker in self._worker_threads if worker.is_alive()]
 
     def _status(self, message: str) -> None:
         if self._shutdown_event.is_set():
@@ -238,6 +724,7 @@ class TranslationFlow:
             self.on_status_changed(message)
 
     def _fail(self, exc: Exception) -> None:
+        TRANSLATION_FAILURES.inc()
         logger.error("translation_failed error=%s", exc)
         if self._shutdown_event.is_set():
             return
@@ -247,31 +734,56 @@ class TranslationFlow:
     def _discard_pending_work(self) -> None:
         while True:
             try:
-                self._work_queue.get_nowait()
+                work = self._work_queue.get_nowait()
             except Empty:
                 return
             else:
+                if work is not None:
+                    if work.stream is not None:
+                        work.stream.close()
+                    self._release(work)
                 self._work_queue.task_done()
 
-    def _save_latest_input(self, wav_bytes: bytes) -> None:
+    def _save_latest_input(self, wav_bytes: bytes | memoryview) -> None:
         if not (self.runtime.demo_enabled and self.runtime.settings.demo.save_artifacts):
             return
         OUTPUTS_DIR.mkdir(parents=True, exist_ok=True)
         (OUTPUTS_DIR / "latest-input.wav").write_bytes(wav_bytes)
 
-    def _save_latest_output(self, response: TranslationResponse) -> None:
+    def _store_output(self, audio_bytes: bytes, headers: dict[str, str]) -> None:
+        self.last_output_wav_bytes = audio_bytes
+        self._save_latest_output(audio_bytes, headers)
+
+    def _save_latest_output(self, audio_bytes: bytes, headers: dict[str, str]) -> None:
         if not (self.runtime.demo_enabled and self.runtime.settings.demo.save_artifacts):
             return
         OUTPUTS_DIR.mkdir(parents=True, exist_ok=True)
         HEADERS_DIR.mkdir(parents=True, exist_ok=True)
-        (OUTPUTS_DIR / "latest-output.wav").write_bytes(response.audio_bytes)
-        _write_json(HEADERS_DIR / "latest-response.json", response.raw_headers)
+        (OUTPUTS_DIR / "latest-output.wav").write_bytes(audio_bytes)
+        _write_json(HEADERS_DIR / "latest-response.json", headers)
 
 
 def _write_json(path: Path, payload: dict[str, str]) -> None:
     path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
 
 
+def _retain_segment(segment: PcmSegment | None) -> None:
+    if segment is not None:
+        segment.retain()
+
+
+def _release_segment(segment: PcmSegment | None) -> None:
+    if segment is not None:
+        segment.release()
+
+
+def _future_outcome(future: Future) -> TranslationResponse | Exception:
+    try:
+        return future.result()
+    except Exception as exc:
+        return exc
+
+
 def _fmt(value: float | None) -> str:
     if value is None:
         return "-"
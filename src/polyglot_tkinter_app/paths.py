@@ -6,6 +6,7 @@ ASSETS_DIR = APP_ROOT / "assets"
 LOGS_DIR = APP_ROOT / "logs"
 OUTPUTS_DIR = APP_ROOT / "outputs"
 HEADERS_DIR = APP_ROOT / "headers"
+CACHE_DIR = APP_ROOT / "cache"
 
 
 def asset_path(filename: str) -> str:
@@ -1,4 +1,4 @@
 from polyglot_tkinter_app.settings.loader import load_settings
-from polyglot_tkinter_app.settings.models import AppSettings, RuntimeState
+from polyglot_tkinter_app.settings.models import AppSettings, RuntimeState, TargetLane
 
-__all__ = ["AppSettings", "RuntimeState", "load_settings"]
+__all__ = ["AppSettings", "RuntimeState", "TargetLane", "load_settings"]
@@ -9,15 +9,29 @@ from polyglot_tkinter_app.settings.models import (
     ApiSettings,
     AppSettings,
     AudioSettings,
+    ClientCacheSettings,
+    DaemonSession,
+    DaemonSettings,
     DemoSettings,
+    FanoutTarget,
     GeneralSettings,
     GuiSettings,
+    MetricsSettings,
+    PipelineSettings,
     SemanticCacheSettings,
+    TracingSettings,
 )
 
 
 DEFAULT_CONFIG: dict[str, Any] = {
-    "general": {"debug": True, "save_logs": True, "log_file": "logs/polyglot.log"},
+    "general": {
+        "debug": True,
+        "save_logs": True,
+        "log_file": "logs/polyglot.log",
+        "log_format": "text",
+        "log_queue_size": 10000,
+        "log_overflow": "drop",
+    },
     "api": {
         "profile": "local",
         "profiles": {
@@ -31,6 +45,12 @@ DEFAULT_CONFIG: dict[str, Any] = {
         "health_endpoint": "health/",
         "process_endpoint": "process_memory/",
         "timeout_seconds": 120,
+        "streaming_upload": False,
+        "streaming_download": False,
+        "max_connections": 4,
+        "keepalive_seconds": 30,
+        "prewarm_connections": 2,
+        "heartbeat_seconds": 20,
     },
     "semantic_cache": {
         "enabled": True,
@@ -45,6 +65,18 @@ DEFAULT_CONFIG: dict[str, Any] = {
         "channels": 1,
         "frame_duration_ms": 30,
         "vad_aggressiveness": 3,
+        "playback_jitter_ms": 120,
+        "output_idle_close_seconds": 5.0,
+        "playback_engine": "blocking",
+        "device_refresh_seconds": 0,
+        "segmenter_mode": "inline",
+        "energy_gate": False,
+        "energy_gate_ratio": 2.5,
+        "energy_gate_min_rms": 100,
+        "max_segment_ms": 15000,
+        "min_segment_ms": 5000,
+        "segment_overlap_ms": 0,
+        "upload_codec": "wav",
     },
     "demo": {"enabled": False, "output_mode": "speakers", "save_artifacts": True},
     "gui": {
@@ -57,6 +89,34 @@ DEFAULT_CONFIG: dict[str, Any] = {
             "accent": "#00a9ad",
         },
     },
+    "pipeline": {
+        "translation_workers": 1,
+        "work_queue_size": 8,
+        "playback_queue_size": 8,
+        "overflow_policy": "drop_oldest",
+        "max_staleness_ms": 0,
+        "coalesce_max_ms": 0,
+        "coalesce_gap_ms": 200,
+        "fanout_targets": [],
+    },
+    "client_cache": {
+        "enabled": True,
+        "max_bytes": 33_554_432,
+        "privacy_ttl_seconds": {"transient": 600},
+        "disk_enabled": False,
+        "disk_max_bytes": 268_435_456,
+        "disk_ttl_seconds": 604_800,
+    },
+    "tracing": {"enabled": False, "export_format": "jsonl", "export_path": "logs/traces.jsonl", "max_spans": 20000},
+    "metrics": {
+        "http_enabled": False,
+        "host": "127.0.0.1",
+        "port": 9464,
+        "snapshot_enabled": False,
+        "snapshot_path": "logs/metrics.json",
+        "snapshot_interval_seconds": 15,
+    },
+    "daemon": {"sessions": []},
 }
 
 
@@ -72,12 +132,37 @@ def load_settings(filepath: str | Path = "config.json") -> AppSettings:
         for name, values in config["api"]["profiles"].items()
     }
 
+    fanout_targets = tuple(
+        FanoutTarget(
+            language=str(target["language"]),
+            speaker_id=str(target.get("speaker_id", "0")),
+            output_device=str(target.get("output_device", "")),
+        )
+        for target in config["pipeline"].get("fanout_targets", [])
+        if target.get("language")
+    )
+
+    daemon_sessions = tuple(
+        DaemonSession(
+            name=str(session.get("name") or f"session-{index}"),
+            input_device=str(session["input_device"]),
+            output_device=str(session.get("output_device", "")),
+            target_language=str(session.get("target_language", "eng")),
+            speaker_id=str(session.get("speaker_id", "0")),
+        )
+        for index, session in enumerate(config["daemon"].get("sessions", []), start=1)
+        if session.get("input_device")
+    )
+
     gui = config["gui"]
     return AppSettings(
         general=GeneralSettings(
             debug=_as_bool(config["general"].get("debug", True)),
             save_logs=_as_bool(config["general"].get("save_logs", True)),
             log_file=str(config["general"].get("log_file", "logs/polyglot.log")),
+            log_format=str(config["general"].get("log_format", "text")).lower(),
+            log_queue_size=max(1, int(config["general"].get("log_queue_size", 10000))),
+            log_overflow=str(config["general"].get("log_overflow", "drop")).lower(),
         ),
         api=ApiSettings(
             profile=str(config["api"].get("profile", "local")),
@@ -85,6 +170,12 @@ def load_settings(filepath: str | Path = "config.json") -> AppSettings:
             health_endpoint=_endpoint(config["api"].get("health_endpoint", "health/")),
             process_endpoint=_endpoint(config["api"].get("process_endpoint", "process_memory/")),
             timeout_seconds=float(config["api"].get("timeout_seconds", 120)),
+            streaming_upload=_as_bool(config["api"].get("streaming_upload", False)),
+            streaming_download=_as_bool(config["api"].get("streaming_download", False)),
+            max_connections=max(1, int(config["api"].get("max_connections", 4))),
+            keepalive_seconds=float(config["api"].get("keepalive_seconds", 30)),
+            prewarm_connections=max(0, int(config["api"].get("prewarm_connections", 2))),
+            heartbeat_seconds=max(0.0, float(config["api"].get("heartbeat_seconds", 20))),
         ),
         semantic_cache=SemanticCacheSettings(
             enabled=_as_bool(config["semantic_cache"].get("enabled", True)),
@@ -99,6 +190,18 @@ def load_settings(filepath: str | Path = "config.json") -> AppSettings:
             channels=int(config["audio"].get("channels", 1)),
             frame_duration_ms=int(config["audio"].get("frame_duration_ms", 30)),
             vad_aggressiveness=int(config["audio"].get("vad_aggressiveness", 3)),
+            playback_jitter_ms=int(config["audio"].get("playback_jitter_ms", 120)),
+            output_idle_close_seconds=float(config["audio"].get("output_idle_close_seconds", 5.0)),
+            playback_engine=str(config["audio"].get("playback_engine", "blocking")).lower(),
+            device_refresh_seconds=float(config["audio"].get("device_refresh_seconds", 0)),
+            segmenter_mode=str(config["audio"].get("segmenter_mode", "inline")),
+            energy_gate=_as_bool(config["audio"].get("energy_gate", False)),
+            energy_gate_ratio=float(config["audio"].get("energy_gate_ratio", 2.5)),
+            energy_gate_min_rms=float(config["audio"].get("energy_gate_min_rms", 100)),
+            max_segment_ms=int(config["audio"].get("max_segment_ms", 15000)),
+            min_segment_ms=int(config["audio"].get("min_segment_ms", 5000)),
+            segment_overlap_ms=int(config["audio"].get("segment_overlap_ms", 0)),
+            upload_codec=str(config["audio"].get("upload_codec", "wav")).lower(),
         ),
         demo=DemoSettings(
             enabled=_as_bool(config["demo"].get("enabled", False)),
@@ -112,6 +215,41 @@ def load_settings(filepath: str | Path = "config.json") -> AppSettings:
             default_theme=str(gui.get("default_theme", "dark")),
             colors=dict(gui.get("colors", {})),
         ),
+        pipeline=PipelineSettings(
+            translation_workers=max(1, int(config["pipeline"].get("translation_workers", 1))),
+            work_queue_size=max(0, int(config["pipeline"].get("work_queue_size", 8))),
+            playback_queue_size=max(0, int(config["pipeline"].get("playback_queue_size", 8))),
+            overflow_policy=str(config["pipeline"].get("overflow_policy", "drop_oldest")).lower(),
+            max_staleness_ms=max(0, int(config["pipeline"].get("max_staleness_ms", 0))),
+            coalesce_max_ms=max(0, int(config["pipeline"].get("coalesce_max_ms", 0))),
+            coalesce_gap_ms=max(0, int(config["pipeline"].get("coalesce_gap_ms", 200))),
+            fanout_targets=fanout_targets,
+        ),
+        client_cache=ClientCacheSettings(
+            enabled=_as_bool(config["client_cache"].get("enabled", True)),
+            max_bytes=int(config["client_cache"].get("max_bytes", 33_554_432)),
+            privacy_ttl_seconds={
+                str(level): float(ttl) for level, ttl in config["client_cache"].get("privacy_ttl_seconds", {}).items()
+            },
+            disk_enabled=_as_bool(config["client_cache"].get("disk_enabled", False)),
+            disk_max_bytes=int(config["client_cache"].get("disk_max_bytes", 268_435_456)),
+            disk_ttl_seconds=float(config["client_cache"].get("disk_ttl_seconds", 604_800)),
+        ),
+        tracing=TracingSettings(
+            enabled=_as_bool(config["tracing"].get("enabled", False)),
+            export_format=str(config["tracing"].get("export_format", "jsonl")).lower(),
+            export_path=str(config["tracing"].get("export_path", "logs/traces.jsonl")),
+            max_spans=max(1, int(config["tracing"].get("max_spans", 20000))),
+        ),
+        metrics=MetricsSettings(
+            http_enabled=_as_bool(config["metrics"].get("http_enabled", False)),
+            host=str(config["metrics"].get("host", "127.0.0.1")),
+            port=int(config["metrics"].get("port", 9464)),
+            snapshot_enabled=_as_bool(config["metrics"].get("snapshot_enabled", False)),
+            snapshot_path=str(config["metrics"].get("snapshot_path", "logs/metrics.json")),
+            snapshot_interval_seconds=max(1.0, float(config["metrics"].get("snapshot_interval_seconds", 15))),
+        ),
+        daemon=DaemonSettings(sessions=daemon_sessions),
     )
 
 
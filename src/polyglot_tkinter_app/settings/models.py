@@ -10,6 +10,9 @@ class GeneralSettings:
     debug: bool = True
     save_logs: bool = True
     log_file: str = "logs/polyglot.log"
+    log_format: str = "text"
+    log_queue_size: int = 10000
+    log_overflow: str = "drop"
 
 
 @dataclass(frozen=True)
@@ -25,6 +28,12 @@ class ApiSettings:
     health_endpoint: str = "health/"
     process_endpoint: str = "process_memory/"
     timeout_seconds: float = 120.0
+    streaming_upload: bool = False
+    streaming_download: bool = False
+    max_connections: int = 4
+    keepalive_seconds: float = 30.0
+    prewarm_connections: int = 2
+    heartbeat_seconds: float = 20.0
 
     def active_profile(self, profile_name: str | None = None) -> ApiProfile:
         name = profile_name or self.profile
@@ -43,12 +52,85 @@ class SemanticCacheSettings:
     strategy: str = "context"
 
 
+@dataclass(frozen=True)
+class ClientCacheSettings:
+    enabled: bool = True
+    max_bytes: int = 32 * 1024 * 1024
+    privacy_ttl_seconds: dict[str, float] = field(default_factory=lambda: {"transient": 600.0})
+    disk_enabled: bool = False
+    disk_max_bytes: int = 256 * 1024 * 1024
+    disk_ttl_seconds: float = 7 * 24 * 3600.0
+
+
 @dataclass(frozen=True)
 class AudioSettings:
     sample_rate: int = 16000
     channels: int = 1
     frame_duration_ms: int = 30
     vad_aggressiveness: int = 3
+    playback_jitter_ms: int = 120
+    output_idle_close_seconds: float = 5.0
+    playback_engine: str = "blocking"
+    device_refresh_seconds: float = 0.0
+    segmenter_mode: str = "inline"
+    energy_gate: bool = False
+    energy_gate_ratio: float = 2.5
+    energy_gate_min_rms: float = 100.0
+    max_segment_ms: int = 15000
+    min_segment_ms: int = 5000
+    segment_overlap_ms: int = 0
+    upload_codec: str = "wav"
+
+
+@dataclass(frozen=True)
+class FanoutTarget:
+    language: str
+    speaker_id: str = "0"
+    output_device: str = ""
+
+
+@dataclass(frozen=True)
+class PipelineSettings:
+    translation_workers: int = 1
+    work_queue_size: int = 8
+    playback_queue_size: int = 8
+    overflow_policy: str = "drop_oldest"
+    max_staleness_ms: int = 0
+    coalesce_max_ms: int = 0
+    coalesce_gap_ms: int = 200
+    fanout_targets: tuple[FanoutTarget, ...] = ()
+
+
+@dataclass(frozen=True)
+class TracingSettings:
+    enabled: bool = False
+    export_format: str = "jsonl"
+    export_path: str = "logs/traces.jsonl"
+    max_spans: int = 20000
+
+
+@dataclass(frozen=True)
+class MetricsSettings:
+    http_enabled: bool = False
+    host: str = "127.0.0.1"
+    port: int = 9464
+    snapshot_enabled: bool = False
+    snapshot_path: str = "logs/metrics.json"
+    snapshot_interval_seconds: float = 15.0
+
+
+@dataclass(frozen=True)
+class DaemonSession:
+    name: str
+    input_device: str
+    output_device: str = ""
+    target_language: str = "eng"
+    speaker_id: str = "0"
+
+
+@dataclass(frozen=True)
+class DaemonSettings:
+    sessions: tuple[DaemonSession, ...] = ()
 
 
 @dataclass(frozen=True)
@@ -75,6 +157,18 @@ class AppSettings:
     audio: AudioSettings
     demo: DemoSettings
     gui: GuiSettings
+    pipeline: PipelineSettings
+    client_cache: ClientCacheSettings
+    tracing: TracingSettings
+    metrics: MetricsSettings
+    daemon: DaemonSettings
+
+
+@dataclass(frozen=True)
+class TargetLane:
+    language: str
+    speaker_id: str = "0"
+    output_device: Any | None = None
 
 
 @dataclass
@@ -93,6 +187,7 @@ class RuntimeState:
     speaker_id: str = "0"
     input_device: Any | None = None
     output_device: Any | None = None
+    extra_targets: list[TargetLane] = field(default_factory=list)
 
     @classmethod
     def from_settings(cls, settings: AppSettings) -> "RuntimeState":
@@ -106,6 +201,10 @@ class RuntimeState:
             use_transcript_memory=settings.semantic_cache.use_transcript_memory,
             domain=settings.semantic_cache.domain,
             privacy_level=settings.semantic_cache.privacy_level,
+            extra_targets=[
+                TargetLane(language=target.language, speaker_id=target.speaker_id)
+                for target in settings.pipeline.fanout_targets
+            ],
         )
 
     @property
@@ -0,0 +1,12 @@
+from importlib import import_module
+from typing import Any
+
+__all__ = ["FakeBackend", "FakeBackendConfig", "LatencyModel"]
+
+_LAZY_EXPORTS = {name: "polyglot_tkinter_app.testing.fake_backend" for name in __all__}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(_LAZY_EXPORTS[name]), name)
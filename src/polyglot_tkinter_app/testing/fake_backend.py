@@ -0,0 +1,345 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import math
+import random
+import socket
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import quote
+from uuid import uuid4
+
+from polyglot_tkinter_app.audio.wav_io import pcm_to_wav_bytes
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HIT_LAYERS = {"text_exact": 0.1, "text_vector": 0.05, "audio_vector": 0.05}
+
+
+@dataclass(frozen=True)
+class LatencyModel:
+    distribution: str = "fixed"
+    median_ms: float = 0.0
+    spread: float = 0.0
+
+    def sample(self, rng: random.Random) -> float:
+        if self.distribution == "uniform":
+            milliseconds = rng.uniform(self.median_ms - self.spread, self.median_ms + self.spread)
+        elif self.distribution == "lognormal":
+            milliseconds = self.median_ms * math.exp(rng.gauss(0.0, self.spread))
+        else:
+            milliseconds = self.median_ms
+        return max(0.0, milliseconds) / 1000
+
+
+@dataclass(frozen=True)
+class FakeBackendConfig:
+    lookup: LatencyModel = field(default_factory=lambda: LatencyModel(median_ms=5.0))
+    transcript: LatencyModel = field(default_factory=lambda: LatencyModel(median_ms=50.0))
+    inference: LatencyModel = field(default_factory=lambda: LatencyModel(median_ms=200.0))
+    remember_audio: bool = True
+    hit_layers: dict[str, float] = field(default_factory=lambda: dict(DEFAULT_HIT_LAYERS))
+    response_ms: int = 1000
+    response_sample_rate: int = 16000
+    response_chunk_bytes: int = 0
+    response_chunk_delay_ms: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 500
+    drop_rate: float = 0.0
+    truncate_rate: float = 0.0
+    seed: int | None = None
+
+
+class FakeBackend:
+    def __init__(self, config: FakeBackendConfig | None = None, *, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or FakeBackendConfig()
+        self.requests = 0
+        self.connections = 0
+        self._rng = random.Random(self.config.seed)
+        self._rng_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._seen_audio: set[tuple[str, str]] = set()
+        self._seen_lock = threading.Lock()
+        self._response_audio = _tone_wav(self.config.response_ms, self.config.response_sample_rate)
+        self._server = _FakeBackendServer((host, port), _FakeBackendHandler, self)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> str:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+            self._thread.start()
+            logger.info("fake_backend_started url=%s", self.base_url)
+        return self.base_url
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join(timeout=5)
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> FakeBackend:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def count_request(self) -> None:
+        with self._stats_lock:
+            self.requests += 1
+
+    def count_connection(self) -> None:
+        with self._stats_lock:
+            self.connections += 1
+
+    def random(self) -> float:
+        with self._rng_lock:
+            return self._rng.random()
+
+    def latency(self, model: LatencyModel) -> float:
+        with self._rng_lock:
+            return model.sample(self._rng)
+
+    def classify(self, audio: bytes, language: str, use_cache: bool) -> str:
+        if not use_cache:
+            return "none"
+        key = (hashlib.sha256(audio).hexdigest(), language)
+        with self._seen_lock:
+            repeated = key in self._seen_audio
+            self._seen_audio.add(key)
+        if repeated and self.config.remember_audio:
+            return "audio_exact"
+        roll = self.random()
+        for layer, probability in self.config.hit_layers.items():
+            if roll < probability:
+                return layer
+            roll -= probability
+        return "none"
+
+    def response_audio(self) -> bytes:
+        return self._response_audio
+
+
+class _FakeBackendServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], handler: type, backend: FakeBackend):
+        self.backend = backend
+        super().__init__(address, handler)
+
+
+class _FakeBackendHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _FakeBackendServer
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.backend.count_connection()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug("fake_backend_request " + format, *args)
+
+    def do_GET(self) -> None:
+        if not self.path.rstrip("/").endswith("health"):
+            self._send_json(404, {"detail": "not found"})
+            return
+        self._send_json(
+            200,
+            {
+                "status": True,
+                "details": {
+                    "model_loaded": True,
+                    "processor_loaded": True,
+                    "device": "fake",
+                    "semantic_memory": {"enabled": True, "mode": "audio+transcript"},
+                },
+            },
+        )
+
+    def do_POST(self) -> None:
+        backend = self.server.backend
+        backend.count_request()
+        body = self._read_body()
+        if not self.path.rstrip("/").endswith("process_memory"):
+            self._send_json(404, {"detail": "not found"})
+            return
+        config = backend.config
+        if backend.random() < config.drop_rate:
+            self.close_connection = True
+            self.connection.close()
+            return
+        if backend.random() < config.error_rate:
+            self._send_json(config.error_status, {"detail": "injected failure"})
+            return
+        try:
+            fields, audio = _parse_multipart(self.headers.get("Content-Type", ""), body)
+        except ValueError as exc:
+            self._send_json(400, {"detail": str(exc)})
+            return
+
+        language = fields.get("language", "eng")
+        use_cache = fields.get("use_semantic_cache", "true") == "true"
+        layer = backend.classify(audio, language, use_cache)
+        lookup = backend.latency(config.lookup) if use_cache else 0.0
+        transcript = backend.latency(config.transcript) if layer != "audio_exact" else 0.0
+        inference = backend.latency(config.inference) if layer == "none" else 0.0
+        time.sleep(lookup + transcript + inference)
+
+        hit = layer != "none"
+        headers = {
+            "Content-Type": "audio/wav",
+            "X-Polyglot-Cache": "hit" if hit else "miss",
+            "X-Polyglot-Cache-Strategy": fields.get("cache_strategy", "context"),
+            "X-Polyglot-Cache-Layer": layer,
+            "X-Polyglot-Similarity": "1.000000" if hit else "None",
+            "X-Polyglot-Text-Similarity": "1.000000" if hit else "None",
+            "X-Polyglot-Lookup-Time": f"{lookup:.4f}",
+            "X-Polyglot-Transcript-Time": f"{transcript:.4f}",
+            "X-Polyglot-Inference-Time": f"{inference:.4f}",
+            "X-Polyglot-Decision": f"fake backend {layer}" if hit else "fake backend inference",
+            "X-Polyglot-Translation-Id": uuid4().hex,
+            "X-Polyglot-Source-Transcript": quote("fake transcript"),
+            "X-Polyglot-Normalized-Text": quote("fake transcript"),
+        }
+        self._send_audio(headers, backend.response_audio())
+
+    def _read_body(self) -> bytes:
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            parts = []
+            while True:
+                size = int(self.rfile.readline().split(b";", 1)[0].strip() or b"0", 16)
+                if size == 0:
+                    while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+                        pass
+                    return b"".join(parts)
+                parts.append(self.rfile.read(size))
+                self.rfile.readline()
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def _send_audio(self, headers: dict[str, str], audio: bytes) -> None:
+        config = self.server.backend.config
+        self.send_response(200)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if config.response_chunk_bytes <= 0:
+            self.send_header("Content-Length", str(len(audio)))
+            self.end_headers()
+            self.wfile.write(audio)
+            return
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        truncate = self.server.backend.random() < config.truncate_rate
+        for offset in range(0, len(audio), config.response_chunk_bytes):
+            chunk = audio[offset : offset + config.response_chunk_bytes]
+            self.wfile.write(f"{len(chunk):X}\r\n".encode("ascii") + chunk + b"\r\n")
+            self.wfile.flush()
+            if truncate:
+                self.close_connection = True
+                self.connection.shutdown(socket.SHUT_RDWR)
+                return
+            time.sleep(config.response_chunk_delay_ms / 1000)
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _send_json(self, status: int, payload: dict[str, Any]) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _parse_multipart(content_type: str, body: bytes) -> tuple[dict[str, str], bytes]:
+    if "boundary=" not in content_type:
+        raise ValueError("expected multipart/form-data")
+    boundary = content_type.split("boundary=", 1)[1].split(";", 1)[0].strip('"').encode("ascii")
+    fields: dict[str, str] = {}
+    audio = b""
+    for part in body.split(b"--" + boundary)[1:]:
+        if part.startswith(b"--"):
+            break
+        head, _, content = part.partition(b"\r\n\r\n")
+        content = content[:-2] if content.endswith(b"\r\n") else content
+        disposition = head.decode("utf-8", "replace")
+        name = disposition.split('name="', 1)[1].split('"', 1)[0] if 'name="' in disposition else ""
+        if "filename=" in disposition:
+            audio = content
+        else:
+            fields[name] = content.decode("utf-8")
+    return fields, audio
+
+
+def _tone_wav(milliseconds: int, sample_rate: int) -> bytes:
+    frames = int(sample_rate * milliseconds / 1000)
+    period = max(1, sample_rate // 440)
+    pcm = b"".join(
+        int(8000 * math.sin(2 * math.pi * (index % period) / period)).to_bytes(2, "little", signed=True)
+        for index in range(period)
+    )
+    pcm = (pcm * (frames // period + 1))[: frames * 2]
+    return pcm_to_wav_bytes(pcm, sample_rate=sample_rate)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve a stand-in Polyglot backend for offline benchmarks.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--distribution", choices=["fixed", "uniform", "lognormal"], default="lognormal")
+    parser.add_argument("--lookup-ms", type=float, default=5.0)
+    parser.add_argument("--transcript-ms", type=float, default=50.0)
+    parser.add_argument("--inference-ms", type=float, default=200.0)
+    parser.add_argument("--spread", type=float, default=0.25, help="lognormal sigma, or +/- ms for uniform")
+    parser.add_argument("--hit-rate", type=float, default=0.2, help="probability of a text_exact hit on new audio")
+    parser.add_argument("--no-remember-audio", action="store_true")
+    parser.add_argument("--response-ms", type=int, default=1000)
+    parser.add_argument("--chunk-bytes", type=int, default=0)
+    parser.add_argument("--chunk-delay-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--truncate-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    def latency(median_ms: float) -> LatencyModel:
+        return LatencyModel(distribution=args.distribution, median_ms=median_ms, spread=args.spread)
+
+    config = FakeBackendConfig(
+        lookup=latency(args.lookup_ms),
+        transcript=latency(args.transcript_ms),
+        inference=latency(args.inference_ms),
+        remember_audio=not args.no_remember_audio,
+        hit_layers={"text_exact": args.hit_rate},
+        response_ms=args.response_ms,
+        response_chunk_bytes=args.chunk_bytes,
+        response_chunk_delay_ms=args.chunk_delay_ms,
+        error_rate=args.error_rate,
+        drop_rate=args.drop_rate,
+        truncate_rate=args.truncate_rate,
+        seed=args.seed,
+    )
+    logging.basicConfig(level=logging.INFO)
+    backend = FakeBackend(config, host=args.host, port=args.port)
+    backend.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        backend.stop()
+
+
+if __name__ == "__main__":
+    main()
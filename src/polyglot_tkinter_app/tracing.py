@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator
+from uuid import uuid4
+
+from polyglot_tkinter_app.settings.models import TracingSettings
+
+logger = logging.getLogger(__name__)
+
+MAX_OPEN_TRACES = 1024
+
+
+@dataclass(frozen=True)
+class Span:
+    trace_id: str
+    name: str
+    start: float
+    end: float
+    thread: str
+    attrs: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+class Tracer:
+    def __init__(self, *, enabled: bool = False, max_spans: int = 20000):
+        self.enabled = enabled
+        self.export_format = "jsonl"
+        self.export_path: Path | None = None
+        self._spans: deque[Span] = deque(maxlen=max_spans)
+        self._open: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+        self._epoch = time.perf_counter()
+        self._wall_offset = time.time() - self._epoch
+
+    def configure(self, settings: TracingSettings) -> None:
+        with self._lock:
+            self.enabled = settings.enabled
+            self.export_format = settings.export_format
+            self.export_path = Path(settings.export_path)
+            self._spans = deque(self._spans, maxlen=max(1, settings.max_spans))
+
+    def start_trace(self, start: float | None = None) -> str:
+        if not self.enabled:
+            return ""
+        trace_id = uuid4().hex[:16]
+        with self._lock:
+            self._open[trace_id] = time.perf_counter() if start is None else start
+            while len(self._open) > MAX_OPEN_TRACES:
+                self._open.popitem(last=False)
+        return trace_id
+
+    def finish_trace(self, trace_id: str, name: str = "mouth_to_ear", **attrs: Any) -> None:
+        if not (self.enabled and trace_id):
+            return
+        with self._lock:
+            start = self._open.pop(trace_id, None)
+        if start is not None:
+            self.record(trace_id, name, start, **attrs)
+
+    def trace_start(self, trace_id: str) -> float | None:
+        with self._lock:
+            return self._open.get(trace_id)
+
+    def record(self, trace_id: str, name: str, start: float, end: float | None = None, **attrs: Any) -> None:
+        if not (self.enabled and trace_id):
+            return
+        span = Span(
+            trace_id=trace_id,
+            name=name,
+            start=start,
+            end=time.perf_counter() if end is None else end,
+            thread=threading.current_thread().name,
+            attrs=attrs,
+        )
+        with self._lock:
+            self._spans.append(span)
+
+    @contextmanager
+    def span(self, trace_id: str, name: str, **attrs: Any) -> Iterator[None]:
+        if not (self.enabled and trace_id):
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as exc:
+            self.record(trace_id, name, start, error=type(exc).__name__, **attrs)
+            raise
+        self.record(trace_id, name, start, **attrs)
+
+    def spans(self) -> list[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+            self._open.clear()
+
+    def export(self, path: Path | str | None = None, export_format: str | None = None) -> Path | None:
+        target = Path(path) if path is not None else self.export_path
+        spans = self.spans()
+        if target is None or not spans:
+            return None
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if (export_format or self.export_format) == "chrome":
+            target.write_text(json.dumps(self.chrome_trace(spans)), encoding="utf-8")
+        else:
+            with target.open("w", encoding="utf-8") as handle:
+                for span in spans:
+                    handle.write(json.dumps(self.span_record(span)) + "\n")
+        logger.info("traces_exported path=%s spans=%s", target, len(spans))
+        return target
+
+    def span_record(self, span: Span) -> dict[str, Any]:
+        return {
+            "trace_id": span.trace_id,
+            "name": span.name,
+            "start": span.start + self._wall_offset,
+            "duration": span.duration,
+            "thread": span.thread,
+            **span.attrs,
+        }
+
+    def chrome_trace(self, spans: list[Span]) -> dict[str, Any]:
+        lanes: dict[str, int] = {}
+        events = []
+        for span in spans:
+            lane = lanes.setdefault(span.trace_id, len(lanes) + 1)
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": "polyglot",
+                    "ph": "X",
+                    "ts": (span.start - self._epoch) * 1_000_000,
+                    "dur": span.duration * 1_000_000,
+                    "pid": os.getpid(),
+                    "tid": lane,
+                    "args": {"trace_id": span.trace_id, "thread": span.thread, **span.attrs},
+                }
+            )
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": lane, "args": {"name": f"segment {trace_id}"}}
+            for trace_id, lane in lanes.items()
+        ]
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    return _tracer
+
+
+def configure_tracing(settings: TracingSettings) -> Tracer:
+    _tracer.configure(settings)
+    return _tracer
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import threading
+from queue import Queue
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+OVERFLOW_POLICIES = ("drop_oldest", "coalesce", "block")
+BLOCK_POLL_SECONDS = 0.1
+
+
+class BoundedWorkQueue(Queue, Generic[T]):
+    def __init__(self, capacity: int = 0, *, policy: str = "drop_oldest"):
+        super().__init__()
+        self.capacity = max(0, capacity)
+        self.policy = policy if policy in OVERFLOW_POLICIES else "drop_oldest"
+
+    def offer(
+        self,
+        item: T,
+        *,
+        merge: Callable[[T, T], T | None] | None = None,
+        batch: Callable[[T, T], T | None] | None = None,
+        abort: threading.Event | None = None,
+    ) -> tuple[bool, list[T]]:
+        dropped: list[T] = []
+        with self.not_full:
+            if batch is not None and self.queue and self.queue[-1] is not None:
+                batched = batch(self.queue[-1], item)
+                if batched is not None:
+                    self.queue[-1] = batched
+                    return True, dropped
+            while self.capacity and self._pending() >= self.capacity:
+                if self.policy == "coalesce" and merge is not None and self.queue and self.queue[-1] is not None:
+                    merged = merge(self.queue[-1], item)
+                    if merged is not None:
+                        self.queue[-1] = merged
+                        return True, dropped
+                if self.policy == "block" and not (abort is not None and abort.is_set()):
+                    self.not_full.wait(BLOCK_POLL_SECONDS)
+                    continue
+                victim = self._pop_oldest()
+                if victim is None:
+                    break
+                dropped.append(victim)
+            self._put(item)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+        return False, dropped
+
+    def pending(self) -> int:
+        with self.mutex:
+            return self._pending()
+
+    def _pending(self) -> int:
+        return sum(item is not None for item in self.queue)
+
+    def _pop_oldest(self) -> T | None:
+        for item in self.queue:
+            if item is not None:
+                self.queue.remove(item)
+                self.unfinished_tasks -= 1
+                return item
+        return None
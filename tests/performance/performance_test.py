@@ -1,44 +1,325 @@
 from __future__ import annotations
 
 import argparse
+import itertools
+import json
+import math
+import random
+import threading
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 
-import requests
-import urllib3
-
-
-def send_request(url: str, audio_path: Path, language: str, endpoint: str = "process_memory") -> tuple[float, str]:
-    start = time.perf_counter()
-    with audio_path.open("rb") as handle:
-        files = {"file": ("sample.wav", handle, "audio/wav")}
-        data = {
-            "language": language,
-            "speaker_id": "0",
-            "session_id": "performance-test",
-            "domain": "demo",
-            "privacy_level": "transient",
-            "use_semantic_cache": "true",
-            "cache_strategy": "context",
-        }
-        urllib3.disable_warnings(category=urllib3.exceptions.InsecureRequestWarning)
-        response = requests.post(f"{url.rstrip('/')}/{endpoint}", files=files, data=data, verify=False, timeout=120)
-    response.raise_for_status()
-    return time.perf_counter() - start, response.headers.get("X-Polyglot-Cache", "unknown")
-
-
-def main() -> None:
-    parser = argparse.ArgumentParser(description="Run a local semantic-cache performance smoke test.")
-    parser.add_argument("--url", default="https://localhost")
-    parser.add_argument("--audio", default=str(Path(__file__).with_name("sample2.wav")))
-    parser.add_argument("--language", default="ron")
-    parser.add_argument("--iterations", type=int, default=2)
-    args = parser.parse_args()
-
-    audio_path = Path(args.audio)
-    for index in range(args.iterations):
-        elapsed, cache_status = send_request(args.url, audio_path, args.language)
-        print(f"request={index + 1} cache={cache_status} elapsed={elapsed:.3f}s")
+import numpy as np
+
+from polyglot_tkinter_app.api.cache import TranslationCache
+from polyglot_tkinter_app.api.client import TranslationClient
+from polyglot_tkinter_app.api.models import TranslationRequest
+from polyglot_tkinter_app.audio.wav_io import encode_upload
+from polyglot_tkinter_app.paths import OUTPUTS_DIR
+from polyglot_tkinter_app.settings.loader import load_settings
+from polyglot_tkinter_app.settings.models import ApiProfile, RuntimeState
+
+PERFORMANCE_DIR = Path(__file__).resolve().parent
+TIMING_METRICS = ("lookup_time", "transcript_time", "inference_time", "total_time")
+PERCENTILES = (50, 95, 99)
+CODECS = ("wav", "flac", "opus")
+
+
+@dataclass(frozen=True)
+class Sample:
+    name: str
+    uploads: dict[str, bytes]
+
+
+@dataclass(frozen=True)
+class RequestResult:
+    sample: str
+    language: str
+    scheduled_at: float
+    started_at: float
+    finished_at: float
+    ok: bool
+    error: str = ""
+    cache_status: str = "error"
+    cache_layer: str = "error"
+    lookup_time: float | None = None
+    transcript_time: float | None = None
+    inference_time: float | None = None
+    total_time: float | None = None
+
+    @property
+    def latency(self) -> float:
+        return self.finished_at - self.scheduled_at
+
+
+class RequestMix:
+    def __init__(self, samples: list[Sample], languages: list[str], *, seed: int):
+        self._pairs = list(itertools.product(samples, languages))
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def next(self) -> tuple[Sample, str]:
+        with self._lock:
+            return self._random.choice(self._pairs)
+
+
+class LoadRunner:
+    def __init__(self, client: TranslationClient, mix: RequestMix, *, session_id: str, codec: str = "wav"):
+        self.client = client
+        self.mix = mix
+        self.session_id = session_id
+        self.codec = codec
+        self.results: list[RequestResult] = []
+        self._results_lock = threading.Lock()
+
+    def run_concurrency(self, *, concurrency: int, duration: float, ramp_up: float) -> None:
+        deadline = time.perf_counter() + duration
+        threads = []
+        for index in range(concurrency):
+            delay = ramp_up * index / concurrency
+            thread = threading.Thread(target=self._closed_loop, args=(delay, deadline), daemon=True)
+            thread.start()
+            threads.append(thread)
+        for thread in threads:
+            thread.join()
+
+    def run_rps(self, *, rps: float, duration: float, ramp_up: float, max_in_flight: int) -> None:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            for arrival in itertools.count():
+                offset = _arrival_offset(arrival, rps=rps, ramp_up=ramp_up)
+                if offset >= duration:
+                    break
+                scheduled = started + offset
+                now = time.perf_counter()
+                if scheduled > now:
+                    time.sleep(scheduled - now)
+                executor.submit(self._send, scheduled)
+
+    def _closed_loop(self, delay: float, deadline: float) -> None:
+        time.sleep(delay)
+        while time.perf_counter() < deadline:
+            self._send(time.perf_counter())
+
+    def _send(self, scheduled_at: float) -> None:
+        sample, language = self.mix.next()
+        request = TranslationRequest(
+            audio_bytes=sample.uploads[self.codec],
+            target_language=language,
+            speaker_id="0",
+            session_id=self.session_id,
+            domain="demo",
+            privacy_level="transient",
+            use_semantic_cache=True,
+            cache_strategy="context",
+            audio_codec=self.codec,
+        )
+        started_at = time.perf_counter()
+        try:
+            response = self.client.translate(request)
+        except Exception as exc:
+            result = RequestResult(
+                sample=sample.name,
+                language=language,
+                scheduled_at=scheduled_at,
+                started_at=started_at,
+                finished_at=time.perf_counter(),
+                ok=False,
+                error=str(exc),
+            )
+        else:
+            result = RequestResult(
+                sample=sample.name,
+                language=language,
+                scheduled_at=scheduled_at,
+                started_at=started_at,
+                finished_at=time.perf_counter(),
+                ok=True,
+                cache_status=response.cache_status,
+                cache_layer=response.cache_layer,
+                lookup_time=response.lookup_time,
+                transcript_time=response.transcript_time,
+                inference_time=response.inference_time,
+                total_time=response.total_time,
+            )
+        with self._results_lock:
+            self.results.append(result)
+
+
+def _arrival_offset(arrival: int, *, rps: float, ramp_up: float) -> float:
+    ramp_arrivals = rps * ramp_up / 2
+    if arrival < ramp_arrivals:
+        return math.sqrt(2 * arrival * ramp_up / rps)
+    return ramp_up + (arrival - ramp_arrivals) / rps
+
+
+def summarize(results: list[RequestResult], *, wall_time: float) -> dict[str, Any]:
+    completed = [result for result in results if result.ok]
+    layers = Counter(result.cache_layer for result in completed)
+    summary: dict[str, Any] = {
+        "requests": len(results),
+        "completed": len(completed),
+        "errors": len(results) - len(completed),
+        "wall_time": wall_time,
+        "throughput_rps": len(completed) / wall_time if wall_time > 0 else 0.0,
+        "cache_hit_ratio": _ratio(sum(result.cache_status == "hit" for result in completed), len(completed)),
+        "cache_layers": {layer: _ratio(count, len(completed)) for layer, count in sorted(layers.items())},
+        "latency": _percentiles([result.latency for result in completed]),
+    }
+    for metric in TIMING_METRICS:
+        summary[metric] = _percentiles([getattr(result, metric) for result in completed])
+    summary["error_samples"] = sorted({result.error for result in results if not result.ok})[:10]
+    return summary
+
+
+def _percentiles(values: list[float | None]) -> dict[str, float] | None:
+    observed = np.array([value for value in values if value is not None], dtype=float)
+    if not observed.size:
+        return None
+    stats = {f"p{percentile}": float(np.percentile(observed, percentile)) for percentile in PERCENTILES}
+    stats["mean"] = float(observed.mean())
+    stats["max"] = float(observed.max())
+    return stats
+
+
+def _relative(record: dict[str, Any], origin: float) -> dict[str, Any]:
+    for key in ("scheduled_at", "started_at", "finished_at"):
+        record[key] -= origin
+    return record
+
+
+def _ratio(count: int, total: int) -> float:
+    return count / total if total else 0.0
+
+
+def load_samples(paths: list[str], codecs: list[str]) -> list[Sample]:
+    samples = []
+    for raw_path in paths:
+        path = Path(raw_path)
+        files = sorted(path.glob("*.wav")) if path.is_dir() else [path]
+        for file in files:
+            if not file.stat().st_size:
+                continue
+            wav_bytes = file.read_bytes()
+            uploads = {codec: bytes(encode_upload(wav_bytes, codec)) for codec in dict.fromkeys(codecs)}
+            samples.append(Sample(name=file.name, uploads=uploads))
+    if not samples:
+        raise SystemExit("no WAV samples found")
+    return samples
+
+
+def build_client(args: argparse.Namespace) -> TranslationClient:
+    settings = load_settings(args.config)
+    api = replace(settings.api, max_connections=max(args.concurrency or 0, args.max_in_flight, 1))
+    if args.url:
+        profiles = {**api.profiles, "benchmark": ApiProfile(base_url=args.url, verify_ssl=not args.insecure)}
+        api = replace(api, profile="benchmark", profiles=profiles)
+    settings = replace(settings, api=api)
+    runtime = RuntimeState.from_settings(settings)
+    cache = TranslationCache.from_settings(settings) if args.client_cache else None
+    return TranslationClient(runtime, cache=cache)
+
+
+def print_summary(summary: dict[str, Any]) -> None:
+    print(
+        f"requests={summary['requests']} errors={summary['errors']} "
+        f"throughput={summary['throughput_rps']:.2f}rps hit_ratio={summary['cache_hit_ratio']:.2%}"
+    )
+    for metric in ("latency", *TIMING_METRICS):
+        stats = summary[metric]
+        if stats:
+            print(f"{metric:<16}" + " ".join(f"p{p}={stats[f'p{p}'] * 1000:.1f}ms" for p in PERCENTILES))
+    for layer, ratio in summary["cache_layers"].items():
+        print(f"cache_layer={layer} ratio={ratio:.2%}")
+    for name, size in summary["upload_bytes"].items():
+        print(f"sample={name} upload_bytes={size}")
+
+
+def print_codec_table(runs: list[dict[str, Any]]) -> None:
+    print(
+        f"{'codec':<6} {'requests':>8} {'errors':>6} {'rps':>8} {'hit_ratio':>9} "
+        f"{'p50_ms':>8} {'p95_ms':>8} {'upload_bytes':>12}"
+    )
+    for run in runs:
+        summary = run["summary"]
+        latency = summary["latency"] or {}
+        print(
+            f"{run['codec']:<6} {summary['requests']:>8} {summary['errors']:>6} "
+            f"{summary['throughput_rps']:>8.2f} {summary['cache_hit_ratio']:>9.2%} "
+            f"{latency.get('p50', 0.0) * 1000:>8.1f} {latency.get('p95', 0.0) * 1000:>8.1f} "
+            f"{sum(summary['upload_bytes'].values()):>12}"
+        )
+
+
+def run_codec(args: argparse.Namespace, samples: list[Sample], codec: str) -> dict[str, Any]:
+    mix = RequestMix(samples, args.language or ["ron"], seed=args.seed)
+    runner = LoadRunner(build_client(args), mix, session_id=f"benchmark-{codec}-{int(time.time())}", codec=codec)
+    started = time.perf_counter()
+    if args.rps is not None:
+        runner.run_rps(rps=args.rps, duration=args.duration, ramp_up=args.ramp_up, max_in_flight=args.max_in_flight)
+    else:
+        runner.run_concurrency(concurrency=args.concurrency, duration=args.duration, ramp_up=args.ramp_up)
+    summary = summarize(runner.results, wall_time=time.perf_counter() - started)
+    summary["upload_bytes"] = {sample.name: len(sample.uploads[codec]) for sample in samples}
+    return {
+        "codec": codec,
+        "summary": summary,
+        "results": [_relative(asdict(result), started) for result in runner.results],
+    }
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Drive TranslationClient against a Polyglot backend under load.")
+    parser.add_argument("--config", default="config.json")
+    parser.add_argument("--url", help="override the configured backend profile")
+    parser.add_argument("--insecure", action="store_true", help="skip TLS verification for --url")
+    parser.add_argument("--audio", action="append", help="WAV file or directory of WAVs; repeatable")
+    parser.add_argument("--language", action="append", help="target language; repeatable")
+    load = parser.add_mutually_exclusive_group()
+    load.add_argument("--rps", type=float, help="open-loop arrival rate")
+    load.add_argument("--concurrency", type=int, help="closed-loop workers")
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--ramp-up", type=float, default=5.0)
+    parser.add_argument("--max-in-flight", type=int, default=64)
+    parser.add_argument("--codec", action="append", choices=CODECS, help="upload codec; repeatable, one run per codec")
+    parser.add_argument("--client-cache", action="store_true", help="keep the client-side cache in the loop")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="results JSON path")
+    args = parser.parse_args(argv)
+    if args.rps is None and args.concurrency is None:
+        args.concurrency = 1
+    args.codec = list(dict.fromkeys(args.codec or ["wav"]))
+    return args
+
+
+def main(argv: list[str] | None = None) -> Path:
+    args = parse_args(argv)
+    samples = load_samples(args.audio or [str(PERFORMANCE_DIR)], args.codec)
+
+    started_at = datetime.now(timezone.utc)
+    runs = []
+    for codec in args.codec:
+        run = run_codec(args, samples, codec)
+        print(f"codec={codec}")
+        print_summary(run["summary"])
+        runs.append(run)
+    print_codec_table(runs)
+
+    output = Path(args.output) if args.output else OUTPUTS_DIR / "benchmarks" / f"{started_at:%Y%m%dT%H%M%SZ}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    config = dict(vars(args))
+    config["samples"] = [sample.name for sample in samples]
+    output.write_text(
+        json.dumps({"started_at": started_at.isoformat(), "config": config, "runs": runs}, indent=2),
+        encoding="utf-8",
+    )
+    print(f"results={output}")
+    return output
 
 
 if __name__ == "__main__":
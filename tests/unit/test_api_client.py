@@ -1,5 +1,9 @@
+import pytest
+import requests
+
 from polyglot_tkinter_app.api.client import TranslationClient
 from polyglot_tkinter_app.api.models import TranslationRequest
+from polyglot_tkinter_app.api.streaming import StreamedAudio, StreamedAudioError
 from polyglot_tkinter_app.settings.loader import load_settings
 from polyglot_tkinter_app.settings.models import RuntimeState
 
@@ -88,11 +92,13 @@ def test_translate_builds_request_and_parses_cache_headers():
 
     url, kwargs = session.last_post
     assert url == "https://localhost/process_memory/"
-    assert kwargs["data"]["language"] == "ron"
-    assert kwargs["data"]["session_id"] == "session-a"
-    assert kwargs["data"]["source_language"] == "ron"
-    assert kwargs["data"]["use_semantic_cache"] == "true"
-    assert kwargs["data"]["use_transcript_memory"] == "true"
+    assert kwargs["data"].fields["language"] == "ron"
+    assert kwargs["data"].fields["session_id"] == "session-a"
+    assert kwargs["data"].fields["source_language"] == "ron"
+    assert kwargs["data"].fields["use_semantic_cache"] == "true"
+    assert kwargs["data"].fields["use_transcript_memory"] == "true"
+    prepared = requests.Request("POST", url, data=kwargs["data"], headers=kwargs["headers"]).prepare()
+    assert prepared.headers["Content-Length"] == str(len(b"".join(kwargs["data"])))
     assert response.audio_bytes == b"translated"
     assert response.cache_status == "hit"
     assert response.cache_strategy == "exact"
@@ -105,3 +111,101 @@ def test_translate_builds_request_and_parses_cache_headers():
     assert response.source_transcript == "Câine!"
     assert response.normalized_source_text == "caine"
     assert response.decision == "normalized transcript match"
+
+
+def test_translate_labels_compressed_upload_with_codec_mime_type():
+    runtime = RuntimeState.from_settings(load_settings("missing-config.json"))
+    session = FakeSession()
+    client = TranslationClient(runtime, session=session)
+
+    client.translate(
+        TranslationRequest(
+            audio_bytes=b"fLaC-payload",
+            target_language="eng",
+            speaker_id="0",
+            session_id="session-a",
+            audio_codec="flac",
+        )
+    )
+
+    _, kwargs = session.last_post
+    body = b"".join(kwargs["data"])
+    assert b'filename="audio.flac"\r\nContent-Type: audio/flac\r\n\r\nfLaC-payload' in body
+
+
+def test_translate_stream_sends_chunked_multipart_body():
+    runtime = RuntimeState.from_settings(load_settings("missing-config.json"))
+    session = FakeSession()
+    client = TranslationClient(runtime, session=session)
+
+    response = client.translate_stream(
+        TranslationRequest(
+            audio_bytes=b"",
+            target_language="eng",
+            speaker_id="0",
+            session_id="session-a",
+        ),
+        iter([b"RIFF-header", b"frame-1", b"frame-2"]),
+    )
+
+    url, kwargs = session.last_post
+    body = b"".join(kwargs["data"])
+    boundary = kwargs["headers"]["Content-Type"].split("boundary=")[1]
+    assert url == "https://localhost/process_memory/"
+    assert "files" not in kwargs
+    assert body.startswith(f"--{boundary}\r\n".encode())
+    assert body.endswith(f"\r\n--{boundary}--\r\n".encode())
+    assert b'name="language"\r\n\r\neng\r\n' in body
+    assert b'filename="audio.wav"\r\nContent-Type: audio/wav\r\n\r\nRIFF-headerframe-1frame-2' in body
+    assert response.cache_layer == "text_exact"
+
+
+def test_translate_with_streamed_audio_defers_body_to_iterator():
+    class StreamingResponse(FakeResponse):
+        def __init__(self):
+            super().__init__(headers={"X-Polyglot-Cache": "miss"})
+            self.closed = False
+
+        def iter_content(self, chunk_size):
+            yield b"RIFF"
+            yield b"rest"
+
+        def close(self):
+            self.closed = True
+
+    class StreamingSession(FakeSession):
+        def post(self, url, **kwargs):
+            self.last_post = (url, kwargs)
+            self.response = StreamingResponse()
+            return self.response
+
+    runtime = RuntimeState.from_settings(load_settings("missing-config.json"))
+    session = StreamingSession()
+    client = TranslationClient(runtime, session=session)
+
+    response = client.translate(
+        TranslationRequest(audio_bytes=b"wav", target_language="eng", speaker_id="0", session_id="s"),
+        stream_audio=True,
+    )
+
+    assert session.last_post[1]["stream"] is True
+    assert response.audio_bytes == b""
+    assert list(response.audio_stream) == [b"RIFF", b"rest"]
+    assert response.audio_stream.wait(timeout=1) == b"RIFFrest"
+    assert session.response.closed is True
+
+
+def test_streamed_audio_closed_early_fails_without_running_callbacks():
+    completed = []
+    stream = StreamedAudio([b"RIFF", b"rest"])
+    stream.add_done_callback(completed.append)
+
+    chunks = iter(stream)
+    assert next(chunks) == b"RIFF"
+    chunks.close()
+
+    with pytest.raises(StreamedAudioError):
+        stream.wait(timeout=1)
+    with pytest.raises(StreamedAudioError):
+        stream.read_all()
+    assert completed == []
@@ -0,0 +1,159 @@
+import json
+import threading
+import time
+from dataclasses import replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from polyglot_tkinter_app.api.async_client import AsyncTranslationClient
+from polyglot_tkinter_app.api.client import TranslationClient
+from polyglot_tkinter_app.api.event_loop import ClientEventLoop
+from polyglot_tkinter_app.api.keepalive import ConnectionWarmer
+from polyglot_tkinter_app.api.models import TranslationRequest
+from polyglot_tkinter_app.audio.wav_io import pcm_to_wav_bytes
+from polyglot_tkinter_app.orchestration.translation_flow import TranslationFlow
+from polyglot_tkinter_app.settings.loader import load_settings
+from polyglot_tkinter_app.settings.models import ApiProfile, RuntimeState, TargetLane
+from polyglot_tkinter_app.testing import FakeBackend, FakeBackendConfig, LatencyModel
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        with KeepAliveHandler.lock:
+            KeepAliveHandler.connections += 1
+
+    def do_GET(self):
+        self._send(200, json.dumps({"status": True, "model_loaded": True}).encode(), "application/json")
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        time.sleep(0.05)
+        language = b"ron" if b'name="language"\r\n\r\nron' in body else b"other"
+        self._send(200, b"RIFF" + language, "audio/wav", {"X-Polyglot-Cache": "miss", "X-Polyglot-Inference-Time": "0.5"})
+
+    def _send(self, status, payload, content_type, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class RecordingPlayer:
+    def __init__(self):
+        self.enqueued = []
+
+    def start(self):
+        pass
+
+    def enqueue(self, audio_bytes, output_device=None, trace_id=""):
+        self.enqueued.append(audio_bytes)
+
+    def stop(self):
+        pass
+
+
+class UnusedClient:
+    def translate(self, request, **options):
+        raise AssertionError("translation bypassed the shared client loop")
+
+
+def _runtime(port, max_connections):
+    return _runtime_for(f"http://127.0.0.1:{port}/", max_connections)
+
+
+def _runtime_for(base_url, max_connections):
+    settings = load_settings("missing-config.json")
+    api = replace(
+        settings.api,
+        profiles={"local": ApiProfile(base_url=base_url, verify_ssl=False)},
+        max_connections=max_connections,
+    )
+    return RuntimeState.from_settings(replace(settings, api=api))
+
+
+def test_async_client_shares_pooled_keep_alive_connections():
+    KeepAliveHandler.connections = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    loop = ClientEventLoop()
+    client = AsyncTranslationClient(_runtime(server.server_address[1], max_connections=2))
+    try:
+        health = loop.submit(client.health()).result(timeout=5)
+        futures = [
+            loop.submit(
+                client.translate(
+                    TranslationRequest(audio_bytes=b"wav", target_language="ron", speaker_id="0", session_id="s")
+                )
+            )
+            for _ in range(6)
+        ]
+        responses = [future.result(timeout=5) for future in futures]
+        loop.submit(client.aclose()).result(timeout=5)
+    finally:
+        loop.stop()
+        server.shutdown()
+        server.server_close()
+
+    assert health.online is True
+    assert health.model_loaded is True
+    assert [response.audio_bytes for response in responses] == [b"RIFFron"] * 6
+    assert responses[0].cache_status == "miss"
+    assert responses[0].inference_time == 0.5
+    assert client.pool.connections_opened <= 2
+    assert KeepAliveHandler.connections <= 2
+
+
+def test_translation_flow_sends_segments_and_lanes_through_the_shared_loop():
+    config = FakeBackendConfig(inference=LatencyModel(median_ms=20.0), hit_layers={}, response_ms=100)
+    player = RecordingPlayer()
+    lane_player = RecordingPlayer()
+    completed = threading.Semaphore(0)
+    with FakeBackend(config) as backend:
+        runtime = _runtime_for(backend.base_url, max_connections=2)
+        runtime.extra_targets = [TargetLane("deu")]
+        flow = TranslationFlow(
+            runtime=runtime,
+            client=UnusedClient(),
+            player=player,
+            lane_player_factory=lambda name: lane_player,
+            async_client=AsyncTranslationClient(runtime),
+            on_translation_completed=lambda response: completed.release(),
+        )
+        for sample in (b"\x01\x00", b"\x02\x00", b"\x03\x00"):
+            flow.submit_wav(pcm_to_wav_bytes(sample * 800), reason="test")
+        for _ in range(3):
+            assert completed.acquire(timeout=5)
+        flow.stop()
+
+    assert len(player.enqueued) == 3
+    assert len(lane_player.enqueued) == 3
+    assert backend.requests == 6
+    assert backend.connections <= 2
+
+
+def test_connection_warmer_opens_async_pool_connections_when_nothing_streams():
+    with FakeBackend(FakeBackendConfig(hit_layers={})) as backend:
+        runtime = _runtime_for(backend.base_url, max_connections=4)
+        client = TranslationClient(runtime)
+        async_client = AsyncTranslationClient.from_client(client)
+        warmer = ConnectionWarmer.from_settings(
+            client,
+            replace(runtime.settings, api=replace(runtime.settings.api, prewarm_connections=3)),
+            async_client=async_client,
+        )
+        opened = warmer.warm()
+
+    assert warmer.client is async_client
+    assert opened == 3
+    assert async_client.pool.connections_opened == 3
+    assert backend.connections == 3
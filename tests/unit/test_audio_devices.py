@@ -1,3 +1,7 @@
+import logging
+import threading
+
+from polyglot_tkinter_app.audio import devices
 from polyglot_tkinter_app.audio.devices import AudioDevice, AudioDeviceRegistry
 
 
@@ -31,3 +35,76 @@ def test_find_virtual_cable_output(monkeypatch):
     )
 
     assert registry.find_virtual_cable_output().index == 2
+
+
+class FakePortAudio:
+    instances = 0
+    infos = []
+    failures = 0
+
+    class PyAudio:
+        def __init__(self):
+            FakePortAudio.instances += 1
+
+        def get_device_count(self):
+            if FakePortAudio.failures:
+                FakePortAudio.failures -= 1
+                raise OSError("PortAudio enumeration failed")
+            return len(FakePortAudio.infos)
+
+        def get_device_info_by_index(self, index):
+            return FakePortAudio.infos[index]
+
+        def get_default_input_device_info(self):
+            return FakePortAudio.infos[0]
+
+        def get_default_output_device_info(self):
+            raise OSError("no default output")
+
+        def terminate(self):
+            pass
+
+
+def test_registry_serves_queries_from_one_snapshot_and_reports_changes(monkeypatch):
+    monkeypatch.setattr(devices, "_load_pyaudio", lambda: FakePortAudio)
+    FakePortAudio.instances = 0
+    FakePortAudio.infos = [
+        {"index": 0, "name": "Mic", "maxInputChannels": 1},
+        {"index": 1, "name": "Speakers", "maxOutputChannels": 2},
+    ]
+    changes = []
+    registry = AudioDeviceRegistry(on_change=changes.append)
+
+    registry.list_input_devices()
+    registry.list_output_devices()
+    default_input = registry.get_default_input_device()
+    default_output = registry.get_default_output_device()
+    registry.find_virtual_cable_output()
+    registry.refresh()
+    FakePortAudio.infos = [*FakePortAudio.infos, {"index": 2, "name": "CABLE Input", "maxOutputChannels": 2}]
+    registry.refresh()
+
+    assert FakePortAudio.instances == 3
+    assert default_input.name == "Mic"
+    assert default_output.name == "Speakers"
+    assert len(changes) == 1
+    assert registry.find_virtual_cable_output().index == 2
+
+
+def test_monitor_survives_enumeration_failures_and_picks_up_changes(monkeypatch, caplog):
+    monkeypatch.setattr(devices, "_load_pyaudio", lambda: FakePortAudio)
+    FakePortAudio.infos = [{"index": 0, "name": "Mic", "maxInputChannels": 1}]
+    changed = threading.Event()
+    registry = AudioDeviceRegistry(on_change=lambda snapshot: changed.set())
+    registry.snapshot()
+    FakePortAudio.failures = 2
+    FakePortAudio.infos = [*FakePortAudio.infos, {"index": 1, "name": "Headset", "maxInputChannels": 1}]
+
+    with caplog.at_level(logging.WARNING, logger="polyglot_tkinter_app.audio.devices"):
+        registry.start_monitor(0.01)
+        assert changed.wait(timeout=2)
+        registry.stop_monitor()
+
+    failures = [message for message in caplog.messages if message.startswith("audio_device_refresh_failed")]
+    assert failures == ["audio_device_refresh_failed error=PortAudio enumeration failed"] * 2
+    assert [device.name for device in registry.list_input_devices()] == ["Mic", "Headset"]
@@ -0,0 +1,145 @@
+import logging
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+from polyglot_tkinter_app.api.models import TranslationResponse
+from polyglot_tkinter_app.app.daemon import TranslationDaemon, shared_client
+from polyglot_tkinter_app.orchestration.translation_flow import WORK_QUEUE_DEPTH
+from polyglot_tkinter_app.audio.devices import AudioDevice
+from polyglot_tkinter_app.audio.wav_io import pcm_to_wav_bytes
+from polyglot_tkinter_app.settings.loader import load_settings
+
+SRC = Path(__file__).resolve().parents[2] / "src"
+
+
+class FakeRegistry:
+    def __init__(self):
+        self.inputs = [
+            AudioDevice(index=1, name="Booth 1 Mic", input_channels=1),
+            AudioDevice(index=2, name="Booth 2 Mic", input_channels=1),
+        ]
+        self.outputs = [
+            AudioDevice(index=10, name="Speakers", output_channels=2),
+            AudioDevice(index=11, name="Booth 1 Headphones", output_channels=2),
+        ]
+
+    def list_input_devices(self):
+        return self.inputs
+
+    def list_output_devices(self):
+        return self.outputs
+
+    def get_default_output_device(self):
+        return self.outputs[0]
+
+
+class FakePlayer:
+    def __init__(self):
+        self.enqueued = []
+
+    def start(self):
+        pass
+
+    def enqueue(self, audio_bytes, output_device=None, trace_id=""):
+        self.enqueued.append((audio_bytes, output_device))
+
+    def stop(self):
+        pass
+
+
+class SharedClient:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = []
+
+    def translate(self, request):
+        with self.lock:
+            self.requests.append(request)
+        return TranslationResponse(audio_bytes=f"out-{request.target_language}".encode())
+
+
+def _settings(tmp_path):
+    config_path = tmp_path / "config.json"
+    config_path.write_text(
+        """
+        {
+          "pipeline": {"fanout_targets": [{"language": "fra"}]},
+          "daemon": {
+            "sessions": [
+              {"name": "booth-1", "input_device": "booth 1", "output_device": "Booth 1 Headphones", "target_language": "deu"},
+              {"name": "booth-2", "input_device": "Booth 2", "output_device": "missing", "target_language": "spa", "speaker_id": "4"},
+              {"name": "booth-3", "input_device": "Booth 3"},
+              {"output_device": "Speakers"}
+            ]
+          }
+        }
+        """,
+        encoding="utf-8",
+    )
+    return load_settings(config_path)
+
+
+def test_daemon_import_does_not_load_tkinter():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, polyglot_tkinter_app.app.daemon; "
+            "print(sorted(m for m in sys.modules if m == 'tkinter' or m.startswith(('tkinter.', '_tkinter'))))",
+        ],
+        capture_output=True,
+        text=True,
+        cwd=SRC,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "[]"
+
+
+def test_daemon_runs_one_flow_per_device_pair_on_shared_client(tmp_path, caplog):
+    caplog.set_level(logging.INFO, logger="polyglot_tkinter_app.app.daemon")
+    settings = _settings(tmp_path)
+    client = SharedClient()
+    players = {}
+
+    def player_factory(name):
+        players[name] = FakePlayer()
+        return players[name]
+
+    daemon = TranslationDaemon(settings, client=client, registry=FakeRegistry(), player_factory=player_factory)
+    sessions = daemon.build_sessions()
+
+    assert [session.name for session in sessions] == ["booth-1", "booth-2"]
+    assert [session.runtime.input_device.index for session in sessions] == [1, 2]
+    assert [session.runtime.output_device.index for session in sessions] == [11, 10]
+    assert sessions[1].runtime.speaker_id == "4"
+    assert all(session.runtime.extra_targets == [] for session in sessions)
+    assert sessions[0].runtime.session_id != sessions[1].runtime.session_id
+    assert (
+        "daemon_session_ready session=booth-1 input=Booth 1 Mic output=Booth 1 Headphones target=deu" in caplog.messages
+    )
+    assert "daemon_session_ready session=booth-2 input=Booth 2 Mic output=Speakers target=spa" in caplog.messages
+
+    wav_bytes = pcm_to_wav_bytes(b"\x00\x00" * 160, sample_rate=16000, channels=1, sample_width=2)
+    for session in sessions:
+        session.flow.submit_wav(wav_bytes)
+    daemon.shutdown()
+
+    assert sorted(request.target_language for request in client.requests) == ["deu", "spa"]
+    assert players["booth-1"].enqueued[0][0] == b"out-deu"
+    assert players["booth-1"].enqueued[0][1].index == 11
+    assert players["booth-2"].enqueued[0][0] == b"out-spa"
+    labels = {dict(key).get("session") for _, key, _ in WORK_QUEUE_DEPTH.samples()}
+    assert {"booth-1", "booth-2"} <= labels
+
+
+def test_shared_client_pool_covers_every_session_worker(tmp_path):
+    settings = _settings(tmp_path)
+
+    client = shared_client(settings)
+
+    assert client.runtime.settings.api.max_connections == max(
+        settings.api.max_connections, len(settings.daemon.sessions) * settings.pipeline.translation_workers
+    )
@@ -0,0 +1,60 @@
+import hashlib
+
+from polyglot_tkinter_app.api.cache import TranslationCache
+from polyglot_tkinter_app.api.disk_cache import DiskTranslationStore
+from polyglot_tkinter_app.api.models import TranslationRequest, TranslationResponse
+
+
+def _key(value):
+    return hashlib.sha256(value).hexdigest()
+
+
+def test_disk_store_rebuilds_index_after_restart_and_drops_torn_tail(tmp_path):
+    store = DiskTranslationStore(tmp_path)
+    store.put(_key(b"a"), TranslationResponse(audio_bytes=b"audio-a", cache_layer="miss", raw_headers={"X": "1"}), 60)
+    store.put(_key(b"b"), TranslationResponse(audio_bytes=b"audio-b"), 60)
+    store.close()
+    with store.path.open("ab") as handle:
+        handle.write(b"PGC1-partial-record")
+
+    reopened = DiskTranslationStore(tmp_path)
+    response = reopened.get(_key(b"a"))
+
+    assert len(reopened) == 2
+    assert response.audio_bytes == b"audio-a"
+    assert response.cache_layer == "miss"
+    assert response.raw_headers == {"X": "1"}
+    assert reopened.path.stat().st_size == reopened.file_size
+    reopened.close()
+
+
+def test_disk_store_caps_size_and_compacts_dead_records(tmp_path):
+    store = DiskTranslationStore(tmp_path, max_bytes=100)
+    for index in range(12):
+        store.put(_key(bytes([index])), TranslationResponse(audio_bytes=bytes([index]) * 40), 60)
+
+    assert store.live_bytes <= 100
+    assert store.file_size < 3 * len(store) * 400
+    assert store.get(_key(bytes([11]))).audio_bytes == bytes([11]) * 40
+    assert store.get(_key(bytes([0]))) is None
+
+    store.compact()
+    store.close()
+    reopened = DiskTranslationStore(tmp_path, max_bytes=100)
+    assert reopened.get(_key(bytes([11]))).audio_bytes == bytes([11]) * 40
+    reopened.close()
+
+
+def test_translation_cache_warm_starts_from_disk_store(tmp_path):
+    request = TranslationRequest(audio_bytes=b"wav", target_language="eng", speaker_id="0", session_id="s")
+    first = TranslationCache(store=DiskTranslationStore(tmp_path))
+    first.put(request, TranslationResponse(audio_bytes=b"translated", cache_layer="miss"))
+    first.store.close()
+
+    restarted = TranslationCache(store=DiskTranslationStore(tmp_path))
+    response = restarted.get(request)
+
+    assert response.audio_bytes == b"translated"
+    assert response.cache_layer == "client"
+    assert len(restarted) == 1
+    restarted.store.close()
@@ -0,0 +1,128 @@
+import subprocess
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from polyglot_tkinter_app.api.cache import TranslationCache
+from polyglot_tkinter_app.api.client import TranslationClient, TranslationClientError
+from polyglot_tkinter_app.api.models import TranslationRequest
+from polyglot_tkinter_app.api.streaming import StreamedAudioError
+from polyglot_tkinter_app.audio.wav_io import pcm_to_wav_bytes
+from polyglot_tkinter_app.settings.loader import load_settings
+from polyglot_tkinter_app.settings.models import ApiProfile, RuntimeState
+from polyglot_tkinter_app.testing import FakeBackend, FakeBackendConfig, LatencyModel
+
+SRC = Path(__file__).resolve().parents[2] / "src"
+
+
+def _client(base_url, cache=None):
+    settings = load_settings("missing-config.json")
+    api = replace(settings.api, profiles={"local": ApiProfile(base_url=base_url, verify_ssl=False)})
+    return TranslationClient(RuntimeState.from_settings(replace(settings, api=api)), cache=cache)
+
+
+def _request(audio_bytes=b"", **overrides):
+    fields = {"target_language": "ron", "speaker_id": "0", "session_id": "fake"}
+    fields.update(overrides)
+    return TranslationRequest(audio_bytes=audio_bytes, **fields)
+
+
+def test_fake_backend_serves_health_and_repeat_audio_hits():
+    config = FakeBackendConfig(
+        inference=LatencyModel(median_ms=20.0),
+        hit_layers={},
+        response_ms=100,
+        response_chunk_bytes=512,
+    )
+    wav_bytes = pcm_to_wav_bytes(b"\x01\x00" * 800)
+    with FakeBackend(config) as backend:
+        client = _client(backend.base_url)
+        health = client.health()
+        first = client.translate(_request(wav_bytes))
+        second = client.translate_stream(_request(), iter([wav_bytes[:100], wav_bytes[100:]]))
+
+    assert health.online is True
+    assert health.device == "fake"
+    assert first.cache_status == "miss"
+    assert first.cache_layer == "none"
+    assert first.inference_time == 0.02
+    assert first.audio_bytes.startswith(b"RIFF")
+    assert len(first.audio_bytes) == 44 + 3200
+    assert second.cache_status == "hit"
+    assert second.cache_layer == "audio_exact"
+    assert second.inference_time == 0.0
+    assert backend.requests == 2
+    assert backend.connections == 1
+
+
+def test_fake_backend_injects_failures():
+    with FakeBackend(FakeBackendConfig(error_rate=1.0, error_status=503)) as backend:
+        client = _client(backend.base_url)
+        with pytest.raises(TranslationClientError, match="HTTP 503"):
+            client.translate(_request(b"wav"))
+
+
+def test_prewarm_opens_pooled_connections_that_translations_reuse():
+    wav_bytes = pcm_to_wav_bytes(b"\x01\x00" * 800)
+    with FakeBackend(FakeBackendConfig(inference=LatencyModel(median_ms=1.0))) as backend:
+        client = _client(backend.base_url)
+        opened = client.prewarm(3)
+        warmed_connections = backend.connections
+        client.translate(_request(wav_bytes))
+
+    assert opened == 3
+    assert warmed_connections == 3
+    assert backend.connections == 3
+    assert backend.requests == 1
+
+
+def test_streamed_download_is_cached_under_the_audio_that_was_sent():
+    config = FakeBackendConfig(inference=LatencyModel(median_ms=1.0), response_chunk_bytes=512)
+    wav_bytes = pcm_to_wav_bytes(b"\x01\x00" * 800)
+    audio = bytearray(wav_bytes)
+    cache = TranslationCache()
+    with FakeBackend(config) as backend:
+        client = _client(backend.base_url, cache=cache)
+        response = client.translate(_request(memoryview(audio)), stream_audio=True)
+        audio[-2:] = b"\x09\x00"
+        audio_bytes = response.audio_stream.read_all()
+
+    assert cache.get(_request(wav_bytes)).audio_bytes == audio_bytes
+    assert cache.get(_request(bytes(audio))) is None
+
+
+def test_truncated_streamed_download_fails_and_is_not_cached():
+    config = FakeBackendConfig(inference=LatencyModel(median_ms=1.0), response_chunk_bytes=512, truncate_rate=1.0)
+    wav_bytes = pcm_to_wav_bytes(b"\x01\x00" * 800)
+    cache = TranslationCache()
+    with FakeBackend(config) as backend:
+        client = _client(backend.base_url, cache=cache)
+        response = client.translate(_request(wav_bytes), stream_audio=True)
+        stream = response.audio_stream
+        received = []
+        with pytest.raises(Exception):
+            for chunk in stream:
+                received.append(chunk)
+
+        with pytest.raises(StreamedAudioError):
+            stream.wait(timeout=1)
+        with pytest.raises(StreamedAudioError):
+            stream.read_all()
+
+    assert len(b"".join(received)) == 512
+    assert len(cache) == 0
+    assert cache.get(_request(wav_bytes)) is None
+
+
+def test_fake_backend_runs_as_a_module_without_runpy_warning():
+    result = subprocess.run(
+        [sys.executable, "-W", "error::RuntimeWarning", "-m", "polyglot_tkinter_app.testing.fake_backend", "--help"],
+        capture_output=True,
+        text=True,
+        cwd=SRC,
+    )
+
+    assert result.returncode == 0
+    assert "RuntimeWarning" not in result.stderr
@@ -0,0 +1,109 @@
+import logging
+import socket
+import threading
+import time
+from dataclasses import replace
+
+from polyglot_tkinter_app.api import client as client_module
+from polyglot_tkinter_app.api.client import TranslationClient
+from polyglot_tkinter_app.api.keepalive import ConnectionWarmer
+from polyglot_tkinter_app.settings.loader import load_settings
+from polyglot_tkinter_app.settings.models import ApiProfile, RuntimeState
+
+
+class CountingClient:
+    def __init__(self):
+        self.calls = []
+        self.warmed = threading.Event()
+
+    def prewarm(self, connections):
+        self.calls.append(connections)
+        self.warmed.set()
+        return connections
+
+
+class DeadBackendClient(CountingClient):
+    def prewarm(self, connections):
+        self.calls.append(connections)
+        raise ConnectionError("connection refused")
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_warmer_prewarms_on_session_start_and_heartbeats_until_stopped():
+    client = CountingClient()
+    warmer = ConnectionWarmer(client, connections=2, heartbeat_seconds=0.05, fresh_seconds=60)
+
+    warmer.session_started()
+    warmer.session_started()
+
+    assert _wait_for(lambda: len(client.calls) >= 3)
+    assert set(client.calls) == {2}
+
+    warmer.session_stopped()
+    assert _wait_for(lambda: len(client.calls) >= 4)
+    warmer.session_stopped()
+    time.sleep(0.1)
+    calls = len(client.calls)
+    time.sleep(0.15)
+
+    assert len(client.calls) == calls
+
+
+def test_speech_onset_rewarms_only_stale_connections():
+    client = CountingClient()
+    warmer = ConnectionWarmer(client, connections=1, heartbeat_seconds=0, fresh_seconds=60)
+
+    assert warmer.warm_async() is True
+    assert client.warmed.wait(1)
+    assert _wait_for(lambda: not warmer._warming)
+
+    assert warmer.warm_async() is False
+    warmer.last_warmed -= 61
+    assert warmer.warm_async() is True
+    assert _wait_for(lambda: len(client.calls) == 2)
+
+
+def test_warmer_settings_cap_prewarm_at_pool_size(tmp_path):
+    config_path = tmp_path / "config.json"
+    config_path.write_text(
+        '{"api": {"max_connections": 2, "prewarm_connections": 5, "heartbeat_seconds": 0, "keepalive_seconds": 10}}',
+        encoding="utf-8",
+    )
+
+    warmer = ConnectionWarmer.from_settings(CountingClient(), load_settings(config_path))
+
+    assert warmer.connections == 2
+    assert warmer.heartbeat_seconds == 0
+    assert warmer.fresh_seconds == 5
+
+
+def test_prewarm_against_a_dead_backend_reports_no_open_connections():
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    settings = load_settings("missing-config.json")
+    api = replace(settings.api, profiles={"local": ApiProfile(base_url=f"http://127.0.0.1:{port}/", verify_ssl=False)})
+    client = TranslationClient(RuntimeState.from_settings(replace(settings, api=api)))
+    errors_before = client_module.CONNECTION_PINGS.value(outcome="error")
+
+    assert client.prewarm(2) == 0
+    assert client_module.CONNECTION_PINGS.value(outcome="error") == errors_before + 2
+
+
+def test_heartbeat_keeps_running_when_the_connection_is_dead(caplog):
+    client = DeadBackendClient()
+    warmer = ConnectionWarmer(client, connections=1, heartbeat_seconds=0.02, fresh_seconds=60)
+
+    with caplog.at_level(logging.WARNING, logger="polyglot_tkinter_app.api.keepalive"):
+        warmer.session_started()
+        assert _wait_for(lambda: len(client.calls) >= 3)
+        warmer.close()
+
+    assert "connection_warm_failed error=connection refused" in caplog.messages
+    assert _wait_for(lambda: not warmer._warming)
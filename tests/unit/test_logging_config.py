@@ -0,0 +1,110 @@
+import json
+import logging
+import queue
+import threading
+import time
+from dataclasses import replace
+
+from polyglot_tkinter_app.logging_config import (
+    LOG_RECORDS_DROPPED,
+    BoundedQueueHandler,
+    JsonFormatter,
+    LogListener,
+    setup_logger,
+    shutdown_logger,
+)
+from polyglot_tkinter_app.settings.loader import load_settings
+
+
+class StalledHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.unblock = threading.Event()
+        self.records = []
+
+    def emit(self, record):
+        self.unblock.wait(5)
+        self.records.append(record.getMessage())
+
+
+def test_full_queue_drops_records_instead_of_stalling_the_caller():
+    log_queue = queue.Queue(maxsize=2)
+    stalled = StalledHandler()
+    listener = LogListener(log_queue, stalled)
+    logger = logging.getLogger("test.logging.drop")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(BoundedQueueHandler(log_queue, overflow="drop"))
+    dropped_before = LOG_RECORDS_DROPPED.value(level="INFO")
+    listener.start()
+    try:
+        started = time.perf_counter()
+        for index in range(20):
+            logger.info("audio_input_overflow frames=%s", index)
+        elapsed = time.perf_counter() - started
+    finally:
+        stalled.unblock.set()
+        listener.stop()
+        logger.handlers.clear()
+
+    assert elapsed < 1.0
+    assert 0 < len(stalled.records) <= 3
+    assert stalled.records[0] == "audio_input_overflow frames=0"
+    assert LOG_RECORDS_DROPPED.value(level="INFO") == dropped_before + 20 - len(stalled.records)
+
+
+def test_json_formatter_splits_event_fields():
+    formatter = JsonFormatter()
+    record = logging.LogRecord("polyglot", logging.WARNING, __file__, 1, "translation_failed error=%s seq=%s", ("boom now", 3), None)
+    plain = logging.LogRecord("polyglot", logging.INFO, __file__, 1, "Hello there", None, None)
+
+    payload = json.loads(formatter.format(record))
+    fallback = json.loads(formatter.format(plain))
+
+    assert payload["event"] == "translation_failed"
+    assert payload["error"] == "boom now"
+    assert payload["seq"] == "3"
+    assert payload["level"] == "WARNING"
+    assert fallback["event"] == ""
+    assert fallback["message"] == "Hello there"
+
+
+def test_setup_logger_writes_json_lines_through_the_listener(tmp_path):
+    root = logging.getLogger()
+    saved_handlers, saved_level = list(root.handlers), root.level
+    settings = load_settings("missing-config.json")
+    log_file = tmp_path / "polyglot.log"
+    general = replace(settings.general, log_file=str(log_file), log_format="json")
+    try:
+        setup_logger(replace(settings, general=general))
+        logging.getLogger("polyglot.test").info("speech_segment_detected bytes=%s", 960)
+        shutdown_logger()
+    finally:
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
+
+    lines = [json.loads(line) for line in log_file.read_text(encoding="utf-8").splitlines()]
+    assert lines[-1]["event"] == "speech_segment_detected"
+    assert lines[-1]["bytes"] == "960"
+
+
+def test_shutdown_logger_hands_root_back_to_direct_handlers(tmp_path):
+    root = logging.getLogger()
+    saved_handlers, saved_level = list(root.handlers), root.level
+    settings = load_settings("missing-config.json")
+    general = replace(settings.general, log_file=str(tmp_path / "polyglot.log"), log_queue_size=1, log_overflow="block")
+    try:
+        setup_logger(replace(settings, general=general))
+        shutdown_logger()
+        handlers = list(root.handlers)
+        started = time.perf_counter()
+        for index in range(5):
+            logging.getLogger("polyglot.test").info("after_shutdown index=%s", index)
+        elapsed = time.perf_counter() - started
+    finally:
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
+
+    assert elapsed < 1.0
+    assert not any(isinstance(handler, BoundedQueueHandler) for handler in handlers)
+    assert [type(handler) for handler in handlers] == [logging.StreamHandler]
@@ -0,0 +1,115 @@
+import json
+import threading
+import urllib.request
+from dataclasses import replace
+
+from polyglot_tkinter_app.api import client as client_module
+from polyglot_tkinter_app.api.client import TranslationClient
+from polyglot_tkinter_app.api.models import TranslationRequest
+from polyglot_tkinter_app.metrics import MetricsRegistry, MetricsServer, SnapshotWriter
+from polyglot_tkinter_app.settings.loader import load_settings
+from polyglot_tkinter_app.settings.models import ApiProfile, RuntimeState
+from polyglot_tkinter_app.testing import FakeBackend, FakeBackendConfig, LatencyModel
+
+
+def test_registry_renders_prometheus_text_and_json_snapshot(tmp_path):
+    registry = MetricsRegistry()
+    hits = registry.counter("polyglot_hits_total", "Hits by layer")
+    depth = registry.gauge("polyglot_depth", "Queue depth")
+    latency = registry.histogram("polyglot_latency_seconds", "Latency", buckets=(0.1, 1.0))
+    hits.inc(layer="text_exact")
+    hits.inc(2, layer='say "hi"')
+    depth.set(3)
+    depth.dec()
+    latency.observe(0.05)
+    latency.observe(0.5)
+    latency.observe(5.0)
+
+    text = registry.render_prometheus()
+    writer = SnapshotWriter(registry, tmp_path / "metrics.json")
+    writer.write()
+
+    assert "# TYPE polyglot_hits_total counter" in text
+    assert 'polyglot_hits_total{layer="text_exact"} 1' in text
+    assert 'polyglot_hits_total{layer="say \\"hi\\""} 2' in text
+    assert "polyglot_depth 2" in text
+    assert 'polyglot_latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'polyglot_latency_seconds_bucket{le="1.0"} 2' in text
+    assert 'polyglot_latency_seconds_bucket{le="+Inf"} 3' in text
+    assert "polyglot_latency_seconds_count 3" in text
+    snapshot = json.loads((tmp_path / "metrics.json").read_text(encoding="utf-8"))
+    assert snapshot["metrics"]["polyglot_depth"]["samples"] == [{"labels": {}, "value": 2}]
+    assert snapshot["metrics"]["polyglot_latency_seconds"]["samples"][0]["buckets"]["+Inf"] == 1
+    assert registry.counter("polyglot_hits_total", "Hits by layer") is hits
+
+
+def test_metrics_server_exposes_client_traffic():
+    translations = client_module.TRANSLATIONS
+    before = translations.value(cache_status="miss", cache_layer="none")
+    uploaded_before = client_module.UPLOAD_BYTES.value()
+    config = FakeBackendConfig(inference=LatencyModel(median_ms=1.0), hit_layers={}, response_ms=10)
+    with FakeBackend(config) as backend:
+        settings = load_settings("missing-config.json")
+        api = replace(settings.api, profiles={"local": ApiProfile(base_url=backend.base_url, verify_ssl=False)})
+        client = TranslationClient(RuntimeState.from_settings(replace(settings, api=api)))
+        client.translate(TranslationRequest(audio_bytes=b"wav", target_language="ron", speaker_id="0", session_id="m"))
+
+    server = MetricsServer(client_module.get_registry(), port=0)
+    server.start()
+    try:
+        host, port = server.address
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=5) as response:
+            text = response.read().decode("utf-8")
+    finally:
+        server.stop()
+
+    assert translations.value(cache_status="miss", cache_layer="none") == before + 1
+    assert client_module.UPLOAD_BYTES.value() > uploaded_before
+    assert 'polyglot_translations_total{cache_layer="none",cache_status="miss"}' in text
+    assert "polyglot_requests_in_flight 0" in text
+    assert 'polyglot_server_stage_seconds_count{stage="inference"}' in text
+
+
+def test_scrapes_stay_consistent_while_metrics_are_updated_concurrently():
+    registry = MetricsRegistry()
+    latency = registry.histogram("polyglot_latency_seconds", "Latency", buckets=(0.1, 1.0))
+    hits = registry.counter("polyglot_hits_total", "Hits by worker")
+    stop = threading.Event()
+    errors = []
+    scrapes = []
+
+    def update(worker):
+        for index in range(2000):
+            latency.observe(index % 3 * 0.5, worker=worker)
+            hits.inc(worker=worker)
+            registry.gauge(f"polyglot_depth_{index % 5}", "Queue depth").set(index, worker=worker)
+
+    def scrape():
+        while not stop.is_set():
+            try:
+                text = registry.render_prometheus()
+                json.dumps(registry.snapshot())
+                scrapes.append(len(text))
+                for line in text.splitlines():
+                    if line.startswith("polyglot_latency_seconds_count"):
+                        worker = line.split('"')[1]
+                        inf_bucket = f'polyglot_latency_seconds_bucket{{worker="{worker}",le="+Inf"}} '
+                        assert f"{inf_bucket}{line.rsplit(' ', 1)[1]}" in text
+            except Exception as exc:
+                errors.append(exc)
+                return
+
+    scraper = threading.Thread(target=scrape)
+    scraper.start()
+    workers = [threading.Thread(target=update, args=(str(worker),)) for worker in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    stop.set()
+    scraper.join()
+
+    assert errors == []
+    assert scrapes
+    assert [hits.value(worker=str(worker)) for worker in range(4)] == [2000.0] * 4
+    assert 'polyglot_latency_seconds_count{worker="3"} 2000' in registry.render_prometheus()
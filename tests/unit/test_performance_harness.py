@@ -0,0 +1,78 @@
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from polyglot_tkinter_app.audio import wav_io
+from polyglot_tkinter_app.audio.wav_io import pcm_to_wav_bytes
+from polyglot_tkinter_app.testing import FakeBackend, FakeBackendConfig, LatencyModel
+
+HARNESS = Path(__file__).resolve().parents[1] / "performance" / "performance_test.py"
+
+
+@pytest.fixture
+def harness(monkeypatch):
+    pytest.importorskip("soundfile")
+    spec = importlib.util.spec_from_file_location("performance_test", HARNESS)
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, spec.name, module)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_load_samples_encodes_each_file_once_per_codec(harness, tmp_path, monkeypatch):
+    for name in ("a.wav", "b.wav"):
+        (tmp_path / name).write_bytes(pcm_to_wav_bytes(b"\x01\x00" * 1600))
+    (tmp_path / "empty.wav").write_bytes(b"")
+    calls = []
+
+    def counting_encode(wav_bytes, codec):
+        calls.append(codec)
+        return wav_io.encode_upload(wav_bytes, codec)
+
+    monkeypatch.setattr(harness, "encode_upload", counting_encode)
+
+    samples = harness.load_samples([str(tmp_path)], ["wav", "flac", "wav"])
+
+    assert [sample.name for sample in samples] == ["a.wav", "b.wav"]
+    assert sorted(calls) == ["flac", "flac", "wav", "wav"]
+    assert all(sample.uploads["flac"].startswith(b"fLaC") for sample in samples)
+
+
+def test_benchmark_reports_one_row_per_codec_against_fake_backend(harness, tmp_path, capsys):
+    (tmp_path / "sample.wav").write_bytes(pcm_to_wav_bytes(b"\x01\x00" * 1600))
+    output = tmp_path / "results.json"
+
+    with FakeBackend(FakeBackendConfig(inference=LatencyModel(median_ms=1.0))) as backend:
+        harness.main(
+            [
+                "--config",
+                "missing-config.json",
+                "--url",
+                backend.base_url,
+                "--audio",
+                str(tmp_path / "sample.wav"),
+                "--codec",
+                "wav",
+                "--codec",
+                "flac",
+                "--concurrency",
+                "2",
+                "--duration",
+                "0.2",
+                "--ramp-up",
+                "0",
+                "--output",
+                str(output),
+            ]
+        )
+
+    report = json.loads(output.read_text(encoding="utf-8"))
+    rows = [line.split() for line in capsys.readouterr().out.splitlines() if line.startswith(("wav ", "flac "))]
+    assert [run["codec"] for run in report["runs"]] == ["wav", "flac"]
+    assert all(run["summary"]["completed"] > 0 and run["summary"]["errors"] == 0 for run in report["runs"])
+    wav_bytes, flac_bytes = (run["summary"]["upload_bytes"]["sample.wav"] for run in report["runs"])
+    assert flac_bytes < wav_bytes
+    assert [row[0] for row in rows] == ["wav", "flac"]
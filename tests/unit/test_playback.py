@@ -1,6 +1,46 @@
 import time
 
-from polyglot_tkinter_app.audio.playback import AudioPlayer
+import numpy as np
+
+from polyglot_tkinter_app.audio.playback import PLAYBACK_QUEUE_DEPTH, AudioPlayer
+from polyglot_tkinter_app.audio.playback_engine import PLAYBACK_UNDERRUNS, LinearResampler, remix, to_int16
+from polyglot_tkinter_app.audio.wav_io import pcm_to_wav_bytes
+from polyglot_tkinter_app.tracing import get_tracer
+
+
+class FakeOutputStream:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.writes = []
+        self.closed = False
+
+    def write(self, data):
+        self.writes.append(data)
+
+    def stop_stream(self):
+        pass
+
+    def is_active(self):
+        return False
+
+    def close(self):
+        self.closed = True
+
+
+class FakePyAudio:
+    def __init__(self):
+        self.streams = []
+
+    def get_format_from_width(self, width):
+        return width
+
+    def open(self, **kwargs):
+        stream = FakeOutputStream(**kwargs)
+        self.streams.append(stream)
+        return stream
+
+    def terminate(self):
+        pass
 
 
 def test_stop_without_start_returns_immediately():
@@ -10,3 +50,135 @@ def test_stop_without_start_returns_immediately():
     player.stop()
 
     assert time.perf_counter() - start < 0.5
+
+
+def test_streamed_playback_parses_header_incrementally_and_prebuffers():
+    pcm = bytes(range(256)) * 40
+    wav_bytes = pcm_to_wav_bytes(pcm, sample_rate=16000)
+    player = AudioPlayer(jitter_ms=100)
+    player._pyaudio_instance = FakePyAudio()
+    chunks = [wav_bytes[index : index + 7] for index in range(0, len(wav_bytes), 7)]
+
+    player._play_audio_stream(iter(chunks), None)
+
+    stream = player._pyaudio_instance.streams[0]
+    assert stream.kwargs["rate"] == 16000
+    assert stream.kwargs["channels"] == 1
+    assert len(stream.writes[0]) >= 3200
+    assert b"".join(stream.writes) == pcm
+    assert stream.closed is False
+    player._cleanup()
+    assert stream.closed is True
+
+
+def test_playback_closes_trace_at_first_written_block(monkeypatch):
+    tracer = get_tracer()
+    monkeypatch.setattr(tracer, "enabled", True)
+    player = AudioPlayer()
+    player._pyaudio_instance = FakePyAudio()
+    trace_id = tracer.start_trace()
+    try:
+        player._play_audio_bytes(pcm_to_wav_bytes(b"\x00\x01" * 4000), None, trace_id)
+        spans = [span for span in tracer.spans() if span.trace_id == trace_id]
+    finally:
+        tracer.clear()
+
+    assert [span.name for span in spans] == ["mouth_to_ear"]
+    assert len(player._pyaudio_instance.streams[0].writes) > 1
+
+
+def test_back_to_back_clips_reuse_the_open_output_stream():
+    player = AudioPlayer(idle_close_seconds=0.05)
+    player._pyaudio_instance = pyaudio = FakePyAudio()
+
+    player._play_audio_bytes(pcm_to_wav_bytes(b"\x01\x00" * 2000, sample_rate=16000), None)
+    player._play_audio_bytes(pcm_to_wav_bytes(b"\x02\x00" * 2000, sample_rate=16000), None)
+    reused = len(pyaudio.streams)
+    player._play_audio_bytes(pcm_to_wav_bytes(b"\x03\x00" * 2000, sample_rate=24000), None)
+    time.sleep(0.06)
+    player._streams.close_idle()
+
+    assert reused == 1
+    assert [stream.kwargs["rate"] for stream in pyaudio.streams] == [16000, 24000]
+    assert all(stream.closed for stream in pyaudio.streams)
+    assert len(player._streams) == 0
+
+
+def test_full_playback_queue_drops_oldest_and_stale_clips():
+    statuses = []
+    player = AudioPlayer(max_queue=2, max_staleness_ms=50, on_status_changed=statuses.append)
+    player._is_running = True
+
+    for clip in (b"1", b"2", b"3"):
+        player.enqueue(clip)
+    time.sleep(0.1)
+    player._queue.put(None)
+    player._worker()
+
+    assert statuses == [
+        "Playback backlog: dropped 1 overflow clip(s), 2 queued.",
+        "Playback backlog: dropped 1 stale clip(s), 1 queued.",
+        "Playback backlog: dropped 1 stale clip(s), 0 queued.",
+    ]
+
+
+def test_playback_queue_depth_is_reported_per_session():
+    booth = AudioPlayer(max_queue=4, name="booth-1")
+    other = AudioPlayer(max_queue=4, name="booth-2")
+    booth._is_running = other._is_running = True
+
+    booth.enqueue(b"1")
+    booth.enqueue(b"2")
+    other.enqueue(b"1")
+
+    assert PLAYBACK_QUEUE_DEPTH.value(session="booth-1") == 2
+    assert PLAYBACK_QUEUE_DEPTH.value(session="booth-2") == 1
+
+
+def test_linear_resampler_is_continuous_across_chunks():
+    tone = (np.sin(np.arange(1600) * 2 * np.pi * 440 / 16000) * 10000).astype(np.int16).reshape(-1, 1)
+    whole = LinearResampler(16000, 48000, 1).process(tone)
+    chunked_resampler = LinearResampler(16000, 48000, 1)
+    chunked = np.concatenate([chunked_resampler.process(tone[index : index + 97]) for index in range(0, 1600, 97)])
+
+    assert abs(len(whole) - 4800) <= 3
+    np.testing.assert_allclose(chunked, whole, atol=1e-3)
+    assert remix(np.array([[1], [3]], dtype=np.int16), 2).tolist() == [[1, 1], [3, 3]]
+    assert remix(np.array([[2, 4]], dtype=np.float32), 1).tolist() == [[3.0]]
+
+
+def test_callback_engine_shares_one_stream_across_clip_rates_and_counts_underruns():
+    player = AudioPlayer(engine="callback")
+    player._pyaudio_instance = pyaudio = FakePyAudio()
+    underruns_before = PLAYBACK_UNDERRUNS.value()
+
+    player._play_audio_bytes(pcm_to_wav_bytes(b"\x10\x00" * 480, sample_rate=48000), None)
+    player._play_audio_bytes(pcm_to_wav_bytes(b"\x20\x00" * 160, sample_rate=16000, channels=1), None)
+    callback = pyaudio.streams[0].kwargs["stream_callback"]
+    played = np.frombuffer(callback(None, 1200, None, 0)[0], dtype=np.int16)
+    engine = player._streams.open(pyaudio, None, rate=48000, channels=1, sample_width=2)
+    engine.write(b"\x30\x00" * 10)
+    callback(None, 100, None, 0)
+
+    assert len(pyaudio.streams) == 1
+    assert pyaudio.streams[0].kwargs["rate"] == 48000
+    assert (played[:480] == 16).all()
+    assert abs(int((played[480:] == 32).sum()) - 480) <= 3
+    assert (played[965:] == 0).all()
+    assert PLAYBACK_UNDERRUNS.value() == underruns_before + 1
+    player._cleanup()
+
+
+def test_callback_engine_plays_24_bit_clips():
+    samples = np.array([1000, -1000, 32767, -32768], dtype=np.int16)
+    pcm24 = b"".join(b"\x7f" + int(sample).to_bytes(2, "little", signed=True) for sample in samples)
+    player = AudioPlayer(engine="callback")
+    player._pyaudio_instance = pyaudio = FakePyAudio()
+
+    player._play_audio_bytes(pcm_to_wav_bytes(pcm24, sample_rate=48000, sample_width=3), None)
+    played = np.frombuffer(pyaudio.streams[0].kwargs["stream_callback"](None, 4, None, 0)[0], dtype=np.int16)
+
+    assert to_int16(pcm24, 3).tolist() == samples.tolist()
+    assert played.tolist() == samples.tolist()
+    assert pyaudio.streams[0].kwargs["format"] == 2
+    player._cleanup()
@@ -64,3 +64,10 @@ def test_runtime_updates_and_resets_session():
     assert runtime.source_language == "ron"
     assert runtime.use_transcript_memory is True
     assert runtime.session_id != original_session
+
+
+def test_lossy_pipeline_options_are_off_by_default():
+    pipeline = load_settings("missing-config.json").pipeline
+
+    assert pipeline.max_staleness_ms == 0
+    assert pipeline.coalesce_max_ms == 0
@@ -0,0 +1,148 @@
+import asyncio
+import logging
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from polyglot_tkinter_app.api.models import HealthStatus
+from polyglot_tkinter_app.app.preload import ModulePreloader
+from polyglot_tkinter_app.app.startup import IMAGE_ASSETS, StartupOrchestrator
+from polyglot_tkinter_app.audio.devices import AudioDevice, DeviceSnapshot
+from polyglot_tkinter_app.settings.loader import load_settings
+
+SRC = Path(__file__).resolve().parents[2] / "src"
+DEFERRED_MODULES = (
+    "numpy",
+    "requests",
+    "urllib3",
+    "soundfile",
+    "pyaudio",
+    "sounddevice",
+    "webrtcvad",
+    "PIL",
+    "pystray",
+    "polyglot_tkinter_app.api.client",
+    "polyglot_tkinter_app.audio.playback",
+    "polyglot_tkinter_app.gui.main_menu",
+    "polyglot_tkinter_app.orchestration",
+)
+TASK_SECONDS = 0.4
+
+
+class SlowAsyncClient:
+    def __init__(self, client):
+        self.client = client
+
+    async def health(self):
+        await asyncio.sleep(TASK_SECONDS)
+        return HealthStatus(online=True)
+
+
+class SlowRegistry:
+    def snapshot(self):
+        time.sleep(TASK_SECONDS)
+        return DeviceSnapshot(devices=(AudioDevice(index=1, name="Mic", input_channels=1),))
+
+
+def _import_times(module: str) -> dict[str, int]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        cwd=SRC,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_bootstrap_import_defers_heavy_modules():
+    pytest.importorskip("tkinter")
+
+    times = _import_times("polyglot_tkinter_app.app.bootstrap")
+
+    eager = sorted(name for name in times if name.split(".")[0] in DEFERRED_MODULES or name in DEFERRED_MODULES)
+    assert eager == []
+
+
+def test_module_preloader_imports_in_background_and_records_missing_modules():
+    preloader = ModulePreloader(("json", "polyglot_missing_optional_module")).start()
+
+    assert preloader.wait(5)
+    assert "json" in preloader.loaded
+    assert "polyglot_missing_optional_module" in preloader.failed
+
+
+def test_startup_tasks_overlap_and_report_once():
+    finished = threading.Event()
+    results = []
+
+    def on_finished(result):
+        results.append(result)
+        finished.set()
+
+    orchestrator = StartupOrchestrator(
+        load_settings("missing-config.json"),
+        client_factory=object,
+        on_finished=on_finished,
+        async_client_factory=SlowAsyncClient,
+        registry_factory=SlowRegistry,
+        warmup_modules=(),
+    )
+    started = time.perf_counter()
+    orchestrator.start()
+
+    assert finished.wait(5)
+    elapsed = time.perf_counter() - started
+    result = results[0]
+    assert elapsed < 2 * TASK_SECONDS
+    assert result.health.online is True
+    assert isinstance(result.async_client, SlowAsyncClient)
+    assert isinstance(result.registry, SlowRegistry)
+    assert set(result.images) == set(IMAGE_ASSETS)
+    assert set(result.timings) == {"health", "devices", "assets", "warmup"}
+
+    finished.clear()
+    orchestrator.retry_health()
+
+    assert finished.wait(5)
+    assert len(results) == 2
+
+
+def test_failing_startup_task_is_logged_and_startup_still_finishes(caplog):
+    finished = threading.Event()
+    results = []
+
+    def unreachable_backend():
+        raise ConnectionError("backend unreachable")
+
+    def on_finished(result):
+        results.append(result)
+        finished.set()
+
+    orchestrator = StartupOrchestrator(
+        load_settings("missing-config.json"),
+        client_factory=unreachable_backend,
+        on_finished=on_finished,
+        registry_factory=SlowRegistry,
+        warmup_modules=(),
+    )
+    with caplog.at_level(logging.WARNING, logger="polyglot_tkinter_app.app.startup"):
+        orchestrator.start()
+        assert finished.wait(5)
+
+    result = results[0]
+    assert result.health.online is False
+    assert result.client is None
+    assert isinstance(result.registry, SlowRegistry)
+    assert set(result.timings) == {"health", "devices", "assets", "warmup"}
+    assert "startup_task_failed task=health error=backend unreachable" in caplog.messages
@@ -0,0 +1,59 @@
+import json
+import time
+
+import pytest
+
+from polyglot_tkinter_app.settings.models import TracingSettings
+from polyglot_tkinter_app.tracing import Tracer
+
+
+def test_disabled_tracer_records_nothing():
+    tracer = Tracer()
+
+    trace_id = tracer.start_trace()
+    with tracer.span("abc", "stage"):
+        pass
+    tracer.record("abc", "stage", time.perf_counter())
+
+    assert trace_id == ""
+    assert tracer.spans() == []
+
+
+def test_tracer_exports_jsonl_and_chrome_trace(tmp_path):
+    tracer = Tracer()
+    tracer.configure(TracingSettings(enabled=True, export_path=str(tmp_path / "traces.jsonl"), max_spans=10))
+    trace_id = tracer.start_trace()
+    with tracer.span(trace_id, "wav_encode", codec="wav"):
+        pass
+    tracer.finish_trace(trace_id)
+    tracer.finish_trace(trace_id)
+
+    jsonl_path = tracer.export()
+    chrome_path = tracer.export(tmp_path / "trace.json", "chrome")
+
+    records = [json.loads(line) for line in jsonl_path.read_text(encoding="utf-8").splitlines()]
+    assert [record["name"] for record in records] == ["wav_encode", "mouth_to_ear"]
+    assert records[0]["trace_id"] == trace_id
+    assert records[0]["codec"] == "wav"
+    assert records[1]["duration"] >= records[0]["duration"]
+    events = json.loads(chrome_path.read_text(encoding="utf-8"))["traceEvents"]
+    complete = [event for event in events if event["ph"] == "X"]
+    assert {event["name"] for event in complete} == {"wav_encode", "mouth_to_ear"}
+    assert {event["tid"] for event in complete} == {1}
+    assert complete[0]["args"]["trace_id"] == trace_id
+
+
+def test_span_records_failed_stage_and_reraises():
+    tracer = Tracer()
+    tracer.configure(TracingSettings(enabled=True, max_spans=10))
+    trace_id = tracer.start_trace()
+
+    with pytest.raises(ValueError):
+        with tracer.span(trace_id, "upload_encode", codec="opus"):
+            raise ValueError("opus upload needs 16-bit PCM")
+    tracer.finish_trace(trace_id)
+
+    failed, finished = tracer.spans()
+    assert failed.name == "upload_encode"
+    assert failed.attrs == {"error": "ValueError", "codec": "opus"}
+    assert finished.name == "mouth_to_ear"
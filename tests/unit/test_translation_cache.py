@@ -0,0 +1,103 @@
+from polyglot_tkinter_app.api.cache import TranslationCache
+from polyglot_tkinter_app.api.client import TranslationClient
+from polyglot_tkinter_app.api.disk_cache import DiskTranslationStore
+from polyglot_tkinter_app.api.models import TranslationRequest, TranslationResponse
+from polyglot_tkinter_app.settings.loader import load_settings
+from polyglot_tkinter_app.settings.models import RuntimeState
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingSession:
+    def __init__(self):
+        self.posts = 0
+
+    def post(self, url, **kwargs):
+        self.posts += 1
+
+        class Response:
+            status_code = 200
+            content = b"translated"
+            headers = {"X-Polyglot-Cache": "miss", "X-Polyglot-Cache-Layer": "miss"}
+            text = ""
+
+        return Response()
+
+
+def _request(audio=b"wav", **overrides):
+    values = {"audio_bytes": audio, "target_language": "eng", "speaker_id": "0", "session_id": "s"}
+    values.update(overrides)
+    return TranslationRequest(**values)
+
+
+def test_client_serves_repeat_request_from_cache():
+    runtime = RuntimeState.from_settings(load_settings("missing-config.json"))
+    session = CountingSession()
+    client = TranslationClient(runtime, session=session, cache=TranslationCache())
+
+    first = client.translate(_request())
+    second = client.translate(_request(session_id="other-session"))
+
+    assert session.posts == 1
+    assert first.cache_layer == "miss"
+    assert second.audio_bytes == b"translated"
+    assert second.cache_status == "hit"
+    assert second.cache_layer == "client"
+    assert second.inference_time == 0.0
+
+
+def test_cache_key_covers_language_and_respects_privacy_and_cache_toggle():
+    cache = TranslationCache()
+    response = TranslationResponse(audio_bytes=b"out")
+
+    cache.put(_request(), response)
+    cache.put(_request(privacy_level="private"), response)
+
+    assert cache.get(_request()) is not None
+    assert cache.get(_request(target_language="ron")) is None
+    assert cache.get(_request(privacy_level="private")) is None
+    assert cache.get(_request(use_semantic_cache=False)) is None
+    assert len(cache) == 1
+
+
+def test_cache_expires_entries_and_evicts_least_recently_used_bytes():
+    clock = FakeClock()
+    cache = TranslationCache(max_bytes=10, privacy_ttl_seconds={"transient": 5}, clock=clock)
+
+    cache.put(_request(b"a"), TranslationResponse(audio_bytes=b"1234"))
+    cache.put(_request(b"b"), TranslationResponse(audio_bytes=b"1234"))
+    assert cache.get(_request(b"a")) is not None
+    cache.put(_request(b"c"), TranslationResponse(audio_bytes=b"1234"))
+
+    assert cache.get(_request(b"b")) is None
+    assert cache.get(_request(b"a")) is not None
+    assert cache.size_bytes == 8
+
+    clock.now = 6
+    assert cache.get(_request(b"a")) is None
+
+
+def test_disk_tier_keeps_entries_no_longer_than_their_privacy_ttl(tmp_path):
+    clock = FakeClock()
+    store = DiskTranslationStore(tmp_path, clock=clock)
+    cache = TranslationCache(
+        privacy_ttl_seconds={"transient": 600, "shared": 86400},
+        store=store,
+        store_ttl_seconds=7 * 86400,
+    )
+
+    cache.put(_request(b"a"), TranslationResponse(audio_bytes=b"1234"))
+    cache.put(_request(b"b", privacy_level="shared"), TranslationResponse(audio_bytes=b"1234"))
+    keys = [cache.key_for(_request(b"a")), cache.key_for(_request(b"b", privacy_level="shared"))]
+
+    clock.now = 601
+    assert store.get(keys[0]) is None
+    assert store.get(keys[1]) is not None
+    clock.now = 86401
+    assert store.get(keys[1]) is None
@@ -1,10 +1,17 @@
 import logging
 import threading
+import time
+from dataclasses import replace
 
+from polyglot_tkinter_app.api.client import TranslationClient
 from polyglot_tkinter_app.api.models import TranslationResponse
+from polyglot_tkinter_app.audio.buffers import PcmSegmentBuffer
+from polyglot_tkinter_app.audio.wav_io import pcm_to_wav_bytes
 from polyglot_tkinter_app.orchestration.translation_flow import TranslationFlow
 from polyglot_tkinter_app.settings.loader import load_settings
-from polyglot_tkinter_app.settings.models import RuntimeState
+from polyglot_tkinter_app.settings.models import ApiProfile, RuntimeState, TargetLane
+from polyglot_tkinter_app.testing import FakeBackend, FakeBackendConfig, LatencyModel
+from polyglot_tkinter_app.tracing import get_tracer
 
 
 class FakeClient:
@@ -30,6 +37,65 @@ class FakeClient:
         )
 
 
+class StreamingClient(FakeClient):
+    def __init__(self):
+        super().__init__()
+        self.streamed_chunks = []
+
+    def translate_stream(self, request, wav_chunks):
+        self.streamed_chunks.extend(wav_chunks)
+        return self.translate(request)
+
+
+class PerLanguageClient:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = []
+        self.chunks = {}
+
+    def translate(self, request):
+        with self.lock:
+            self.requests.append(request)
+        return TranslationResponse(audio_bytes=f"out-{request.target_language}".encode())
+
+    def translate_stream(self, request, wav_chunks):
+        chunks = list(wav_chunks)
+        with self.lock:
+            self.chunks[request.target_language] = chunks
+        return self.translate(request)
+
+
+class OutOfOrderClient:
+    def __init__(self, delays):
+        self.delays = delays
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def translate(self, request):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delays[request.audio_bytes])
+        with self.lock:
+            self.in_flight -= 1
+        return TranslationResponse(audio_bytes=b"out-" + request.audio_bytes)
+
+
+class ScriptedSegmenter:
+    def __init__(self, script):
+        self.script = list(script)
+        self.last_frame_buffered = False
+        self.carried_pcm = b""
+
+    def accept_frame(self, frame_bytes):
+        self.last_frame_buffered, segment = self.script.pop(0)
+        return segment
+
+    def flush(self):
+        return None
+
+
 class BlockingClient:
     def __init__(self):
         self.started = threading.Event()
@@ -56,7 +122,7 @@ class FakePlayer:
     def start(self):
         self.started = True
 
-    def enqueue(self, audio_bytes, output_device=None):
+    def enqueue(self, audio_bytes, output_device=None, trace_id=""):
         self.enqueued.append((audio_bytes, output_device))
 
     def stop(self):
@@ -143,7 +209,339 @@ def test_translation_flow_drops_late_response_after_shutdown():
     assert player.enqueued == []
 
     client.release.set()
-    flow._worker_thread.join(timeout=2)
+    for worker in flow._worker_threads:
+        worker.join(timeout=2)
 
     assert completed == []
     assert player.enqueued == []
+
+
+def test_translation_flow_streams_speech_frames_while_segment_is_open():
+    settings = load_settings("missing-config.json")
+    settings = replace(settings, api=replace(settings.api, streaming_upload=True))
+    runtime = RuntimeState.from_settings(settings)
+    client = StreamingClient()
+    player = FakePlayer()
+    done = threading.Event()
+
+    flow = TranslationFlow(
+        runtime=runtime,
+        client=client,
+        player=player,
+        on_translation_completed=lambda response: done.set(),
+    )
+    flow._segmenter = ScriptedSegmenter([(False, None), (True, None), (True, None), (False, b"ab")])
+
+    for frame in (b"--", b"a", b"b", b"--"):
+        flow._handle_frame(frame)
+    assert done.wait(timeout=2)
+    flow.stop()
+
+    assert client.streamed_chunks[0].startswith(b"RIFF")
+    assert client.streamed_chunks[1:] == [b"a", b"b"]
+    assert client.requests[0].audio_bytes == b""
+    assert flow.last_input_wav_bytes.endswith(b"ab")
+    assert player.enqueued[0][0] == b"translated"
+
+
+def test_translation_flow_returns_segment_buffers_once_sent_and_replaced():
+    class CopyingClient:
+        def __init__(self):
+            self.uploads = []
+            self.done = threading.Semaphore(0)
+
+        def translate(self, request):
+            self.uploads.append(bytes(request.audio_bytes[-2:]))
+            self.done.release()
+            return TranslationResponse(audio_bytes=b"translated")
+
+    runtime = RuntimeState.from_settings(load_settings("missing-config.json"))
+    client = CopyingClient()
+    flow = TranslationFlow(runtime=runtime, client=client, player=FakePlayer())
+    buffer = PcmSegmentBuffer(capacity_bytes=4)
+    segments = []
+    for pcm in (b"\x01\x00", b"\x02\x00", b"\x03\x00"):
+        buffer.append(pcm)
+        segments.append(buffer.detach())
+        flow._segmenter = ScriptedSegmenter([(False, segments[-1])])
+        flow._handle_frame(b"--")
+        assert client.done.acquire(timeout=2)
+    buffer.append(b"\x09\x00")
+    flow.stop()
+
+    assert client.uploads == [b"\x01\x00", b"\x02\x00", b"\x03\x00"]
+    assert bytes(segments[0].pcm) == b"\x09\x00"
+    assert bytes(flow.last_input_wav_bytes[-2:]) == b"\x03\x00"
+
+
+def test_translation_flow_keeps_segment_buffers_until_streamed_download_finishes():
+    class StreamPlayer(FakePlayer):
+        def __init__(self):
+            super().__init__()
+            self.streams = []
+            self.ready = threading.Semaphore(0)
+
+        def enqueue_stream(self, audio_stream, output_device=None, trace_id=""):
+            self.streams.append(audio_stream)
+            self.ready.release()
+
+    settings = load_settings("missing-config.json")
+    config = FakeBackendConfig(
+        inference=LatencyModel(median_ms=1.0),
+        hit_layers={},
+        response_ms=200,
+        response_chunk_bytes=256,
+        response_chunk_delay_ms=5.0,
+    )
+    player = StreamPlayer()
+    buffer = PcmSegmentBuffer(capacity_bytes=4)
+    with FakeBackend(config) as backend:
+        api = replace(
+            settings.api,
+            profiles={"local": ApiProfile(base_url=backend.base_url, verify_ssl=False)},
+            streaming_download=True,
+        )
+        runtime = RuntimeState.from_settings(replace(settings, api=api))
+        flow = TranslationFlow(runtime=runtime, client=TranslationClient(runtime), player=player)
+        segments = []
+        for pcm in (b"\x01\x00", b"\x02\x00"):
+            buffer.append(pcm)
+            segments.append(buffer.detach())
+            flow._segmenter = ScriptedSegmenter([(False, segments[-1])])
+            flow._handle_frame(b"--")
+            assert player.ready.acquire(timeout=5)
+        buffer.detach()
+        buffer.append(b"\x03\x00" * 64)
+        audio = [stream.read_all() for stream in player.streams]
+        buffer.detach()
+        buffer.append(b"\x09\x00")
+        flow.stop()
+
+    assert bytes(segments[0].pcm) == b"\x09\x00"
+    assert [len(audio_bytes) for audio_bytes in audio] == [44 + 6400, 44 + 6400]
+    assert backend.requests == 2
+
+
+def test_translation_flow_worker_pool_plays_results_in_capture_order():
+    settings = load_settings("missing-config.json")
+    settings = replace(settings, pipeline=replace(settings.pipeline, translation_workers=3))
+    runtime = RuntimeState.from_settings(settings)
+    client = OutOfOrderClient({b"1": 0.3, b"2": 0.15, b"3": 0.0})
+    player = FakePlayer()
+    completed = []
+    done = threading.Event()
+
+    flow = TranslationFlow(
+        runtime=runtime,
+        client=client,
+        player=player,
+        on_translation_completed=lambda response: (completed.append(response), len(completed) == 3 and done.set()),
+    )
+
+    for payload in (b"1", b"2", b"3"):
+        flow.submit_wav(payload, reason="test")
+    assert done.wait(timeout=2)
+    flow.stop()
+
+    assert client.max_in_flight > 1
+    assert [audio for audio, _ in player.enqueued] == [b"out-1", b"out-2", b"out-3"]
+    assert len(flow._worker_threads) == 3
+
+
+def test_translation_flow_traces_work_from_queue_to_delivery(monkeypatch):
+    tracer = get_tracer()
+    monkeypatch.setattr(tracer, "enabled", True)
+    runtime = RuntimeState.from_settings(load_settings("missing-config.json"))
+    client = FakeClient()
+    player = FakePlayer()
+    done = threading.Event()
+    flow = TranslationFlow(
+        runtime=runtime,
+        client=client,
+        player=player,
+        on_translation_completed=lambda response: done.set(),
+    )
+    try:
+        flow.submit_wav(b"wav", reason="test")
+        assert done.wait(timeout=2)
+        flow.stop()
+        trace_id = client.requests[0].trace_id
+        names = [span.name for span in tracer.spans() if span.trace_id == trace_id]
+    finally:
+        tracer.clear()
+
+    assert trace_id
+    assert names == ["queue_wait", "upload_encode", "reorder_wait"]
+
+
+def _bounded_flow(client, player, *, policy, staleness_ms=0, queue_size=1, coalesce_max_ms=0, **callbacks):
+    settings = load_settings("missing-config.json")
+    pipeline = replace(
+        settings.pipeline,
+        work_queue_size=queue_size,
+        overflow_policy=policy,
+        max_staleness_ms=staleness_ms,
+        coalesce_max_ms=coalesce_max_ms,
+        coalesce_gap_ms=10,
+    )
+    runtime = RuntimeState.from_settings(replace(settings, pipeline=pipeline))
+    return TranslationFlow(runtime=runtime, client=client, player=player, **callbacks)
+
+
+def test_translation_flow_drops_oldest_and_stale_work_and_reports_it():
+    client = BlockingClient()
+    player = FakePlayer()
+    statuses = []
+    flow = _bounded_flow(client, player, policy="drop_oldest", staleness_ms=150, on_status_changed=statuses.append)
+
+    flow.submit_wav(b"1", reason="test")
+    assert client.started.wait(timeout=2)
+    for payload in (b"2", b"3", b"4"):
+        flow.submit_wav(payload, reason="test")
+    time.sleep(0.2)
+    client.release.set()
+    flow.stop()
+
+    assert [request.audio_bytes for request in client.requests] == [b"1"]
+    assert len(player.enqueued) == 1
+    assert "Translation backlog: dropped 1 overflow segment(s), 1 queued." in statuses
+    assert "Translation backlog: dropped 1 stale segment(s), 0 queued." in statuses
+    assert flow._reorder.pending() == 0
+
+
+def test_translation_flow_coalesces_segments_queued_behind_a_busy_worker():
+    client = BlockingClient()
+    player = FakePlayer()
+    flow = _bounded_flow(client, player, policy="coalesce")
+    first, second, third = (pcm_to_wav_bytes(bytes([index]) * 320) for index in (1, 2, 3))
+
+    flow.submit_wav(first, reason="test")
+    assert client.started.wait(timeout=2)
+    flow.submit_wav(second, reason="test")
+    flow.submit_wav(third, reason="test")
+    client.release.set()
+    flow.stop()
+
+    assert client.requests[0].audio_bytes == first
+    assert client.requests[1].audio_bytes == pcm_to_wav_bytes(bytes([2]) * 320 + bytes(320) + bytes([3]) * 320)
+    assert len(client.requests) == 2
+    assert len(player.enqueued) == 2
+
+
+def test_translation_flow_does_not_coalesce_segments_across_runtime_changes():
+    client = BlockingClient()
+    player = FakePlayer()
+    flow = _bounded_flow(client, player, policy="coalesce")
+    first, second, third = (pcm_to_wav_bytes(bytes([index]) * 320) for index in (1, 2, 3))
+
+    flow.submit_wav(first, reason="test")
+    assert client.started.wait(timeout=2)
+    flow.submit_wav(second, reason="test")
+    flow.runtime.target_language = "deu"
+    flow.submit_wav(third, reason="test")
+    client.release.set()
+    flow.stop()
+
+    assert [request.audio_bytes for request in client.requests] == [first, third]
+    assert client.requests[1].target_language == "deu"
+    assert flow._reorder.pending() == 0
+
+
+def test_translation_flow_batches_short_segments_while_the_worker_is_busy():
+    client = BlockingClient()
+    player = FakePlayer()
+    flow = _bounded_flow(client, player, policy="drop_oldest", queue_size=8, coalesce_max_ms=30)
+    segments = [pcm_to_wav_bytes(bytes([index]) * 320) for index in range(1, 6)]
+
+    flow.submit_wav(segments[0], reason="test")
+    assert client.started.wait(timeout=2)
+    flow.submit_wav(segments[1], reason="test")
+    flow.submit_wav(segments[2], reason="test")
+    flow.runtime.target_language = "deu"
+    flow.submit_wav(segments[3], reason="test")
+    flow.submit_wav(segments[4], reason="test")
+    flow.submit_wav(segments[0], reason="test")
+    client.release.set()
+    flow.stop()
+
+    gap = bytes(320)
+    assert [request.audio_bytes for request in client.requests] == [
+        segments[0],
+        pcm_to_wav_bytes(bytes([2]) * 320 + gap + bytes([3]) * 320),
+        pcm_to_wav_bytes(bytes([4]) * 320 + gap + bytes([5]) * 320),
+        segments[0],
+    ]
+    assert len(player.enqueued) == 4
+
+
+def test_translation_flow_fans_one_segment_out_to_every_target_lane():
+    settings = load_settings("missing-config.json")
+    settings = replace(settings, api=replace(settings.api, streaming_upload=True))
+    runtime = RuntimeState.from_settings(settings)
+    runtime.target_language = "eng"
+    runtime.extra_targets = [TargetLane("deu", output_device="desk-de"), TargetLane("fra", speaker_id="2")]
+    client = PerLanguageClient()
+    player = FakePlayer()
+    lane_players = []
+    done = threading.Event()
+    flow = TranslationFlow(
+        runtime=runtime,
+        client=client,
+        player=player,
+        on_translation_completed=lambda response: done.set(),
+        lane_player_factory=lambda name: lane_players.append(FakePlayer()) or lane_players[-1],
+    )
+    flow._segmenter = ScriptedSegmenter([(True, None), (True, None), (False, b"ab")])
+
+    for frame in (b"a", b"b", b"--"):
+        flow._handle_frame(frame)
+    assert done.wait(timeout=2)
+    flow.stop()
+
+    assert sorted(request.target_language for request in client.requests) == ["deu", "eng", "fra"]
+    assert {request.speaker_id for request in client.requests if request.target_language == "fra"} == {"2"}
+    assert all(chunks[1:] == [b"a", b"b"] for chunks in client.chunks.values())
+    assert player.enqueued == [(b"out-eng", None)]
+    assert sorted(lane.enqueued for lane in lane_players) == [[(b"out-deu", "desk-de")], [(b"out-fra", None)]]
+    assert all(lane.stopped for lane in lane_players)
+
+
+def test_translation_flow_delivers_primary_without_waiting_for_slow_lanes():
+    class SlowLaneClient(PerLanguageClient):
+        def __init__(self):
+            super().__init__()
+            self.release = threading.Event()
+
+        def translate(self, request):
+            if request.target_language == "deu":
+                self.release.wait(timeout=2)
+            return super().translate(request)
+
+    runtime = RuntimeState.from_settings(load_settings("missing-config.json"))
+    runtime.target_language = "eng"
+    runtime.extra_targets = [TargetLane("deu"), TargetLane("fra")]
+    client = SlowLaneClient()
+    player = FakePlayer()
+    lane_players = []
+    completed = []
+    flow = TranslationFlow(
+        runtime=runtime,
+        client=client,
+        player=player,
+        on_translation_completed=completed.append,
+        lane_player_factory=lambda name: lane_players.append(FakePlayer()) or lane_players[-1],
+    )
+
+    flow.submit_wav(b"1", reason="test")
+    flow.submit_wav(b"2", reason="test")
+    deadline = time.monotonic() + 2
+    while (len(completed) < 2 or not lane_players or len(lane_players[0].enqueued) < 2) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert player.enqueued == [(b"out-eng", None), (b"out-eng", None)]
+    assert [lane.enqueued for lane in lane_players] == [[(b"out-fra", None), (b"out-fra", None)]]
+
+    client.release.set()
+    flow.stop()
+
+    assert [lane.enqueued for lane in lane_players][1] == [(b"out-deu", None), (b"out-deu", None)]
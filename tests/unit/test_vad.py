@@ -0,0 +1,156 @@
+import wave
+from io import BytesIO
+
+import numpy as np
+
+from polyglot_tkinter_app.audio import vad
+from polyglot_tkinter_app.audio.buffers import FrameRing, PcmSegmentBuffer
+from polyglot_tkinter_app.audio.vad import EnergyPreGate, SpeechSegmenter
+
+
+class CountingVad:
+    calls = 0
+
+    def __init__(self, aggressiveness):
+        pass
+
+    def is_speech(self, frame_bytes, sample_rate):
+        CountingVad.calls += 1
+        samples = np.frombuffer(frame_bytes, dtype=np.int16)
+        return bool(np.abs(samples).max() > 1000)
+
+
+class FakeWebrtcvad:
+    Vad = CountingVad
+
+
+def _frames(amplitudes, samples=480):
+    rng = np.random.default_rng(0)
+    rows = [np.sin(np.linspace(0, 40 * np.pi, samples)) * amplitude for amplitude in amplitudes]
+    noise = rng.normal(0, 5, size=(len(amplitudes), samples))
+    return (np.array(rows) + noise).astype(np.int16)
+
+
+def test_energy_gate_skips_vad_for_silent_frames(monkeypatch):
+    monkeypatch.setattr(vad, "_load_webrtcvad", lambda: FakeWebrtcvad)
+    CountingVad.calls = 0
+    segmenter = SpeechSegmenter(
+        sample_rate=16000,
+        frame_duration_ms=30,
+        aggressiveness=3,
+        energy_gate=EnergyPreGate(ratio=3.0, min_rms=100.0),
+    )
+    frames = _frames([0, 0, 8000, 8000, 0, 0, 0, 0])
+
+    decisions = segmenter.classify_frames(frames)
+
+    assert decisions == [False, False, True, True, False, False, False, False]
+    assert CountingVad.calls == 2
+    assert segmenter.energy_gate.skipped_frames == 6
+
+
+def test_batched_classification_closes_segment_like_inline_path(monkeypatch):
+    monkeypatch.setattr(vad, "_load_webrtcvad", lambda: FakeWebrtcvad)
+    segmenter = SpeechSegmenter(sample_rate=16000, frame_duration_ms=250, aggressiveness=3)
+    frames = _frames([8000, 8000, 0, 0, 0, 0])
+
+    segments = [
+        segmenter.accept_classified(frame.tobytes(), is_speech)
+        for frame, is_speech in zip(frames, segmenter.classify_frames(frames))
+    ]
+
+    closed = [segment for segment in segments if segment]
+    assert len(closed) == 1
+    assert closed[0] == frames[0].tobytes() + frames[1].tobytes()
+
+
+def test_frame_ring_drains_in_order_and_counts_overflow():
+    ring = FrameRing(capacity_frames=3, frame_samples=2)
+    for value in range(5):
+        ring.push(np.full(2, value, dtype=np.int16).tobytes())
+
+    batch = ring.drain(timeout=0)
+
+    assert batch[:, 0].tolist() == [0, 1, 2]
+    assert ring.dropped_frames == 2
+    assert len(ring.drain(timeout=0)) == 0
+
+
+def test_pcm_segment_buffer_hands_off_wav_view_without_aliasing():
+    buffer = PcmSegmentBuffer(capacity_bytes=4)
+    buffer.append(b"\x01\x00\x02\x00")
+    buffer.append(b"\x03\x00")
+    segment = buffer.detach()
+    buffer.append(b"\x09\x00")
+
+    wav_view = segment.to_wav(sample_rate=8000)
+
+    assert isinstance(wav_view, memoryview)
+    with wave.open(BytesIO(wav_view), "rb") as wav_file:
+        assert wav_file.getframerate() == 8000
+        assert wav_file.readframes(10) == b"\x01\x00\x02\x00\x03\x00"
+    assert len(buffer) == 2
+    assert buffer.capacity_bytes >= 6
+
+
+def test_segmenter_cuts_monologue_at_quietest_frame_with_overlap(monkeypatch):
+    monkeypatch.setattr(vad, "_load_webrtcvad", lambda: FakeWebrtcvad)
+    segmenter = SpeechSegmenter(
+        sample_rate=16000,
+        frame_duration_ms=30,
+        aggressiveness=3,
+        max_segment_ms=150,
+        min_segment_ms=60,
+        overlap_ms=30,
+    )
+    frames = _frames([4000, 4000, 1500, 4000, 4000, 4000])
+
+    segments = [segmenter.accept_frame(frame.tobytes()) for frame in frames]
+
+    assert segments[:4] == [None] * 4
+    assert segments[4] == frames[:3].tobytes()
+    assert segmenter.carried_pcm == frames[2].tobytes()
+    tail = [segmenter.accept_frame(frame.tobytes()) for frame in _frames([0] * 40)]
+    closed = [segment for segment in tail if segment]
+    assert closed == [frames[2:].tobytes()]
+
+
+def test_segmenter_without_early_cut_splits_exactly_at_the_limit(monkeypatch):
+    monkeypatch.setattr(vad, "_load_webrtcvad", lambda: FakeWebrtcvad)
+    segmenter = SpeechSegmenter(
+        sample_rate=16000,
+        frame_duration_ms=30,
+        aggressiveness=3,
+        max_segment_ms=150,
+        min_segment_ms=60,
+        overlap_ms=30,
+        early_cut=False,
+    )
+    frames = _frames([4000, 4000, 1500, 4000, 4000, 4000])
+
+    segments = [segmenter.accept_frame(frame.tobytes()) for frame in frames]
+
+    assert segments[:4] == [None] * 4
+    assert segments[4] == frames[:5].tobytes()
+    assert segmenter.carried_pcm == frames[4].tobytes()
+
+
+def test_pcm_segment_buffer_reuses_storage_once_the_consumer_releases_it():
+    buffer = PcmSegmentBuffer(capacity_bytes=8, sample_width=4)
+    buffer.append(b"\x01\x00\x00\x00")
+    first = buffer.detach()
+    first.retain()
+    buffer.append(b"\x02\x00\x00\x00")
+    second = buffer.detach()
+    second.retain()
+
+    with wave.open(BytesIO(first.to_wav(sample_rate=8000)), "rb") as wav_file:
+        assert wav_file.getsampwidth() == 4
+    first.release()
+    buffer.append(b"\x03\x00\x00\x00")
+    third = buffer.detach()
+    buffer.append(b"\x04\x00\x00\x00")
+
+    assert bytes(first.pcm) == b"\x04\x00\x00\x00"
+    assert second == b"\x02\x00\x00\x00"
+    assert third == b"\x03\x00\x00\x00"
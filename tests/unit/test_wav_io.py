@@ -0,0 +1,28 @@
+import wave
+from io import BytesIO
+
+import numpy as np
+import pytest
+
+from polyglot_tkinter_app.audio.wav_io import decode_to_wav, encode_upload, is_compressed_audio, pcm_to_wav_bytes
+
+
+def test_wav_upload_passes_through_untouched():
+    wav_bytes = pcm_to_wav_bytes(b"\x01\x00\x02\x00")
+
+    assert encode_upload(wav_bytes, "wav") is wav_bytes
+    assert decode_to_wav(wav_bytes) is wav_bytes
+
+
+def test_flac_upload_round_trips_to_wav():
+    pytest.importorskip("soundfile")
+    pcm = (np.sin(np.linspace(0, 200 * np.pi, 16000)) * 8000).astype(np.int16).tobytes()
+
+    encoded = encode_upload(pcm_to_wav_bytes(pcm), "flac")
+    decoded = decode_to_wav(encoded)
+
+    assert is_compressed_audio(encoded)
+    assert len(encoded) < len(pcm)
+    with wave.open(BytesIO(decoded), "rb") as wav_file:
+        assert wav_file.getframerate() == 16000
+        assert wav_file.readframes(wav_file.getnframes()) == pcm